@@ -0,0 +1,207 @@
+"""
+Analysis Module
+Pure pandas computations used by the dashboard pages (no Streamlit calls)
+"""
+
+import io
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import MENTAL_HEALTH_ATTRIBUTES
+
+
+# Mental health columns in master dataframe order
+MENTAL_COLS = list(MENTAL_HEALTH_ATTRIBUTES.keys())
+
+
+# ================================================================
+# REGRESSION (NAZWA)
+# ================================================================
+
+def build_regression_frame(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Fold master dataframe chunks into one row per respondent for regression
+
+    Each chunk is reduced to per-respondent partial aggregates before the
+    next one is read, so memory grows with the number of respondents
+    rather than respondents x platforms. Respondents whose rows span two
+    chunks are combined when the partials are merged.
+
+    Args:
+        chunks: Iterable of master dataframe chunks (or a single full frame in a list)
+
+    Returns:
+        DataFrame with id_responden, jam_penggunaan_total, mental health
+        columns, skor_mental_health and one hour column per platform
+    """
+    usage_parts = []
+    platform_parts = []
+    mental_parts = []
+
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        # Agregasi: Total jam penggunaan per responden
+        usage_parts.append(chunk.groupby('id_responden')['jam_per_hari'].sum())
+        # Pivot: Jam per platform (untuk multi-regression)
+        platform_parts.append(chunk.pivot_table(
+            index='id_responden',
+            columns='nama_platform',
+            values='jam_per_hari',
+            aggfunc='sum'
+        ))
+        # Mental health columns (ambil data unik per responden)
+        mental_parts.append(chunk[['id_responden'] + MENTAL_COLS].drop_duplicates(subset='id_responden'))
+
+    if not usage_parts:
+        return pd.DataFrame(columns=['id_responden', 'jam_penggunaan_total'] + MENTAL_COLS + ['skor_mental_health'])
+
+    df_usage_total = (
+        pd.concat(usage_parts)
+        .groupby(level=0).sum()
+        .rename('jam_penggunaan_total')
+        .reset_index()
+    )
+
+    df_platform = pd.concat(platform_parts).groupby(level=0).sum()
+    df_platform = df_platform[sorted(df_platform.columns)]
+    df_platform.columns.name = None
+    df_platform = df_platform.fillna(0).reset_index()
+
+    df_mental = pd.concat(mental_parts).drop_duplicates(subset='id_responden')
+
+    # Hitung skor mental health (rata-rata dari semua indikator)
+    df_mental['skor_mental_health'] = df_mental[MENTAL_COLS].astype('float64').mean(axis=1)
+
+    # Merge semua data
+    df_master = df_usage_total.merge(df_mental, on='id_responden')
+    df_master = df_master.merge(df_platform, on='id_responden')
+    return df_master
+
+
+def _strength(r2: float) -> str:
+    if r2 > 0.5:
+        return "Kuat"
+    if r2 > 0.25:
+        return "Sedang"
+    return "Lemah"
+
+
+def regression_summary(df_master: pd.DataFrame, platforms: Sequence[str]) -> Optional[Dict[str, object]]:
+    """
+    OLS of the mental health score on total hours, globally and per platform
+
+    Args:
+        df_master: Result of build_regression_frame()
+        platforms: Platform names whose hour columns are regressed separately
+
+    Returns:
+        Dictionary with 'plot' (non-NaN hours/score frame), 'global' (slope,
+        intercept, r, R2, p_value) and 'per_platform' (list of result rows),
+        or None if no row has both hours and a score
+    """
+    import statsmodels.api as sm
+
+    df_plot = df_master[['jam_penggunaan_total', 'skor_mental_health']].dropna()
+    if df_plot.empty:
+        return None
+
+    X = df_plot['jam_penggunaan_total'].values
+    Y = df_plot['skor_mental_health'].values
+    model = sm.OLS(Y, sm.add_constant(X)).fit()
+
+    per_platform: List[dict] = []
+    for platform in [col for col in df_master.columns if col in platforms]:
+        df_tmp = df_master[[platform, 'skor_mental_health']].dropna()
+        if df_tmp.empty or df_tmp[platform].sum() == 0:
+            continue  # Skip jika tidak ada data
+        try:
+            model_p = sm.OLS(df_tmp['skor_mental_health'].values,
+                             sm.add_constant(df_tmp[platform].values)).fit()
+        except Exception:
+            continue
+        per_platform.append({
+            "Platform": platform,
+            "Slope (β)": model_p.params[1],
+            "P-value": model_p.pvalues[1],
+            "R²": model_p.rsquared,
+            "Kekuatan": _strength(model_p.rsquared),
+            "Signifikansi": "Signifikan" if model_p.pvalues[1] < 0.05 else "Tidak Signifikan"
+        })
+
+    return {
+        'plot': df_plot,
+        'global': {
+            "slope": float(model.params[1]),
+            "intercept": float(model.params[0]),
+            "r": float(np.corrcoef(X, Y)[0, 1]),
+            "R2": float(model.rsquared),
+            "p_value": float(model.pvalues[1])
+        },
+        'per_platform': per_platform,
+    }
+
+
+# ================================================================
+# USAGE DASHBOARD (IKHSYAN)
+# ================================================================
+
+def usage_summary(df_usage: pd.DataFrame) -> Dict[str, object]:
+    """
+    Summary metrics and per-platform aggregates of the Usage Dashboard
+
+    Args:
+        df_usage: Usage data with the USAGE_COLUMN_LABELS column names
+
+    Returns:
+        Dictionary with total_jam, avg_jam, total_platform, total_users,
+        platform_usage (mean hours per platform, descending) and
+        platform_counts (usage rows per platform)
+    """
+    return {
+        'total_jam': df_usage['Jam per Hari'].sum(),
+        'avg_jam': df_usage['Jam per Hari'].mean(),
+        'total_platform': df_usage['Nama Platform'].nunique(),
+        'total_users': df_usage['ID Responden'].nunique(),
+        'platform_usage': df_usage.groupby('Nama Platform')['Jam per Hari'].mean().sort_values(ascending=False),
+        'platform_counts': df_usage['Nama Platform'].value_counts(),
+    }
+
+
+# ================================================================
+# DATA MENTAH (NABIL)
+# ================================================================
+
+def respondent_options(df: pd.DataFrame) -> Tuple[int, np.ndarray]:
+    """
+    Respondent count and the name choices of a (filtered) master dataframe
+
+    Args:
+        df: Master dataframe
+
+    Returns:
+        Tuple of (distinct id_responden, distinct names in row order)
+    """
+    names = df['nama'].unique() if 'nama' in df.columns else np.array([])
+    return df['id_responden'].nunique(), names
+
+
+def chunks_to_csv(chunks: Iterable[pd.DataFrame], encoding: str = 'utf-8') -> bytes:
+    """
+    Write DataFrame chunks to one CSV document, one chunk at a time
+
+    Args:
+        chunks: Iterable of DataFrames with identical columns
+        encoding: Output encoding
+
+    Returns:
+        CSV bytes (header written once)
+    """
+    buffer = io.StringIO()
+    header = True
+    for chunk in chunks:
+        chunk.to_csv(buffer, index=False, header=header)
+        header = False
+    return buffer.getvalue().encode(encoding)
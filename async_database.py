@@ -0,0 +1,580 @@
+"""
+Async Database Module
+asyncio counterpart of Database, so independent loader queries run concurrently
+
+Optional dependency: aiomysql (``pip install aiomysql``) for the MySQL
+server. Without it only the embedded backends can be used asynchronously.
+"""
+
+import asyncio
+import collections.abc
+import functools
+import inspect
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from mysql.connector import Error, errors
+
+try:
+    import aiomysql
+except ImportError:  # aiomysql opsional (pip install aiomysql); tanpa aiomysql hanya backend embedded yang bisa async
+    aiomysql = None
+
+from database import Database, QuerySpec
+from pool import AsyncConnectionPool, PooledConnection, PoolExhaustedError
+from query_stats import QueryStats
+from result_cache import ResultCache
+
+
+# Errors raised by either driver (mysql.connector for embedded backends, pymysql for aiomysql)
+DB_ERRORS = (Error,) if aiomysql is None else (Error, aiomysql.Error)
+
+# Shown when the async loaders are enabled but cannot reach the MySQL server
+INSTALL_HINT = "pip install aiomysql"
+
+# Database methods that never touch a connection stay synchronous on AsyncDatabase
+LOCAL_METHODS = ('get_pool_stats', 'get_cache_stats', 'clear_result_cache',
+                 'attach_local_engine', 'get_query_stats', 'get_slow_queries')
+
+
+def async_available(backend=None) -> bool:
+    """
+    Check whether AsyncDatabase can reach a database
+
+    Args:
+        backend: Embedded engine that would be used (None = MySQL server)
+
+    Returns:
+        bool: True if an embedded backend is given or aiomysql is installed
+    """
+    return backend is not None or aiomysql is not None
+
+
+def _errno(e: Exception) -> Optional[int]:
+    """MySQL error number of a mysql.connector or pymysql error"""
+    errno = getattr(e, 'errno', None)
+    if errno is None and e.args and isinstance(e.args[0], int):
+        errno = e.args[0]
+    return errno
+
+
+def _mysql_error(e: Exception) -> Error:
+    """Map a pymysql error to the mysql.connector error Database already handles"""
+    if isinstance(e, Error):
+        return e
+    message = e.args[1] if len(e.args) > 1 else str(e)
+    cls = errors.IntegrityError if isinstance(e, aiomysql.IntegrityError) else errors.DatabaseError
+    return cls(msg=message, errno=_errno(e))
+
+
+class ThreadedCursor:
+    """Awaitable cursor over a blocking DB-API cursor (see ThreadedConnection)"""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    @property
+    def description(self):
+        return self.raw.description
+
+    async def execute(self, operation: str, params: tuple = None):
+        await asyncio.to_thread(self.raw.execute, operation, params)
+
+    async def executemany(self, operation: str, seq_params):
+        await asyncio.to_thread(self.raw.executemany, operation, seq_params)
+
+    async def fetchone(self):
+        return await asyncio.to_thread(self.raw.fetchone)
+
+    async def fetchmany(self, size: int = 1) -> list:
+        return await asyncio.to_thread(self.raw.fetchmany, size)
+
+    async def fetchall(self) -> list:
+        return await asyncio.to_thread(self.raw.fetchall)
+
+    async def close(self):
+        self.raw.close()
+
+
+class ThreadedConnection:
+    """
+    Awaitable connection over a blocking connection of an embedded backend
+
+    Every call runs in the event loop's default executor, so the loop stays
+    free while the engine works. The pool hands a connection to one task
+    at a time, so its calls never overlap.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    async def cursor(self, buffered: bool = True) -> ThreadedCursor:
+        return ThreadedCursor(await asyncio.to_thread(self.raw.cursor, buffered=buffered))
+
+    async def ping(self, reconnect: bool = False):
+        if not await asyncio.to_thread(self.raw.is_connected):
+            raise Error("Embedded connection is closed")
+
+    async def commit(self):
+        await asyncio.to_thread(self.raw.commit)
+
+    async def rollback(self):
+        await asyncio.to_thread(self.raw.rollback)
+
+    def close(self):
+        self.raw.close()
+
+
+class LoopCursor:
+    """
+    Blocking mysql.connector-style cursor over an async cursor
+
+    Each call is submitted to the event loop that owns the connection and
+    waited for, so Database code can drive the async driver unchanged.
+    """
+
+    def __init__(self, connection: 'LoopConnection', raw):
+        self.connection = connection
+        self.raw = raw
+
+    @property
+    def description(self):
+        return self.raw.description
+
+    @property
+    def column_names(self) -> tuple:
+        return tuple(column[0] for column in self.raw.description or ())
+
+    @property
+    def with_rows(self) -> bool:
+        return self.raw.description is not None
+
+    def execute(self, operation: str, params: tuple = None):
+        self.connection.call(self.raw.execute, operation, params)
+
+    def executemany(self, operation: str, seq_params):
+        self.connection.call(self.raw.executemany, operation, seq_params)
+
+    def fetchone(self):
+        return self.connection.call(self.raw.fetchone)
+
+    def fetchmany(self, size: int = 1) -> list:
+        return list(self.connection.call(self.raw.fetchmany, size))
+
+    def fetchall(self) -> list:
+        return list(self.connection.call(self.raw.fetchall))
+
+    def close(self):
+        self.connection.call(self.raw.close)
+
+
+class LoopConnection:
+    """Blocking mysql.connector-style connection over an async one (see LoopCursor)"""
+
+    def __init__(self, raw, loop: asyncio.AbstractEventLoop):
+        self.raw = raw
+        self.loop = loop
+
+    def call(self, method, *args, **kwargs):
+        """
+        Await a driver method on the connection's loop and wait for its result
+
+        The method is called on the loop thread too: aiomysql binds the
+        futures it returns to the loop. Driver errors become
+        mysql.connector errors.
+        """
+        async def run():
+            return await method(*args, **kwargs)
+        try:
+            return asyncio.run_coroutine_threadsafe(run(), self.loop).result()
+        except DB_ERRORS as e:
+            raise _mysql_error(e) from e
+
+    def cursor(self, buffered: bool = True) -> LoopCursor:
+        if isinstance(self.raw, ThreadedConnection):
+            raw = self.call(self.raw.cursor, buffered=buffered)
+        else:
+            # SSCursor = unbuffered: baris ditarik dari server per fetchmany()
+            raw = self.call(self.raw.cursor, aiomysql.Cursor if buffered else aiomysql.SSCursor)
+        return LoopCursor(self, raw)
+
+    def is_connected(self) -> bool:
+        try:
+            self.call(self.raw.ping, reconnect=False)
+        except Error:
+            return False
+        return True
+
+    def commit(self):
+        self.call(self.raw.commit)
+
+    def rollback(self):
+        self.call(self.raw.rollback)
+
+
+class LoopDatabase(Database):
+    """
+    Database whose connections come from an AsyncConnectionPool
+
+    Every Database method works unchanged: it runs on a worker thread of
+    AsyncDatabase and each driver call is submitted to the event loop.
+    Batches are the exception: their statements are gathered on the loop,
+    each on its own pooled connection, so a loader waits for its slowest
+    query instead of the sum of all of them.
+    """
+
+    def __init__(self, query_stats: Optional[QueryStats] = None,
+                 result_cache: Optional[ResultCache] = None, **kwargs):
+        """
+        Initialize database connection parameters
+
+        Args:
+            query_stats: Recorder to share; a new one if None
+            result_cache: Result cache to share; None = no cache
+            **kwargs: Database arguments
+        """
+        # Driver async hanya memakai text protocol: tanpa cache prepared statement
+        super().__init__(statement_cache_size=0, batch_mode='parallel', **kwargs)
+        if query_stats is not None:
+            self.query_stats = query_stats
+        self.result_cache = result_cache
+        # Event loop yang memiliki pool (diisi AsyncDatabase saat dipakai)
+        self.loop = None
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _create_async_connection(self):
+        """Open a new raw async connection (used as the pool factory)"""
+        if self.backend is not None:
+            return ThreadedConnection(await asyncio.to_thread(self.backend.connect))
+        if aiomysql is None:
+            raise Error(f"aiomysql is not installed ({INSTALL_HINT})")
+        return await aiomysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            db=self.database,
+            charset='utf8mb4',
+            # Sama dengan Database: dashboard hanya membaca, autocommit
+            # mencegah snapshot REPEATABLE READ yang lama
+            autocommit=True
+        )
+
+    @staticmethod
+    async def _validate(conn) -> bool:
+        await conn.ping(reconnect=False)
+        return True
+
+    def connect(self) -> bool:
+        """
+        Create the async connection pool and verify that a connection can be opened
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        if self.pool is None:
+            self.pool = AsyncConnectionPool(
+                self._create_async_connection,
+                pool_size=self.pool_size,
+                checkout_timeout=self.checkout_timeout,
+                max_idle_time=self.max_idle_time,
+                max_lifetime=self.max_lifetime,
+                validate=self._validate
+            )
+        try:
+            with self._checked_out():
+                return True
+        except DB_ERRORS + (PoolExhaustedError,) as e:
+            print(f"Error connecting to MySQL: {e}")
+            return False
+
+    def disconnect(self):
+        """Close all pooled connections and stop the run_parallel() workers"""
+        if self.pool is not None:
+            self._call(self.pool.close())
+            self.pool = None
+        super().disconnect()
+
+    @contextmanager
+    def _checked_out(self):
+        conn = self._call(self.pool.checkout())
+        try:
+            yield conn
+        except BaseException:
+            self._call(self.pool.checkin(conn, discard=True))
+            raise
+        else:
+            self._call(self.pool.checkin(conn))
+
+    @contextmanager
+    def _pooled_connection(self):
+        """
+        Check a connection out of the async pool for the duration of a block
+
+        Yields:
+            pool.PooledConnection wrapping a LoopConnection (no statement cache)
+        """
+        if self.pool is None:
+            self.connect()
+        if self.pool is None:
+            raise PoolExhaustedError("Connection pool is not available")
+        try:
+            with self._checked_out() as conn:
+                yield PooledConnection(LoopConnection(conn.raw, self.loop))
+        except DB_ERRORS as e:
+            # Mis. koneksi baru gagal dibuka oleh aiomysql
+            raise _mysql_error(e) from e
+
+    async def _fetch(self, query: str, params: tuple, name: str) -> Tuple[List[str], list]:
+        """Run one statement on its own pooled connection and fetch every row (on the loop)"""
+        async with self.pool.connection() as conn:
+            cursor = await (conn.cursor() if isinstance(conn, ThreadedConnection) else conn.cursor(aiomysql.Cursor))
+            try:
+                with self.query_stats.timer(name, query, params) as timer:
+                    await cursor.execute(query, params)
+                    timer.executed()
+                    columns = [column[0] for column in cursor.description or ()]
+                    rows = list(await cursor.fetchall())
+                    timer.fetched(rows)
+            finally:
+                await cursor.close()
+        return columns, rows
+
+    def _run_parallel_queries(self, queries: Dict[str, QuerySpec],
+                              name: str) -> Tuple[Dict[str, Optional[pd.DataFrame]], Dict[str, str]]:
+        """Run every statement concurrently on the loop instead of on worker threads"""
+        if self.pool is None:
+            self.connect()
+        if self.pool is None:
+            return {key: None for key in queries}, {key: "Connection pool is not available" for key in queries}
+        names = list(queries)
+        fetches = []
+        for key in names:
+            spec = queries[key]
+            query, params = spec if isinstance(spec, tuple) else (spec, None)
+            fetches.append(self._fetch(query.strip().rstrip(';'), params,
+                                       f"{name}.{key}" if name else key))
+
+        async def gather_all():
+            return await asyncio.gather(*fetches, return_exceptions=True)
+
+        results, failures = {}, {}
+        for key, outcome in zip(names, self._call(gather_all())):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, DB_ERRORS + (PoolExhaustedError,)):
+                    raise outcome
+                results[key], failures[key] = None, str(outcome)
+            else:
+                columns, rows = outcome
+                results[key] = self._apply_dtypes(
+                    pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+                )
+        return results, failures
+
+
+class AsyncRunner:
+    """
+    Event loop on a daemon thread, for calling AsyncDatabase from synchronous code
+
+    asyncio pools are bound to one event loop, while Streamlit runs every
+    script run on its own thread without one. All coroutines are therefore
+    submitted to this loop and the calling thread waits for the result.
+    """
+
+    def __init__(self, name: str = 'async-database'):
+        """
+        Start the event loop thread
+
+        Args:
+            name: Thread name
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """
+        Run a coroutine on the loop and wait for its result
+
+        Args:
+            coro: Coroutine object
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            The coroutine's result (its exception is re-raised here)
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def gather(self, *coros, timeout: Optional[float] = None) -> list:
+        """
+        Run several coroutines concurrently and wait for all of them
+
+        Args:
+            *coros: Coroutine objects
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            List of results in argument order
+        """
+        async def gather_all():
+            return await asyncio.gather(*coros)
+        return self.run(gather_all(), timeout)
+
+    def close(self):
+        """Stop the loop and wait for its thread"""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()
+
+
+class AsyncDatabase:
+    """
+    asyncio counterpart of Database
+
+    Every public Database method has an awaitable twin with the same
+    arguments and results (iter_* methods are async generators; the pure
+    helpers and LOCAL_METHODS stay synchronous). The twins run the Database
+    method itself on a LoopDatabase, so the SQL and result handling exist
+    once. The difference is how a batch runs: Database.execute_batch()
+    sends one multi-statement round-trip over one connection, while here
+    every statement runs on its own pooled connection at the same time.
+    Independent calls can be combined the same way with asyncio.gather().
+
+    MySQL is reached through aiomysql (text protocol, so there is no
+    prepared statement cache); embedded backends (e.g.
+    sqlite_backend.SQLiteBackend) run their blocking calls in the event
+    loop's executor. Use an instance from one event loop only (see
+    AsyncRunner).
+    """
+
+    def __init__(self, host: str = "localhost", user: str = "root",
+                 password: str = "", database: str = "uas_basdat",
+                 pool_size: int = 5, checkout_timeout: float = 10.0,
+                 max_idle_time: float = 300.0, max_lifetime: float = 3600.0,
+                 compact_dtypes: bool = True, backend=None,
+                 slow_query_threshold: float = 0.5, use_summary_tables: bool = True,
+                 query_stats: Optional[QueryStats] = None,
+                 result_cache: Optional[ResultCache] = None):
+        """
+        Initialize database connection parameters
+
+        Args:
+            host: MySQL server host
+            user: MySQL username
+            password: MySQL password
+            database: Database name
+            pool_size: Maximum number of pooled connections (also the
+                maximum number of statements and of calls running at once)
+            checkout_timeout: Seconds to wait for a free pooled connection
+            max_idle_time: Seconds an idle connection is kept before recycling
+            max_lifetime: Seconds after which a connection is always recycled
+            compact_dtypes: Convert results to schema-aware compact dtypes
+            backend: Embedded engine with a connect() method (e.g.
+                sqlite_backend.SQLiteBackend); None connects to the MySQL server
+            slow_query_threshold: Seconds from which a statement enters the slow-query log
+            use_summary_tables: Answer the dashboard aggregates from the
+                trigger-maintained ringkasan_* tables when they exist
+            query_stats: Recorder to share (e.g. the synchronous Database's,
+                so the diagnostics page shows both); a new one if None
+            result_cache: Result cache of execute_query() / execute_batch()
+                to share (e.g. Database.result_cache); None = no cache
+        """
+        self.db = LoopDatabase(
+            host=host, user=user, password=password, database=database,
+            pool_size=pool_size, checkout_timeout=checkout_timeout,
+            max_idle_time=max_idle_time, max_lifetime=max_lifetime,
+            compact_dtypes=compact_dtypes, backend=backend,
+            slow_query_threshold=slow_query_threshold, use_summary_tables=use_summary_tables,
+            query_stats=query_stats, result_cache=result_cache
+        )
+        # Thread tempat method Database berjalan (dibuat saat pertama dipakai)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        # Atribut data (query_stats, result_cache, pool, ...) dibaca dari LoopDatabase
+        if 'db' not in self.__dict__:
+            raise AttributeError(name)
+        value = getattr(self.__dict__['db'], name)
+        if callable(value):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return value
+
+    def _worker_pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.db.pool_size, thread_name_prefix='async-database'
+                )
+            return self._executor
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking LoopDatabase call on a worker thread (never on the loop itself)"""
+        loop = asyncio.get_running_loop()
+        if self.db.loop is None:
+            self.db.loop = loop
+        elif self.db.loop is not loop:
+            raise RuntimeError("AsyncDatabase is bound to another event loop")
+        return await loop.run_in_executor(self._worker_pool(), functools.partial(func, *args, **kwargs))
+
+    async def disconnect(self):
+        """Close all pooled connections and stop the worker threads"""
+        await self._run(self.db.disconnect)
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+_DONE = object()
+
+
+def _awaitable(name: str):
+    """AsyncDatabase twin of the Database method ``name`` (an async generator if it returns an Iterator)"""
+    method = getattr(Database, name)
+
+    if typing.get_origin(inspect.signature(method).return_annotation) is collections.abc.Iterator:
+        @functools.wraps(method)
+        async def stream(self, *args, **kwargs):
+            iterator = await self._run(getattr(self.db, name), *args, **kwargs)
+            try:
+                while True:
+                    chunk = await self._run(next, iterator, _DONE)
+                    if chunk is _DONE:
+                        break
+                    yield chunk
+            finally:
+                # Generator ditutup sebelum habis: koneksinya dikembalikan ke pool
+                await self._run(iterator.close)
+        return stream
+
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return await self._run(getattr(self.db, name), *args, **kwargs)
+    return call
+
+
+def _local(name: str):
+    method = getattr(Database, name)
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        return getattr(self.db, name)(*args, **kwargs)
+    return call
+
+
+for _name, _member in vars(Database).items():
+    if _name.startswith('_') or _name in vars(AsyncDatabase):
+        continue
+    if isinstance(_member, staticmethod):
+        setattr(AsyncDatabase, _name, _member)
+    elif _name in LOCAL_METHODS:
+        setattr(AsyncDatabase, _name, _local(_name))
+    elif inspect.isfunction(_member):
+        setattr(AsyncDatabase, _name, _awaitable(_name))
@@ -0,0 +1,389 @@
+"""
+Benchmark Module
+Latency, peak RSS and allocation benchmarks of the Database methods and page computations
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import psutil
+except ImportError:  # psutil opsional; tanpa psutil RSS dibaca dari /proc
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # resource tidak ada di Windows
+    resource = None
+
+from analysis import (build_regression_frame, chunks_to_csv, regression_summary,
+                      respondent_options, usage_summary)
+from config import BENCHMARK_CONFIG, DATA_CONFIG, EXPORT_CONFIG, PLATFORMS, USAGE_COLUMN_LABELS
+from database import Database
+from sqlite_backend import SQLiteBackend
+from synthetic import SCALES, write_sqlite
+
+
+PERCENTILES = (50, 90, 95, 99)
+
+RESULT_COLUMNS = (['name', 'group', 'repeat', 'min_ms', 'mean_ms']
+                  + [f'p{p}_ms' for p in PERCENTILES]
+                  + ['max_ms', 'rss_peak_mb', 'rss_delta_mb', 'alloc_peak_mb', 'alloc_blocks'])
+
+
+# ================================================================
+# DATASETS
+# ================================================================
+
+def dataset_path(scale: str, seed: int, directory: str = BENCHMARK_CONFIG['data_dir']) -> str:
+    """Path of the synthetic SQLite dataset of a scale and seed"""
+    return os.path.join(directory, f"survey_{scale}_{seed}.sqlite")
+
+
+def ensure_dataset(scale: str, seed: int, directory: str = BENCHMARK_CONFIG['data_dir']) -> str:
+    """
+    Generate the synthetic dataset unless it already exists
+
+    Args:
+        scale: Key of synthetic.SCALES
+        seed: Random seed
+        directory: Dataset directory
+
+    Returns:
+        Path of the SQLite file
+    """
+    path = dataset_path(scale, seed, directory)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        partial = path + '.partial'
+        write_sqlite(partial, SCALES[scale], seed)
+        os.replace(partial, path)
+    return path
+
+
+def open_database(path: str) -> Database:
+    """Database on a synthetic SQLite file, configured like the dashboard"""
+    return Database(backend=SQLiteBackend(path=path), pool_size=2,
+                    slow_query_threshold=float('inf'))
+
+
+# ================================================================
+# CASES
+# ================================================================
+
+def database_cases(db: Database) -> Dict[str, Callable[[], object]]:
+    """Database methods timed end to end (query, fetch and DataFrame build)"""
+    return {
+        'get_master_dataframe': db.get_master_dataframe,
+        'get_summary_statistics': db.get_summary_statistics,
+        'get_gender_comparison_data': db.get_gender_comparison_data,
+        'get_status_comparison_data': db.get_status_comparison_data,
+        'view_all_respondents': db.view_all_respondents,
+        'view_usage_with_details': db.view_usage_with_details,
+    }
+
+
+def page_cases(db: Database) -> Dict[str, Callable[[], object]]:
+    """
+    Pure pandas work of the dashboard pages, on data fetched beforehand
+
+    Rendering is left out: the pages get these results from analysis.py
+    and only hand them to Streamlit/Plotly.
+    """
+    chunksize = DATA_CONFIG['chunksize']
+    master = db.get_master_dataframe()
+    usage = db.get_all_usage_data()
+    master_chunks = [master.iloc[start:start + chunksize] for start in range(0, len(master), chunksize)]
+
+    def page_regression():
+        return regression_summary(build_regression_frame(master_chunks), PLATFORMS)
+
+    def page_usage_dashboard():
+        return usage_summary(usage.rename(columns=USAGE_COLUMN_LABELS))
+
+    def page_data_mentah():
+        jumlah, names = respondent_options(master)
+        selected = master[master['nama'] == names[0]].iloc[0] if len(names) else None
+        return jumlah, selected, chunks_to_csv(master_chunks, EXPORT_CONFIG['csv_encoding'])
+
+    return {
+        'page_regression': page_regression,
+        'page_usage_dashboard': page_usage_dashboard,
+        'page_data_mentah': page_data_mentah,
+    }
+
+
+# ================================================================
+# MEASUREMENT
+# ================================================================
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None if unavailable)"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        # Peak rather than current RSS (KiB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    return None
+
+
+class _RSSSampler(threading.Thread):
+    """Background thread keeping the highest RSS seen while a case runs"""
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            rss = current_rss()
+            if rss is not None and (self.peak is None or rss > self.peak):
+                self.peak = rss
+
+    def stop(self) -> Optional[int]:
+        self._stop_event.set()
+        self.join()
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+        return self.peak
+
+
+def measure(func: Callable[[], object], repeat: int = BENCHMARK_CONFIG['repeat'],
+            warmup: int = BENCHMARK_CONFIG['warmup'],
+            rss_interval: float = BENCHMARK_CONFIG['rss_interval']) -> Dict[str, float]:
+    """
+    Time a callable and record its memory use
+
+    Latencies come from the untraced runs. One extra run under tracemalloc
+    gives the peak Python/NumPy allocation and the number of memory blocks
+    the call allocated that were still alive when it returned.
+
+    Args:
+        func: Callable without arguments
+        repeat: Timed runs
+        warmup: Untimed runs first (connections, statement cache, imports)
+        rss_interval: Seconds between RSS samples
+
+    Returns:
+        Dictionary with the RESULT_COLUMNS other than name/group
+    """
+    for _ in range(warmup):
+        func()
+    gc.collect()
+
+    baseline = current_rss()
+    sampler = _RSSSampler(rss_interval)
+    sampler.start()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    peak = sampler.stop()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        after = tracemalloc.take_snapshot()
+        _, alloc_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    blocks = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, 'lineno'))
+
+    times = np.array(times)
+    record = {'repeat': repeat, 'min_ms': times.min(), 'mean_ms': times.mean()}
+    record.update({f'p{p}_ms': np.percentile(times, p) for p in PERCENTILES})
+    record.update({
+        'max_ms': times.max(),
+        'rss_peak_mb': peak / 2**20 if peak is not None else None,
+        'rss_delta_mb': (peak - baseline) / 2**20 if peak is not None and baseline is not None else None,
+        'alloc_peak_mb': alloc_peak / 2**20,
+        'alloc_blocks': blocks,
+    })
+    return {key: (float(value) if isinstance(value, np.floating) else value)
+            for key, value in record.items()}
+
+
+# ================================================================
+# RUNS
+# ================================================================
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(scale: str = BENCHMARK_CONFIG['scale'], seed: int = BENCHMARK_CONFIG['seed'],
+                   repeat: int = BENCHMARK_CONFIG['repeat'], warmup: int = BENCHMARK_CONFIG['warmup'],
+                   cases: Optional[Sequence[str]] = None) -> Dict[str, object]:
+    """
+    Run the benchmark cases on a synthetic dataset
+
+    Args:
+        scale: Key of synthetic.SCALES (the dataset is generated on first use)
+        seed: Dataset seed
+        repeat: Timed runs per case
+        warmup: Untimed runs per case
+        cases: Case names to run (None = all)
+
+    Returns:
+        Dictionary with 'meta' (run settings and environment) and
+        'results' (one measure() record per case)
+    """
+    path = ensure_dataset(scale, seed)
+    db = open_database(path)
+    try:
+        counts = {table: db.get_table_count(table) for table in ('responden', 'penggunaan', 'kesehatan_mental')}
+        groups = {'database': database_cases(db), 'page': page_cases(db)}
+        results = []
+        for group, group_cases in groups.items():
+            for name, func in group_cases.items():
+                if cases is not None and name not in cases:
+                    continue
+                record = {'name': name, 'group': group}
+                record.update(measure(func, repeat, warmup))
+                results.append(record)
+    finally:
+        db.disconnect()
+        db.backend.close()
+
+    meta = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'scale': scale,
+        'seed': seed,
+        'rows': counts,
+        'repeat': repeat,
+        'warmup': warmup,
+        'backend': 'sqlite',
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+    }
+    return {'meta': meta, 'results': results}
+
+
+def save_results(run: Dict[str, object], directory: str = BENCHMARK_CONFIG['results_dir']) -> str:
+    """
+    Store a run as JSON
+
+    Args:
+        run: Result of run_benchmarks()
+        directory: Results directory
+
+    Returns:
+        Path of the file (<timestamp>_<scale>[_<commit>].json)
+    """
+    os.makedirs(directory, exist_ok=True)
+    meta = run['meta']
+    stamp = meta['timestamp'].replace(':', '').replace('-', '')
+    name = '_'.join(part for part in (stamp, meta['scale'], meta['commit']) if part)
+    path = os.path.join(directory, f"{name}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(run, f, indent=2)
+    return path
+
+
+def load_results(path: str) -> Dict[str, object]:
+    """Load a run stored by save_results()"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def results_frame(run: Dict[str, object]) -> pd.DataFrame:
+    """The results of a run as a DataFrame in RESULT_COLUMNS order"""
+    return pd.DataFrame.from_records(run['results'], columns=RESULT_COLUMNS)
+
+
+def compare_runs(baseline: Dict[str, object], current: Dict[str, object],
+                 threshold: float = BENCHMARK_CONFIG['regression_threshold']) -> pd.DataFrame:
+    """
+    Compare two runs case by case
+
+    Args:
+        baseline: Earlier run
+        current: Later run
+        threshold: p50 ratio above which a case counts as slower (and
+            below 1/threshold as faster)
+
+    Returns:
+        DataFrame with name, p50/p95 of both runs, p50 ratio, peak
+        allocation of both runs and status ('slower', 'faster', 'same';
+        'new'/'removed' for cases missing from one run)
+    """
+    columns = ['name', 'p50_ms', 'p95_ms', 'alloc_peak_mb']
+    report = results_frame(baseline)[columns].merge(
+        results_frame(current)[columns], on='name', how='outer', suffixes=('_baseline', '_current'))
+    report['ratio'] = report['p50_ms_current'] / report['p50_ms_baseline']
+
+    def status(row):
+        if pd.isna(row['p50_ms_baseline']):
+            return 'new'
+        if pd.isna(row['p50_ms_current']):
+            return 'removed'
+        if row['ratio'] > threshold:
+            return 'slower'
+        if row['ratio'] < 1 / threshold:
+            return 'faster'
+        return 'same'
+
+    report['status'] = report.apply(status, axis=1)
+    return report[['name', 'p50_ms_baseline', 'p50_ms_current', 'ratio', 'p95_ms_baseline',
+                   'p95_ms_current', 'alloc_peak_mb_baseline', 'alloc_peak_mb_current', 'status']]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark Database methods and page computations")
+    parser.add_argument('--scale', default=BENCHMARK_CONFIG['scale'], choices=sorted(SCALES))
+    parser.add_argument('--seed', type=int, default=BENCHMARK_CONFIG['seed'])
+    parser.add_argument('--repeat', type=int, default=BENCHMARK_CONFIG['repeat'])
+    parser.add_argument('--warmup', type=int, default=BENCHMARK_CONFIG['warmup'])
+    parser.add_argument('--case', action='append', dest='cases', help="Run only this case (repeatable)")
+    parser.add_argument('--baseline', help="Saved run to compare the new run against")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help="Compare two saved runs without running anything")
+    args = parser.parse_args(argv)
+
+    with pd.option_context('display.width', 200, 'display.max_columns', None,
+                           'display.float_format', '{:.2f}'.format):
+        if args.compare:
+            print(compare_runs(load_results(args.compare[0]), load_results(args.compare[1])))
+            return
+        run = run_benchmarks(args.scale, args.seed, args.repeat, args.warmup, args.cases)
+        print(results_frame(run))
+        print(f"Saved to {save_results(run)}")
+        if args.baseline:
+            print(compare_runs(load_results(args.baseline), run))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,25 @@ DB_CONFIG = {
     'host': 'localhost',
     'user': 'root',
     'password': '',
-    'database': 'uas_basdat'
+    'database': 'uas_basdat',
+    'backend': 'mysql'  # 'sqlite' = engine embedded yang dimuat dari dump (tanpa server MySQL)
+}
+
+# Embedded backend configuration (dipakai jika DB_CONFIG['backend'] == 'sqlite')
+EMBEDDED_CONFIG = {
+    'dump_path': None,  # None = uas_basdat.sql bawaan; bisa diganti dump sintetis (python synthetic.py out.sql --scale 10k)
+    'path': None  # None = database di memori; isi path file .sqlite (juga hasil synthetic.py --format sqlite)
+}
+
+# Connection pool configuration
+POOL_CONFIG = {
+    'pool_size': 5,              # Maksimum koneksi terbuka sekaligus
+    'checkout_timeout': 10,      # Detik menunggu koneksi kosong sebelum gagal
+    'max_idle_time': 300,        # Koneksi idle lebih lama dari ini di-recycle
+    'max_lifetime': 3600,        # Koneksi selalu di-recycle setelah umur ini
+    'statement_cache_size': 32,  # Prepared statement per koneksi (LRU); 0 = nonaktif
+    'batch_mode': 'parallel',    # 'parallel' = query dalam satu batch jalan bersamaan (tiap query 1 koneksi); 'round_trip' = satu multi-statement
+    'parallel_workers': 4        # Thread untuk query/loader paralel (yang melebihi pool_size menunggu koneksi)
 }
 
 # Column definitions for DataFrame display
@@ -13,6 +31,18 @@ COLUMN_DEFINITIONS = {
     'mental_health': ["id_kesehatan", "id_responden", "gangguan_fokus", "gelisah", "kecemasan", "kesulitan_konsentrasi", "perbandingan_diri", "sentimen_posting", "mencari_validasi", "depresi", "fluktuasi_minat", "sulit_tidur"]
 }
 
+# Label kolom tabel penggunaan (halaman Usage Dashboard)
+USAGE_COLUMN_LABELS = {
+    'id_penggunaan': 'ID Penggunaan',
+    'id_responden': 'ID Responden',
+    'nama': 'Nama Responden',
+    'id_platform': 'ID Platform',
+    'nama_platform': 'Nama Platform',
+    'jam_per_hari': 'Jam per Hari',
+    'tujuan_penggunaan': 'Tujuan Penggunaan',
+    'frekuensi_buka_per_hari': 'Frekuensi Buka'
+}
+
 # Page Configuration
 PAGE_CONFIG = {
     'page_title': 'Mental Health Survey Dashboard',
@@ -149,7 +179,62 @@ DATA_CONFIG = {
     'percentage_format': '{:.2f}%',
     'hour_format': '{:.1f} jam',
     'frequency_format': '{:.0f}x',
-    'cache_ttl': 300  # Cache time-to-live in seconds (5 minutes)
+    'cache_ttl': 300,  # Fallback cache time-to-live in seconds when the version probe fails
+    'version_probe_interval': 2,  # Seconds between table-version probes (change detection)
+    'cache_max_entries': 2,  # Cached results kept per loader; old versions are never read again, so keep this small
+    'chunksize': 10000,  # Rows per chunk when streaming large query results
+    'search_min_length': 3,  # Cari nama sependek ini (atau lebih pendek) langsung dengan LIKE, tanpa index
+    'search_max_ids': 1000,  # Hasil index lebih banyak dari ini dikirim sebagai LIKE, bukan IN (id, ...)
+    'page_size': 12,  # Kartu responden per halaman (keyset pagination)
+    'table_page_sizes': [25, 50, 100],  # Pilihan baris per halaman untuk tabel ter-paginasi
+    'fetch_mode': 'arrow',  # Loader besar (usage, master): 'arrow' = hasil per batch ke Arrow, kolom Arrow-backed (butuh pyarrow); 'pandas' = NumPy
+    'incremental_refresh': True,  # Hanya ambil baris baru (di atas high-water mark) saat tabel bertambah
+    'local_aggregates': True,  # Query agregat demografi dijalankan DuckDB di atas master dataframe yang di-cache
+    'parallel_prefetch': True,  # Data semua halaman yang dicentang dimuat paralel sebelum halaman dirender
+    'async_loaders': True  # Query independen dalam satu loader dijalankan bersamaan (async_database.py, butuh aiomysql untuk MySQL: pip install aiomysql)
+}
+
+# Snapshot Configuration (cache kolumnar bersama antar proses server, lihat snapshot.py)
+SNAPSHOT_CONFIG = {
+    'enabled': True,
+    'backend': 'file',  # 'file' = direktori lokal (mis. /dev/shm untuk shared memory); 'redis' = server Redis bersama antar replika (butuh redis)
+    'directory': '.snapshots',
+    'format': 'feather',  # 'feather' (di-memory-map) atau 'parquet'
+    'redis_url': 'redis://localhost:6379/0',
+    'redis_prefix': 'uas_basdat:snapshot',
+    'redis_ttl': 86400,  # Detik snapshot disimpan di Redis (None = sampai diganti)
+    'lock_timeout': 30  # Detik menunggu replika lain yang sedang memuat dataset yang sama
+}
+
+# Result Cache Configuration (cache hasil query di dalam Database, lihat result_cache.py)
+RESULT_CACHE_CONFIG = {
+    'max_bytes': 256 * 1024 * 1024,  # Batas total memori hasil yang di-cache (LRU); 0 = nonaktif
+    'ttl': 60  # Detik sebuah hasil boleh dipakai ulang (juga dikosongkan saat versi tabel berubah)
+}
+
+# Diagnostics Configuration (statistik query, lihat query_stats.py)
+DIAGNOSTICS_CONFIG = {
+    'slow_query_threshold': 0.5  # Detik; query selambat ini masuk slow-query log
+}
+
+# Bulk Ingest Configuration (impor gelombang survei, lihat ingest.py)
+INGEST_CONFIG = {
+    'batch_size': 5000,  # Responden per transaksi (beserta baris penggunaan & kesehatan mentalnya)
+    'method': 'executemany',  # 'load_data' = LOAD DATA LOCAL INFILE (butuh local_infile di server)
+    'defer_checks': True,  # Matikan cek FK/unique selama load (referensi sudah divalidasi)
+    'create_platforms': False  # Default: platform yang belum dikenal ditolak
+}
+
+# Benchmark Configuration (latensi, RSS dan alokasi, lihat benchmark.py)
+BENCHMARK_CONFIG = {
+    'data_dir': '.benchmarks/data',  # Dataset sintetis SQLite per skala/seed (dibuat sekali)
+    'results_dir': '.benchmarks/results',  # Hasil tiap run (JSON) untuk dibandingkan
+    'scale': '10k',  # '10k', '1m', '10m' (lihat synthetic.SCALES)
+    'seed': 42,
+    'repeat': 10,  # Run yang diukur per kasus
+    'warmup': 1,  # Run pemanasan (tidak diukur)
+    'rss_interval': 0.005,  # Detik antar sampel RSS selama kasus berjalan
+    'regression_threshold': 1.10  # p50 baru / p50 baseline di atas ini = lebih lambat
 }
 
 # Export Configuration
@@ -190,7 +275,8 @@ PAGES = {
     'mental_health': '🧠 Mental Health Dashboard',
     'demographic': '👥 Demographic Effects',
     'regression': '📈 Regression & Correlation',
-    'conclusion': '💡 Conclusion & Insight'
+    'conclusion': '💡 Conclusion & Insight',
+    'diagnostics': '🩺 Diagnostics'
 }
 
 # Statistical Analysis Configuration
@@ -6,14 +6,388 @@ Handles MySQL database connection for Mental Health Survey Dashboard
 import mysql.connector
 from mysql.connector import Error
 import pandas as pd
-from typing import Optional, List, Tuple
+import functools
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, List, Sequence, Tuple, Union
+
+from pool import ConnectionPool, PoolExhaustedError
+from query_stats import QueryStats, estimate_bytes, plan_warnings
+from result_cache import ResultCache
+from schema import (apply_dtypes, load_dtype_map, load_arrow_type_map,
+                    rows_to_record_batch, concat_record_batches, arrow_to_pandas, pa)
+
+
+# Default number of rows per chunk for streaming queries
+DEFAULT_CHUNKSIZE = 10000
+
+# Compact dtypes derived from the CREATE TABLE statements in uas_basdat.sql
+SCHEMA_DTYPES = load_dtype_map()
+
+# Arrow types for the same columns (empty if pyarrow is not installed)
+ARROW_TYPES = load_arrow_type_map()
+
+# Result fetch modes: 'pandas' (NumPy-backed frames) or 'arrow' (Arrow-backed frames)
+FETCH_MODES = ('pandas', 'arrow')
+
+# Bulk insert methods: batched multi-row INSERT, or LOAD DATA LOCAL INFILE
+BULK_METHODS = ('executemany', 'load_data')
+
+# execute_batch() modes: one multi-statement round-trip on one connection, or
+# every statement on its own pooled connection from a thread pool
+BATCH_MODES = ('round_trip', 'parallel')
+
+# Table names accepted by the metadata helpers (interpolated into SQL)
+_TABLE_NAME_RE = re.compile(r'^\w+$')
+
+# SQL string, or (SQL string, params) for parameterized statements
+QuerySpec = Union[str, Tuple[str, tuple]]
+
+# AUTO_INCREMENT primary key per table, used as the append high-water mark
+TABLE_KEYS = {
+    'responden': 'id_responden',
+    'penggunaan_per_platform': 'id_penggunaan',
+    'kesehatan_mental': 'id_kesehatan',
+    'master_platform': 'id_platform',
+}
+
+# Exclusive-lower / inclusive-upper primary key range: (after, upto)
+KeyRange = Tuple[int, int]
+
+# Tables browsable with get_table_page(). Only the listed columns can be
+# projected, and only NOT NULL numeric columns with an index (whose InnoDB
+# entries end in the primary key) can be sort keys, so every page is an
+# index range scan. ENUM columns are left out: MySQL orders them by their
+# ordinal but compares them as strings, which would break the keyset.
+PAGED_TABLES = {
+    'responden': {
+        'from': "responden r",
+        'count_from': "responden",
+        'key': "r.id_responden",
+        'columns': {
+            'id_responden': "r.id_responden",
+            'nama': "r.nama",
+            'usia': "r.usia",
+            'jenis_kelamin': "r.jenis_kelamin",
+            'status_hubungan': "r.status_hubungan",
+            'pekerjaan': "r.pekerjaan",
+            'menggunakan_medsos': "r.menggunakan_medsos",
+        },
+        'sort_keys': {
+            'id_responden': "r.id_responden",
+            'usia': "r.usia",
+        },
+    },
+    'penggunaan': {
+        'from': """penggunaan_per_platform pp
+            JOIN responden r ON pp.id_responden = r.id_responden
+            JOIN master_platform mp ON pp.id_platform = mp.id_platform""",
+        'count_from': "penggunaan_per_platform",
+        'key': "pp.id_penggunaan",
+        'columns': {
+            'id_penggunaan': "pp.id_penggunaan",
+            'id_responden': "pp.id_responden",
+            'nama': "r.nama",
+            'id_platform': "pp.id_platform",
+            'nama_platform': "mp.nama_platform",
+            'jam_per_hari': "pp.jam_per_hari",
+            'tujuan_penggunaan': "pp.tujuan_penggunaan",
+            'frekuensi_buka_per_hari': "pp.frekuensi_buka_per_hari",
+        },
+        'sort_keys': {
+            'id_penggunaan': "pp.id_penggunaan",
+            'id_responden': "pp.id_responden",
+            'id_platform': "pp.id_platform",
+            'jam_per_hari': "pp.jam_per_hari",
+        },
+    },
+    'kesehatan_mental': {
+        'from': "kesehatan_mental km",
+        'count_from': "kesehatan_mental",
+        'key': "km.id_kesehatan",
+        'columns': {
+            column: f"km.{column}" for column in (
+                'id_kesehatan', 'id_responden', 'gangguan_fokus', 'gelisah', 'kecemasan',
+                'kesulitan_konsentrasi', 'perbandingan_diri', 'sentimen_posting',
+                'mencari_validasi', 'depresi', 'fluktuasi_minat', 'sulit_tidur')
+        },
+        'sort_keys': {
+            'id_kesehatan': "km.id_kesehatan",
+            'depresi': "km.depresi",
+            'kecemasan': "km.kecemasan",
+            'sulit_tidur': "km.sulit_tidur",
+        },
+    },
+}
+
+# Keyset position of a page: (sort value, primary key) of its last row
+PageCursor = Tuple[object, int]
+
+# Fixed SQL of the parameterless read methods, shared with AsyncDatabase
+RESPONDENT_COUNT_QUERY = "SELECT COUNT(*) AS total FROM responden"
+
+RESPONDENT_NAMES_QUERY = "SELECT id_responden, nama FROM responden ORDER BY id_responden"
+
+VIEW_ALL_RESPONDENTS_QUERY = 'SELECT * FROM responden ORDER BY nama ASC'
+
+ALL_PLATFORMS_QUERY = """
+        SELECT id_platform, nama_platform
+        FROM master_platform
+        ORDER BY nama_platform
+        """
+
+VIEW_USAGE_WITH_DETAILS_QUERY = '''
+                SELECT 
+                    pp.id_penggunaan,
+                    pp.id_responden,
+                    r.nama AS nama_responden,
+                    r.usia,
+                    r.jenis_kelamin,
+                    pp.id_platform,
+                    mp.nama_platform,
+                    pp.jam_per_hari,
+                    pp.tujuan_penggunaan,
+                    pp.frekuensi_buka_per_hari
+                FROM 
+                    penggunaan_per_platform pp
+                JOIN 
+                    responden r ON pp.id_responden = r.id_responden
+                JOIN 
+                    master_platform mp ON pp.id_platform = mp.id_platform
+                ORDER BY 
+                    r.nama ASC, mp.nama_platform ASC
+            '''
+
+ALL_MENTAL_HEALTH_QUERY = """
+        SELECT 
+            km.id_kesehatan,
+            km.id_responden,
+            r.nama,
+            km.gangguan_fokus,
+            km.gelisah,
+            km.kecemasan,
+            km.kesulitan_konsentrasi,
+            km.perbandingan_diri,
+            km.sentimen_posting,
+            km.mencari_validasi,
+            km.depresi,
+            km.fluktuasi_minat,
+            km.sulit_tidur
+        FROM kesehatan_mental km
+        JOIN responden r ON km.id_responden = r.id_responden
+        ORDER BY km.id_responden
+        """
+
+# Trigger-maintained summary tables (see uas_basdat.sql): running counts and
+# sums per gender/status, per gender/platform/purpose, and of the usage x
+# mental join per gender
+SUMMARY_TABLES = ('ringkasan_responden', 'ringkasan_penggunaan', 'ringkasan_penggunaan_mental')
+
+# Mental health attributes summed per gender/status in ringkasan_responden
+MENTAL_ATTRIBUTES = (
+    'gangguan_fokus', 'gelisah', 'kecemasan', 'kesulitan_konsentrasi', 'perbandingan_diri',
+    'sentimen_posting', 'mencari_validasi', 'depresi', 'fluktuasi_minat', 'sulit_tidur',
+)
+
+# Catalog probe of summary_tables_available() (params: SUMMARY_TABLES)
+SUMMARY_TABLES_QUERY = f"""
+            SELECT COUNT(*) AS jumlah
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({", ".join(["%s"] * len(SUMMARY_TABLES))})
+            """
+
+# Statements of rebuild_summary_tables() (same as the rebuild_ringkasan()
+# procedure in the dump). Every gender/status and gender row is kept, even
+# when empty, because the triggers only UPDATE those rows.
+SUMMARY_REBUILD_STATEMENTS = [
+    "DELETE FROM ringkasan_responden",
+    f"""
+    INSERT INTO ringkasan_responden (jenis_kelamin, status_hubungan, jumlah_responden, jumlah_mental,
+        {", ".join(f"sum_{attribute}" for attribute in MENTAL_ATTRIBUTES)})
+    SELECT r.jenis_kelamin, r.status_hubungan, COUNT(*), COUNT(km.id_kesehatan),
+        {", ".join(f"COALESCE(SUM(km.{attribute}), 0)" for attribute in MENTAL_ATTRIBUTES)}
+    FROM responden r
+    LEFT JOIN kesehatan_mental km ON km.id_responden = r.id_responden
+    GROUP BY r.jenis_kelamin, r.status_hubungan
+    """,
+    """
+    INSERT IGNORE INTO ringkasan_responden (jenis_kelamin, status_hubungan) VALUES
+        ('Laki-laki', 'Belum Kawin'), ('Laki-laki', 'Kawin'), ('Laki-laki', 'Cerai Hidup'),
+        ('Laki-laki', 'Cerai Mati'), ('Perempuan', 'Belum Kawin'), ('Perempuan', 'Kawin'),
+        ('Perempuan', 'Cerai Hidup'), ('Perempuan', 'Cerai Mati')
+    """,
+    "DELETE FROM ringkasan_penggunaan",
+    """
+    INSERT INTO ringkasan_penggunaan (jenis_kelamin, id_platform, tujuan_penggunaan,
+        jumlah_penggunaan, sum_jam_per_hari, sum_frekuensi)
+    SELECT r.jenis_kelamin, p.id_platform, p.tujuan_penggunaan, COUNT(*),
+        SUM(p.jam_per_hari), SUM(p.frekuensi_buka_per_hari)
+    FROM penggunaan_per_platform p
+    JOIN responden r ON r.id_responden = p.id_responden
+    GROUP BY r.jenis_kelamin, p.id_platform, p.tujuan_penggunaan
+    """,
+    "DELETE FROM ringkasan_penggunaan_mental",
+    """
+    INSERT INTO ringkasan_penggunaan_mental (jenis_kelamin, jumlah_penggunaan, sum_jam_per_hari,
+        sum_depresi, sum_kecemasan)
+    SELECT r.jenis_kelamin, COUNT(*), SUM(p.jam_per_hari), SUM(km.depresi), SUM(km.kecemasan)
+    FROM penggunaan_per_platform p
+    JOIN responden r ON r.id_responden = p.id_responden
+    JOIN kesehatan_mental km ON km.id_responden = p.id_responden
+    GROUP BY r.jenis_kelamin
+    """,
+    """
+    INSERT IGNORE INTO ringkasan_penggunaan_mental (jenis_kelamin) VALUES
+        ('Laki-laki'), ('Perempuan')
+    """,
+]
+
+
+def _iter_result_sets(cursor, sql: str, params: tuple = None) -> Iterator[Tuple[list, list, float]]:
+    """
+    Run a multi-statement batch and yield (column_names, rows, fetch_seconds) per result set
+    
+    Supports both the mysql-connector < 9.2 API (``multi=True``) and the
+    newer ``nextset()`` API.
+    """
+    def fetch(result):
+        start = time.perf_counter()
+        rows = result.fetchall()
+        return list(result.column_names), rows, time.perf_counter() - start
+    
+    try:
+        results = cursor.execute(sql, params, multi=True)
+    except TypeError:
+        results = None
+    
+    if results is not None:
+        for result in results:
+            if result.with_rows:
+                yield fetch(result)
+        return
+    
+    cursor.execute(sql, params)
+    while True:
+        if cursor.with_rows:
+            yield fetch(cursor)
+        if not cursor.nextset():
+            break
+
+
+def _query_name(query: str) -> str:
+    """Fallback stats name for an unnamed query: its first 60 characters"""
+    text = ' '.join(query.split())
+    return text if len(text) <= 60 else text[:57] + '...'
+
+
+# Column references accepted by SQLFilter (optionally alias-qualified)
+_COLUMN_RE = re.compile(r'^(\w+\.)?\w+$')
+
+
+class SQLFilter:
+    """
+    Composable, parameterized WHERE clause
+    
+    Each method adds one condition (ANDed together) and returns the filter,
+    so conditions chain: ``SQLFilter().between('r.usia', 18, 25).isin(...)``.
+    A value of None adds nothing. Column names are code-supplied identifiers
+    and are validated; all values travel as parameters.
+    """
+    
+    def __init__(self):
+        """Initialize an empty filter (matches every row)"""
+        self.conditions: List[str] = []
+        self.params: List[object] = []
+    
+    @staticmethod
+    def _column(column: str) -> str:
+        if not _COLUMN_RE.match(column):
+            raise ValueError(f"Invalid column name: {column!r}")
+        return column
+    
+    def between(self, column: str, value_range: Optional[Tuple[object, object]]) -> 'SQLFilter':
+        """
+        Keep rows with low <= column <= high
+        
+        Args:
+            column: Column reference
+            value_range: Inclusive (low, high), or None for no condition
+        """
+        if value_range is not None:
+            self.conditions.append(f"{self._column(column)} BETWEEN %s AND %s")
+            self.params.extend(value_range)
+        return self
+    
+    def isin(self, column: str, values: Optional[Sequence[object]]) -> 'SQLFilter':
+        """
+        Keep rows whose column is one of the values (an empty list keeps none)
+        
+        Args:
+            column: Column reference
+            values: Allowed values, or None for no condition
+        """
+        if values is None:
+            return self
+        values = list(values)
+        if not values:
+            self.conditions.append("1 = 0")
+        else:
+            placeholders = ", ".join(["%s"] * len(values))
+            self.conditions.append(f"{self._column(column)} IN ({placeholders})")
+            self.params.extend(values)
+        return self
+    
+    def contains(self, column: str, text: Optional[str]) -> 'SQLFilter':
+        """
+        Keep rows whose column contains the text (case-insensitive collation)
+        
+        Args:
+            column: Column reference
+            text: Substring to search for; None or '' for no condition
+        """
+        if text:
+            # '!' sebagai escape: sama di MySQL dan SQLite (tanpa masalah backslash)
+            escaped = text.replace('!', '!!').replace('%', '!%').replace('_', '!_')
+            self.conditions.append(f"{self._column(column)} LIKE %s ESCAPE '!'")
+            self.params.append(f"%{escaped}%")
+        return self
+    
+    def clause(self, keyword: str = "WHERE") -> Tuple[str, tuple]:
+        """
+        Render the filter
+        
+        Args:
+            keyword: Leading keyword ('WHERE', or 'AND' to extend an existing WHERE)
+        
+        Returns:
+            Tuple of (SQL fragment, params); ('', ()) if there is no condition
+        """
+        if not self.conditions:
+            return "", ()
+        return f"{keyword} " + " AND ".join(self.conditions), tuple(self.params)
+    
+    def __bool__(self) -> bool:
+        return bool(self.conditions)
 
 
 class Database:
     """Database connection and query handler"""
     
     def __init__(self, host: str = "localhost", user: str = "root", 
-                 password: str = "", database: str = "uas_basdat"):
+                 password: str = "", database: str = "uas_basdat",
+                 pool_size: int = 5, checkout_timeout: float = 10.0,
+                 max_idle_time: float = 300.0, max_lifetime: float = 3600.0,
+                 compact_dtypes: bool = True, backend=None,
+                 slow_query_threshold: float = 0.5, statement_cache_size: int = 32,
+                 use_summary_tables: bool = True, allow_local_infile: bool = False,
+                 batch_mode: str = 'round_trip', parallel_workers: int = 4,
+                 result_cache_bytes: int = 0, result_cache_ttl: float = 60.0):
         """
         Initialize database connection parameters
         
@@ -22,135 +396,1335 @@ class Database:
             user: MySQL username
             password: MySQL password
             database: Database name
+            pool_size: Maximum number of pooled connections
+            checkout_timeout: Seconds to wait for a free pooled connection
+            max_idle_time: Seconds an idle connection is kept before recycling
+            max_lifetime: Seconds after which a connection is always recycled
+            compact_dtypes: Convert results to schema-aware compact dtypes
+            backend: Embedded engine with a connect() method (e.g.
+                sqlite_backend.SQLiteBackend); None connects to the MySQL server
+            slow_query_threshold: Seconds from which a statement enters the slow-query log
+            statement_cache_size: Server-side prepared statements kept per pooled
+                connection for parameterized queries (0 = always use the text protocol)
+            use_summary_tables: Answer the dashboard aggregates from the
+                trigger-maintained ringkasan_* tables when they exist
+            allow_local_infile: Let bulk_insert(method='load_data') send
+                client files with LOAD DATA LOCAL INFILE (off by default: the
+                server may then request any readable file)
+            batch_mode: How execute_batch() runs its statements (see BATCH_MODES)
+            parallel_workers: Threads of run_parallel() / execute_parallel();
+                statements beyond pool_size wait for a free connection
+            result_cache_bytes: Memory budget of the in-process result cache
+                of execute_query() / execute_batch() (0 = no cache)
+            result_cache_ttl: Seconds a cached result stays valid
         """
+        if batch_mode not in BATCH_MODES:
+            raise ValueError(f"batch_mode must be one of {BATCH_MODES}, got {batch_mode!r}")
         self.host = host
         self.user = user
         self.password = password
         self.database = database
-        self.connection = None
-        self.cursor = None
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.statement_cache_size = statement_cache_size
+        self.use_summary_tables = use_summary_tables
+        self.allow_local_infile = allow_local_infile
+        self.batch_mode = batch_mode
+        self.parallel_workers = parallel_workers
+        self.dtype_map = SCHEMA_DTYPES if compact_dtypes else {}
+        self.backend = backend
+        self.pool = None
+        # Engine in-process (lihat attach_local_engine) untuk query agregat
+        self.local_engine = None
+        # Waktu, jumlah baris dan byte per query bernama (lihat get_query_stats)
+        self.query_stats = QueryStats(slow_threshold=slow_query_threshold)
+        # Cache hasil query (LRU dibatasi byte), dikosongkan saat data berubah
+        self.result_cache = (ResultCache(result_cache_bytes, result_cache_ttl)
+                             if result_cache_bytes > 0 else None)
+        # None = belum dicek, True/False = tabel versi_data ada/tidak
+        self._version_table_available = None
+        # None = belum dicek, True/False = kolom versi_data.versi_mutasi ada/tidak
+        self._mutation_counter_available = None
+        # None = belum dicek, True/False = tabel ringkasan ada/tidak
+        self._summary_tables_available = None
+        # Thread pool run_parallel() (dibuat saat pertama dipakai)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._worker = threading.local()
+    
+    def _create_connection(self):
+        """Open a new raw connection (used as the pool factory)"""
+        if self.backend is not None:
+            return self.backend.connect()
+        return mysql.connector.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            # Pakai C extension (CMySQLConnection) jika terpasang; tanpa
+            # C extension, use_pure=False justru melempar ImportError
+            use_pure=not mysql.connector.HAVE_CEXT,
+            # Dashboard hanya membaca data; autocommit mencegah koneksi pool
+            # tertahan di snapshot REPEATABLE READ yang lama
+            autocommit=True,
+            allow_local_infile=self.allow_local_infile
+        )
     
     def connect(self) -> bool:
         """
-        Establish connection to MySQL database
+        Create the connection pool and verify that a connection can be opened
         
         Returns:
             bool: True if connection successful, False otherwise
         """
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
-            if self.connection.is_connected():
-                self.cursor = self.connection.cursor()
+            if self.pool is None:
+                self.pool = ConnectionPool(
+                    self._create_connection,
+                    pool_size=self.pool_size,
+                    checkout_timeout=self.checkout_timeout,
+                    max_idle_time=self.max_idle_time,
+                    max_lifetime=self.max_lifetime,
+                    validate=lambda conn: conn.is_connected(),
+                    statement_cache_size=self.statement_cache_size
+                )
+            with self.pool.connection():
                 return True
-        except Error as e:
+        except (Error, PoolExhaustedError) as e:
             print(f"Error connecting to MySQL: {e}")
             return False
     
     def disconnect(self):
-        """Close database connection"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+        """Close all pooled connections and stop the parallel workers"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+    
+    @contextmanager
+    def _pooled_connection(self):
+        """
+        Check a connection out of the pool for the duration of a block
+        
+        Yields:
+            pool.PooledConnection (raw connection plus its statement cache),
+            returned to the pool afterwards
+        """
+        if self.pool is None:
+            self.connect()
+        if self.pool is None:
+            raise PoolExhaustedError("Connection pool is not available")
+        with self.pool.pooled_connection() as conn:
+            yield conn
+    
+    @contextmanager
+    def _connection(self):
+        """
+        Check a connection out of the pool for the duration of a block
+        
+        Yields:
+            Raw MySQL connection, returned to the pool afterwards
+        """
+        with self._pooled_connection() as conn:
+            yield conn.raw
     
-    def execute_query(self, query: str, params: tuple = None) -> Optional[pd.DataFrame]:
+    def get_pool_stats(self) -> dict:
+        """
+        Get connection pool metrics (wait time, in-use count, etc.)
+        
+        Returns:
+            Dictionary with pool metrics, empty if the pool is not created yet
+        """
+        return self.pool.stats() if self.pool is not None else {}
+    
+    def get_cache_stats(self) -> dict:
+        """
+        Get result cache metrics (entries, bytes, hits, misses, evictions, etc.)
+        
+        Returns:
+            Dictionary with cache metrics, empty if the result cache is off
+        """
+        return self.result_cache.stats() if self.result_cache is not None else {}
+    
+    def clear_result_cache(self):
+        """Drop every cached result (e.g. after writing through another connection)"""
+        if self.result_cache is not None:
+            self.result_cache.clear()
+    
+    @staticmethod
+    def _cache_lookup(cache: Optional[ResultCache],
+                      queries: Dict[str, QuerySpec]) -> Tuple[Dict[str, pd.DataFrame], Dict[str, QuerySpec]]:
+        """Split named queries into (cached results, queries still to run)"""
+        if cache is None:
+            return {}, queries
+        hits, missing = {}, {}
+        for key, spec in queries.items():
+            query, params = spec if isinstance(spec, tuple) else (spec, None)
+            df = cache.get(ResultCache.key(query, params, 'pandas'))
+            if df is not None:
+                hits[key] = df
+            else:
+                missing[key] = spec
+        return hits, missing
+    
+    @staticmethod
+    def _cache_store(cache: Optional[ResultCache], queries: Dict[str, QuerySpec],
+                     results: Dict[str, Optional[pd.DataFrame]], generation: Optional[int]):
+        """Cache the successful results of named queries (see ResultCache.put for generation)"""
+        if cache is None:
+            return
+        for key, spec in queries.items():
+            if results.get(key) is not None:
+                query, params = spec if isinstance(spec, tuple) else (spec, None)
+                cache.put(ResultCache.key(query, params, 'pandas'), results[key], generation=generation)
+    
+    def attach_local_engine(self, engine):
+        """
+        Route aggregate-only queries to an in-process engine when it is fresh
+        
+        Args:
+            engine: local_engine.LocalEngine (or None to detach)
+        """
+        self.local_engine = engine
+    
+    def _apply_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert a result frame to the schema-aware compact dtypes (see schema.py)"""
+        return apply_dtypes(df, self.dtype_map) if self.dtype_map else df
+    
+    def execute_query(self, query: str, params: tuple = None,
+                      fetch_mode: str = 'pandas', name: str = None,
+                      cache: bool = True) -> Optional[pd.DataFrame]:
         """
         Execute SELECT query and return results as pandas DataFrame
         
         Args:
             query: SQL query string
             params: Query parameters for prepared statements
+            fetch_mode: 'pandas' for NumPy-backed compact dtypes, or 'arrow' to
+                build the result as an Arrow table and convert at the edge
+                (Arrow-backed dtypes; falls back to 'pandas' without pyarrow)
+            name: Name the statement is recorded under in the query stats
+            cache: Use the result cache; False for whole-table loads that
+                are already held by st.cache_resource and the snapshot store
             
         Returns:
             DataFrame with query results or None if error
         """
-        try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"fetch_mode must be one of {FETCH_MODES}, got {fetch_mode!r}")
+        cache_key = None
+        if cache and self.result_cache is not None:
+            generation = self.result_cache.generation
+            cache_key = ResultCache.key(query, params, fetch_mode)
+            df = self.result_cache.get(cache_key)
+            if df is not None:
+                return df
+        
+        if fetch_mode == 'arrow' and pa is not None:
+            table = self.execute_query_arrow(query, params, name=name)
+            df = arrow_to_pandas(table) if table is not None else None
+        else:
+            try:
+                df = self._query_frame(query, params, name or _query_name(query))
+            except (Error, PoolExhaustedError) as e:
+                print(f"Error executing query: {e}")
+                return None
+        if df is not None and cache_key is not None:
+            self.result_cache.put(cache_key, df, generation=generation)
+        return df
+    
+    def _query_frame(self, query: str, params: tuple, name: str) -> pd.DataFrame:
+        """Run one SELECT on a pooled connection into a DataFrame (errors propagate)"""
+        with self._pooled_connection() as conn:
+            # Query berparameter memakai prepared statement yang di-cache per koneksi
+            prepared = params is not None and conn.statements is not None
+            cursor = conn.statements.cursor(query) if prepared else conn.raw.cursor()
+            try:
+                with self.query_stats.timer(name, query, params) as timer:
+                    cursor.execute(query, params)
+                    timer.executed()
+                    columns = list(cursor.column_names)
+                    rows = cursor.fetchall()
+                    timer.fetched(rows)
+            finally:
+                # Cursor prepared tetap terbuka di cache; jika gagal, koneksi
+                # (beserta cache-nya) dibuang oleh pool
+                if not prepared:
+                    cursor.close()
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        return self._apply_dtypes(df)
+    
+    def execute_query_arrow(self, query: str, params: tuple = None,
+                            batch_size: int = DEFAULT_CHUNKSIZE, name: str = None):
+        """
+        Execute SELECT query and return results as a pyarrow Table
+        
+        Rows are pulled ``batch_size`` at a time from an unbuffered cursor
+        and built column-by-column into Arrow record batches with
+        schema-aware compact types. The driver still decodes each batch
+        into Python tuples (mysql-connector has no columnar result API), so
+        the saving is in what is kept: only ``batch_size`` rows of Python
+        objects are alive at a time, and the result holds no object columns.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters for prepared statements
+            batch_size: Rows per Arrow record batch
+            name: Name the statement is recorded under in the query stats
             
-            df = pd.read_sql(query, self.connection, params=params)
-            return df
-        except Error as e:
+        Returns:
+            pyarrow.Table with query results or None if error / pyarrow missing
+        """
+        if pa is None:
+            print("Error executing query: pyarrow is not installed")
+            return None
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor(buffered=False)
+                try:
+                    with self.query_stats.timer(name or _query_name(query), query, params) as timer:
+                        cursor.execute(query, params)
+                        timer.executed()
+                        columns = list(cursor.column_names)
+                        batches = []
+                        while True:
+                            rows = cursor.fetchmany(batch_size)
+                            if not rows:
+                                break
+                            timer.fetched(rows)
+                            batches.append(rows_to_record_batch(columns, rows, ARROW_TYPES))
+                finally:
+                    cursor.close()
+            return concat_record_batches(batches, columns)
+        except (Error, PoolExhaustedError) as e:
             print(f"Error executing query: {e}")
             return None
     
-    def test_connection(self) -> Tuple[bool, str]:
+    def execute_query_iter(self, query: str, params: tuple = None,
+                           chunksize: int = DEFAULT_CHUNKSIZE, name: str = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a SELECT query as DataFrame chunks
+        
+        Uses an unbuffered cursor, so rows are pulled from the server
+        ``chunksize`` at a time instead of materializing the whole result.
+        The pooled connection stays checked out until the iterator is
+        exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters for prepared statements
+            chunksize: Number of rows per yielded DataFrame
+            name: Name the statement is recorded under in the query stats
+            
+        Yields:
+            DataFrame chunks with query results
+            
+        Raises:
+            mysql.connector.Error: if the query fails mid-stream
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor(buffered=False)
+            try:
+                # Waktu fetch termasuk waktu konsumen memproses tiap chunk
+                with self.query_stats.timer(name or _query_name(query), query, params) as timer:
+                    cursor.execute(query, params)
+                    timer.executed()
+                    columns = list(cursor.column_names)
+                    while True:
+                        rows = cursor.fetchmany(chunksize)
+                        if not rows:
+                            break
+                        timer.fetched(rows)
+                        yield self._apply_dtypes(
+                            pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+                        )
+            finally:
+                try:
+                    cursor.close()
+                except Error:
+                    # Iterator ditutup sebelum habis; koneksi dibuang oleh pool
+                    pass
+    
+    def execute_batch(self, queries: Dict[str, QuerySpec],
+                      name: str = None) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Execute several named SELECT queries in a single round-trip
+        
+        All statements are sent as one multi-statement batch on one pooled
+        connection, and each result set is mapped back to its name. With
+        ``batch_mode='parallel'`` they run through execute_parallel()
+        instead, each on its own connection, except when called from a
+        run_parallel() worker: nested calls would run one after another
+        there, so the single round-trip is faster. With the result cache
+        on, only the statements without a cached result are sent.
+        
+        Args:
+            queries: Mapping of name -> SQL string or (SQL string, params)
+            name: Prefix of the ``<name>.<key>`` entries in the query stats
+            
+        Returns:
+            Dictionary of name -> DataFrame (every value is None if the batch fails)
+        """
+        generation = self.result_cache.generation if self.result_cache is not None else None
+        hits, missing = self._cache_lookup(self.result_cache, queries)
+        if not missing:
+            return hits
+        results = self._run_batch(missing, name)
+        if any(df is None for df in results.values()):
+            return {key: None for key in queries}
+        self._cache_store(self.result_cache, missing, results, generation)
+        return {key: hits[key] if key in hits else results[key] for key in queries}
+    
+    def _run_batch(self, queries: Dict[str, QuerySpec], name: str) -> Dict[str, Optional[pd.DataFrame]]:
+        """execute_batch() without the result cache"""
+        if self.batch_mode == 'parallel' and not getattr(self._worker, 'active', False):
+            results, errors = self._run_parallel_queries(queries, name)
+            if errors:
+                print(f"Error executing batch: {next(iter(errors.values()))}")
+                return {key: None for key in queries}
+            return results
+        
+        names = list(queries)
+        stat_names = [f"{name}.{key}" if name else key for key in names]
+        statements = []
+        statement_params = []
+        batch_params = []
+        for key in names:
+            spec = queries[key]
+            query, params = spec if isinstance(spec, tuple) else (spec, None)
+            statements.append(query.strip().rstrip(';'))
+            statement_params.append(params)
+            batch_params.extend(params or ())
+        
+        frames = []
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    start = time.perf_counter()
+                    for columns, rows, fetch_time in _iter_result_sets(
+                        cursor, ";\n".join(statements), tuple(batch_params) or None
+                    ):
+                        elapsed = time.perf_counter() - start
+                        i = len(frames)
+                        if i < len(names):
+                            self.query_stats.record(
+                                stat_names[i], statements[i], statement_params[i],
+                                server_time=elapsed - fetch_time, fetch_time=fetch_time,
+                                rows=len(rows), nbytes=estimate_bytes(rows)
+                            )
+                        frames.append(self._apply_dtypes(
+                            pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+                        ))
+                        start = time.perf_counter()
+                finally:
+                    cursor.close()
+        except (Error, PoolExhaustedError) as e:
+            print(f"Error executing batch: {e}")
+            if names:
+                failed = min(len(frames), len(names) - 1)
+                self.query_stats.record(stat_names[failed], statements[failed],
+                                        statement_params[failed], error=str(e))
+            return {key: None for key in names}
+        
+        if len(frames) != len(names):
+            print(f"Error executing batch: expected {len(names)} result sets, got {len(frames)}")
+            return {key: None for key in names}
+        return dict(zip(names, frames))
+    
+    def _parallel_executor(self) -> ThreadPoolExecutor:
+        """Thread pool of run_parallel(), created on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.parallel_workers, thread_name_prefix='db-parallel',
+                    initializer=self._mark_worker
+                )
+            return self._executor
+    
+    def _mark_worker(self):
+        self._worker.active = True
+    
+    def run_parallel(self, calls: Dict[str, Callable[[], object]]) -> Tuple[Dict[str, object], Dict[str, Exception]]:
+        """
+        Run independent I/O-bound calls (e.g. data loaders) on the worker threads
+        
+        A call made from inside a worker runs its nested calls one after
+        another in that worker, so nesting can never wait on itself.
+        
+        Args:
+            calls: Mapping of name -> callable without arguments
+            
+        Returns:
+            Tuple of (name -> return value, None if it raised; name -> exception
+            for the calls that raised)
+        """
+        results, errors = {}, {}
+        if getattr(self._worker, 'active', False) or len(calls) < 2:
+            for key, call in calls.items():
+                try:
+                    results[key] = call()
+                except Exception as e:
+                    results[key], errors[key] = None, e
+            return results, errors
+        
+        executor = self._parallel_executor()
+        futures = {key: executor.submit(call) for key, call in calls.items()}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key], errors[key] = None, e
+        return results, errors
+    
+    def execute_parallel(self, queries: Dict[str, QuerySpec],
+                         name: str = None) -> Tuple[Dict[str, Optional[pd.DataFrame]], Dict[str, str]]:
+        """
+        Execute several named SELECT queries concurrently on the worker threads
+        
+        Each statement runs on its own pooled connection, so the total time
+        is about that of the slowest statement rather than their sum. Unlike
+        execute_batch(), a failing statement does not void the others.
+        
+        Args:
+            queries: Mapping of name -> SQL string or (SQL string, params)
+            name: Prefix of the ``<name>.<key>`` entries in the query stats
+            
+        Returns:
+            Tuple of (name -> DataFrame, None for a failed query; name ->
+            error message for the failed queries)
+        """
+        generation = self.result_cache.generation if self.result_cache is not None else None
+        hits, missing = self._cache_lookup(self.result_cache, queries)
+        results, errors = self._run_parallel_queries(missing, name) if missing else ({}, {})
+        self._cache_store(self.result_cache, missing, results, generation)
+        return {key: hits[key] if key in hits else results[key] for key in queries}, errors
+    
+    def _run_parallel_queries(self, queries: Dict[str, QuerySpec],
+                              name: str) -> Tuple[Dict[str, Optional[pd.DataFrame]], Dict[str, str]]:
+        """execute_parallel() without the result cache"""
+        calls = {}
+        for key, spec in queries.items():
+            query, params = spec if isinstance(spec, tuple) else (spec, None)
+            stat_name = f"{name}.{key}" if name else key
+            calls[key] = functools.partial(self._query_frame, query.strip().rstrip(';'), params, stat_name)
+        results, exceptions = self.run_parallel(calls)
+        for e in exceptions.values():
+            if not isinstance(e, (Error, PoolExhaustedError)):
+                raise e
+        return results, {key: str(e) for key, e in exceptions.items()}
+    
+    def execute_aggregates(self, queries: Dict[str, QuerySpec],
+                           name: str = None) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Execute aggregate-only queries locally if possible, else as one batch
+        
+        When a local engine is attached and the frame it holds was loaded
+        at the current table versions, the queries run in-process and only
+        the version probe reaches the server. Otherwise (or if the local
+        engine fails) this is execute_batch().
+        
+        Args:
+            queries: Mapping of name -> SQL string or (SQL string, params)
+            name: Prefix of the query stats entries (local runs get a ``[local]`` suffix)
+            
+        Returns:
+            Dictionary of name -> DataFrame (every value is None if the batch fails)
+        """
+        engine = self.local_engine
+        if engine is not None and engine.available and engine.versions is not None:
+            versions = self.get_table_versions(engine.tables)
+            if engine.is_fresh(versions):
+                results = {}
+                for key, spec in queries.items():
+                    query, params = spec if isinstance(spec, tuple) else (spec, None)
+                    stat_name = f"{name}.{key} [local]" if name else f"{key} [local]"
+                    with self.query_stats.timer(stat_name, query, params) as timer:
+                        result = engine.execute_batch({key: spec})
+                        timer.executed()
+                    if result is None:
+                        break
+                    timer.rows = len(result[key])
+                    results[key] = self._apply_dtypes(result[key])
+                else:
+                    return results
+        return self.execute_batch(queries, name=name)
+    
+    # ================================================================
+    # DIAGNOSTICS
+    # ================================================================
+    
+    def get_query_stats(self) -> pd.DataFrame:
+        """
+        Get per-query timing, row and byte aggregates
+        
+        Returns:
+            DataFrame with one row per query name, slowest total first
+        """
+        return self.query_stats.summary()
+    
+    def get_slow_queries(self) -> List[dict]:
+        """
+        Get the rolling slow-query log
+        
+        Returns:
+            List of slow statement records, most recent first
+        """
+        return self.query_stats.slow_queries()
+    
+    def explain(self, query: str, params: tuple = None, analyze: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Get the execution plan of a query
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            analyze: Actually run the query and report real row counts/timings
+                (EXPLAIN ANALYZE on MySQL, ANALYZE on MariaDB)
+            
+        Returns:
+            DataFrame with the plan rows, or None if error
+        """
+        query = query.strip().rstrip(';')
+        prefixes = ["EXPLAIN ANALYZE ", "ANALYZE "] if analyze else ["EXPLAIN "]
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    for i, prefix in enumerate(prefixes):
+                        try:
+                            cursor.execute(prefix + query, params)
+                            break
+                        except Error as e:
+                            # 1064 = syntax error: MariaDB tidak mengenal EXPLAIN ANALYZE
+                            if getattr(e, 'errno', None) != 1064 or i == len(prefixes) - 1:
+                                raise
+                    columns = list(cursor.column_names)
+                    rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+        except (Error, PoolExhaustedError) as e:
+            print(f"Error explaining query: {e}")
+            return None
+        return pd.DataFrame.from_records(rows, columns=columns)
+    
+    def explain_named(self, name: str, analyze: bool = False) -> Tuple[Optional[pd.DataFrame], List[str]]:
+        """
+        Explain the last statement recorded under a query stats name
+        
+        Args:
+            name: Name from get_query_stats()
+            analyze: See explain()
+            
+        Returns:
+            Tuple of (plan DataFrame or None, warnings about full table
+            scans, filesorts and temporary tables)
+        """
+        last = self.query_stats.last_query(name)
+        if last is None:
+            return None, []
+        plan = self.explain(last[0], last[1], analyze=analyze)
+        return plan, plan_warnings(plan)
+
+    @staticmethod
+    def _indexes_query(database: str) -> Tuple[str, tuple]:
+        """SQL and params behind get_indexes()"""
+        return """
+        SELECT
+            TABLE_NAME AS table_name,
+            INDEX_NAME AS index_name,
+            NON_UNIQUE AS non_unique,
+            COLUMN_NAME AS column_name
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """, (database,)
+
+    @staticmethod
+    def _indexes_result(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """One row per index with its columns collected into a list"""
+        if df is None:
+            return None
+        return (df.groupby(['table_name', 'index_name', 'non_unique'], sort=False)['column_name']
+                .agg(list).reset_index(name='columns'))
+
+    def get_indexes(self) -> Optional[pd.DataFrame]:
+        """
+        Get the indexes of all tables in the database
+
+        Returns:
+            DataFrame with table_name, index_name, non_unique and columns (list
+            of column names in index order), or None if error
+        """
+        query, params = self._indexes_query(self.database)
+        return self._indexes_result(self.execute_query(query, params, name='get_indexes'))
+
+    def _execute_ddl(self, statement: str, name: str) -> bool:
+        """Run one schema change statement, returning False on error"""
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    with self.query_stats.timer(name, statement):
+                        cursor.execute(statement)
+                finally:
+                    cursor.close()
+        except (Error, PoolExhaustedError) as e:
+            print(f"Error executing {name}: {e}")
+            return False
+        self.clear_result_cache()
+        return True
+
+    @staticmethod
+    def _create_index_statement(table: str, name: str, columns: Sequence[str]) -> str:
+        """CREATE INDEX statement behind create_index() (identifiers validated)"""
+        if not all(_TABLE_NAME_RE.match(identifier) for identifier in (table, name, *columns)):
+            raise ValueError(f"Invalid identifier in index {name!r} on {table!r} {list(columns)}")
+        column_list = ", ".join(f"`{column}`" for column in columns)
+        return f"CREATE INDEX `{name}` ON `{table}` ({column_list})"
+
+    @staticmethod
+    def _drop_index_statement(table: str, name: str) -> str:
+        """DROP INDEX statement behind drop_index() (identifiers validated)"""
+        if not (_TABLE_NAME_RE.match(table) and _TABLE_NAME_RE.match(name)):
+            raise ValueError(f"Invalid identifier in index {name!r} on {table!r}")
+        return f"DROP INDEX `{name}` ON `{table}`"
+
+    def create_index(self, table: str, name: str, columns: Sequence[str]) -> bool:
+        """
+        Add a secondary index
+
+        Args:
+            table: Table name
+            name: Index name
+            columns: Indexed columns, in order
+
+        Returns:
+            bool: True if created
+        """
+        return self._execute_ddl(self._create_index_statement(table, name, columns), 'create_index')
+
+    def drop_index(self, table: str, name: str) -> bool:
+        """
+        Drop a secondary index
+
+        Args:
+            table: Table name
+            name: Index name
+
+        Returns:
+            bool: True if dropped
+        """
+        return self._execute_ddl(self._drop_index_statement(table, name), 'drop_index')
+
+    def test_connection(self) -> Tuple[bool, str]:
+        """
+        Test database connection and return status
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            if self.connect():
+                with self._connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT DATABASE()")
+                    db_name = cursor.fetchone()[0]
+                    cursor.close()
+                return True, f"Connected to database: {db_name}"
+            else:
+                return False, "Failed to connect to database"
+        except (Error, PoolExhaustedError) as e:
+            return False, f"Connection error: {str(e)}"
+    
+    @staticmethod
+    def _table_info_query(database: str) -> Tuple[str, tuple]:
+        """SQL and params behind get_table_info()"""
+        return """
+        SELECT 
+            TABLE_NAME as table_name,
+            TABLE_ROWS as row_count
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME
+        """, (database,)
+    
+    def get_table_info(self) -> Optional[pd.DataFrame]:
+        """
+        Get information about all tables in database
+        
+        Returns:
+            DataFrame with table names and row counts
+        """
+        query, params = self._table_info_query(self.database)
+        return self.execute_query(query, params, name='get_table_info')
+    
+    @staticmethod
+    def _version_tables(tables) -> List[str]:
+        """Sorted, de-duplicated table names (validated as identifiers)"""
+        tables = sorted(set(tables))
+        if not all(_TABLE_NAME_RE.match(table) for table in tables):
+            raise ValueError(f"Invalid table name in {tables}")
+        return tables
+    
+    @staticmethod
+    def _table_versions_query(tables: List[str]) -> Tuple[str, tuple]:
+        """SQL and params reading versi_data for get_table_versions()"""
+        placeholders = ", ".join(["%s"] * len(tables))
+        return f"""
+        SELECT v.nama_tabel, v.versi, t.CREATE_TIME
+        FROM versi_data v
+        JOIN information_schema.TABLES t
+            ON t.TABLE_SCHEMA = DATABASE() AND t.TABLE_NAME = v.nama_tabel
+        WHERE v.nama_tabel IN ({placeholders})
+        """, tuple(tables)
+    
+    @staticmethod
+    def _table_versions_result(rows) -> Dict[str, str]:
+        """Version tokens from (nama_tabel, versi, CREATE_TIME) rows"""
+        return {table: f"v{versi}@{created}" for table, versi, created in rows}
+    
+    @staticmethod
+    def _checksum_query(tables: List[str]) -> str:
+        """CHECKSUM TABLE fallback for tables missing from versi_data"""
+        return "CHECKSUM TABLE " + ", ".join(f"`{t}`" for t in tables)
+    
+    @staticmethod
+    def _checksum_result(rows) -> Optional[Dict[str, str]]:
+        """Version tokens from CHECKSUM TABLE rows, None if any checksum is unknown"""
+        versions = {}
+        for qualified_name, checksum in rows:
+            if checksum is None:
+                return None
+            versions[qualified_name.split('.')[-1]] = f"c{checksum}"
+        return versions
+    
+    @staticmethod
+    def _fingerprint(versions: Optional[Dict[str, str]]) -> Optional[str]:
+        """Short hex digest of a get_table_versions() result"""
+        if versions is None:
+            return None
+        return hashlib.sha1(repr(sorted(versions.items())).encode('utf-8')).hexdigest()[:16]
+    
+    def get_table_versions(self, tables) -> Optional[Dict[str, str]]:
+        """
+        Lightweight change probe for a set of tables (one round-trip)
+        
+        Reads the trigger-maintained ``versi_data`` table, combined with each
+        table's CREATE_TIME so a re-imported dump never reuses old version
+        numbers. If ``versi_data`` is missing, falls back to CHECKSUM TABLE,
+        which is exact but reads the whole tables.
+        
+        Args:
+            tables: Iterable of table names
+            
+        Returns:
+            Dictionary of table -> opaque version token, or None on error
+        """
+        tables = self._version_tables(tables)
+        
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    versions = {}
+                    if self._version_table_available is not False:
+                        try:
+                            query, params = self._table_versions_query(tables)
+                            with self.query_stats.timer('get_table_versions', query, params) as timer:
+                                cursor.execute(query, params)
+                                timer.executed()
+                                rows = cursor.fetchall()
+                                timer.fetched(rows)
+                            versions = self._table_versions_result(rows)
+                            self._version_table_available = True
+                        except Error as e:
+                            # 1146 = table doesn't exist (dump lama tanpa versi_data)
+                            if getattr(e, 'errno', None) != 1146:
+                                raise
+                            self._version_table_available = False
+                    
+                    missing = [table for table in tables if table not in versions]
+                    if missing:
+                        query = self._checksum_query(missing)
+                        with self.query_stats.timer('get_table_versions.checksum', query) as timer:
+                            cursor.execute(query)
+                            timer.executed()
+                            rows = cursor.fetchall()
+                            timer.fetched(rows)
+                        checksums = self._checksum_result(rows)
+                        if checksums is None:
+                            return None
+                        versions.update(checksums)
+                finally:
+                    cursor.close()
+        except (Error, PoolExhaustedError) as e:
+            print(f"Error probing table versions: {e}")
+            return None
+        if self.result_cache is not None:
+            # Versi berubah = data berubah: hasil lama tidak boleh dipakai lagi
+            self.result_cache.observe({('versi', table): version for table, version in versions.items()})
+        return versions
+    
+    def get_table_fingerprint(self, tables) -> Optional[str]:
+        """
+        Get a fingerprint that changes whenever any of the tables changes
+        
+        Args:
+            tables: Iterable of table names
+            
+        Returns:
+            Short hex fingerprint, or None if it could not be computed
+        """
+        return self._fingerprint(self.get_table_versions(tables))
+    
+    @staticmethod
+    def _watermark_tables(tables) -> List[str]:
+        """Sorted, de-duplicated table names that have a known primary key"""
+        tables = sorted(set(tables))
+        unknown = [table for table in tables if table not in TABLE_KEYS]
+        if unknown:
+            raise ValueError(f"No primary key known for {unknown}")
+        return tables
+    
+    @staticmethod
+    def _watermarks_query(tables: List[str], since: Optional[Dict[str, int]],
+                          with_counter: bool) -> Tuple[str, tuple]:
+        """
+        SQL and params behind get_table_watermarks()
+        
+        Args:
+            tables: Result of _watermark_tables()
+            since: Previous max_id per table (missing tables count as 0)
+            with_counter: Read the insert/mutation counters from versi_data
+                instead of COUNT(*)
+        """
+        since = since or {}
+        parts = []
+        params = []
+        for table in tables:
+            key = TABLE_KEYS[table]
+            if with_counter:
+                counters = f"""
+                    (SELECT versi - versi_mutasi FROM versi_data WHERE nama_tabel = %s),
+                    (SELECT versi_mutasi FROM versi_data WHERE nama_tabel = %s)"""
+                counter_params = [table, table]
+            else:
+                counters = f"""
+                    (SELECT COUNT(*) FROM `{table}`),
+                    NULL"""
+                counter_params = []
+            parts.append(f"""
+                SELECT %s,
+                    (SELECT MAX(`{key}`) FROM `{table}`),
+                    (SELECT COUNT(*) FROM `{table}` WHERE `{key}` > %s),{counters}""")
+            params.extend([table, int(since.get(table, 0))] + counter_params)
+        return "\nUNION ALL".join(parts), tuple(params)
+    
+    @staticmethod
+    def _watermarks_result(rows) -> Dict[str, dict]:
+        """Watermark dicts from the rows of _watermarks_query()"""
+        return {
+            table: {
+                'max_id': int(max_id or 0),
+                'new_rows': int(new_rows or 0),
+                'inserted': int(inserted or 0),
+                'mutations': None if mutations is None else int(mutations),
+            }
+            for table, max_id, new_rows, inserted, mutations in rows
+        }
+    
+    def get_table_watermarks(self, tables, since: Optional[Dict[str, int]] = None) -> Optional[Dict[str, dict]]:
+        """
+        Probe the append high-water marks of a set of tables (one statement)
+        
+        Per table this returns:
+        
+        - ``max_id``: largest primary key (0 for an empty table)
+        - ``new_rows``: rows whose key is above ``since[table]``
+        - ``inserted``: running insert counter (``versi - versi_mutasi`` from
+          versi_data, or COUNT(*) when the counter columns are missing)
+        - ``mutations``: counter bumped on UPDATE/DELETE, or None when
+          versi_data has no ``versi_mutasi`` column (deletes are then caught
+          through the row count, updates are not)
+        
+        Everything is read by one SELECT, so the values are consistent.
+        
+        Args:
+            tables: Iterable of keys of TABLE_KEYS
+            since: Previous max_id per table (missing tables count as 0)
+            
+        Returns:
+            Dictionary of table -> watermark dict, or None on error
+        """
+        tables = self._watermark_tables(tables)
+        
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    rows = None
+                    if self._mutation_counter_available is not False:
+                        try:
+                            query, params = self._watermarks_query(tables, since, True)
+                            with self.query_stats.timer('get_table_watermarks', query, params) as timer:
+                                cursor.execute(query, params)
+                                timer.executed()
+                                rows = cursor.fetchall()
+                                timer.fetched(rows)
+                            # Tabel yang tidak terdaftar di versi_data menghasilkan NULL
+                            self._mutation_counter_available = all(row[3] is not None for row in rows)
+                            if not self._mutation_counter_available:
+                                rows = None
+                        except Error as e:
+                            # 1146 = tabel versi_data tidak ada, 1054 = kolom versi_mutasi tidak ada
+                            if getattr(e, 'errno', None) not in (1146, 1054):
+                                raise
+                            self._mutation_counter_available = False
+                    if rows is None:
+                        query, params = self._watermarks_query(tables, since, False)
+                        with self.query_stats.timer('get_table_watermarks', query, params) as timer:
+                            cursor.execute(query, params)
+                            timer.executed()
+                            rows = cursor.fetchall()
+                            timer.fetched(rows)
+                finally:
+                    cursor.close()
+        except (Error, PoolExhaustedError) as e:
+            print(f"Error probing table watermarks: {e}")
+            return None
+        
+        watermarks = self._watermarks_result(rows)
+        if self.result_cache is not None:
+            self.result_cache.observe({
+                ('watermark', table): (mark['max_id'], mark['inserted'], mark['mutations'])
+                for table, mark in watermarks.items()
+            })
+        return watermarks
+    
+    @staticmethod
+    def _key_range_condition(column: str, key_range: Optional[KeyRange]) -> Tuple[str, tuple]:
+        """SQL condition and params restricting ``column`` to (after, upto]"""
+        if key_range is None:
+            return "", ()
+        after, upto = key_range
+        return f"{column} > %s AND {column} <= %s", (int(after), int(upto))
+    
+    # ================================================================
+    # BASIC DATA RETRIEVAL METHODS (For all team members)
+    # ================================================================
+    
+    @staticmethod
+    def _all_respondents_query(id_range: Optional[KeyRange] = None) -> Tuple[str, tuple]:
+        """SQL and params behind get_all_respondents()"""
+        condition, params = Database._key_range_condition('id_responden', id_range)
+        where = f"WHERE {condition}" if condition else ""
+        return f"""
+        SELECT 
+            id_responden,
+            nama,
+            usia,
+            jenis_kelamin,
+            status_hubungan,
+            pekerjaan,
+            menggunakan_medsos
+        FROM responden
+        {where}
+        ORDER BY id_responden
+        """, params
+    
+    def get_all_respondents(self, fetch_mode: str = 'pandas',
+                            id_range: Optional[KeyRange] = None) -> Optional[pd.DataFrame]:
+        """
+        Get all respondents data
+        
+        Args:
+            fetch_mode: 'pandas' or 'arrow' (see execute_query)
+            id_range: Only respondents with after < id_responden <= upto
+        
+        Returns:
+            DataFrame with all responden records
+        """
+        query, params = self._all_respondents_query(id_range)
+        return self.execute_query(query, params or None, fetch_mode=fetch_mode,
+                                  name='get_all_respondents', cache=False)
+    
+    @staticmethod
+    def _respondents_page_query(after_id: Optional[int], limit: int) -> Tuple[str, tuple]:
+        """SQL and params behind get_respondents_page()"""
+        return """
+        SELECT 
+            id_responden,
+            nama,
+            usia,
+            jenis_kelamin,
+            status_hubungan
+        FROM responden
+        WHERE id_responden > %s
+        ORDER BY id_responden
+        LIMIT %s
+        """, (int(after_id or 0), int(limit))
+    
+    def get_respondents_page(self, after_id: Optional[int] = None,
+                             limit: int = 12) -> Optional[pd.DataFrame]:
+        """
+        Get one page of respondents by keyset pagination on the primary key
+        
+        The page starts right after ``after_id`` (a PRIMARY KEY range scan),
+        so the cost does not grow with the page number like OFFSET does.
+        
+        Args:
+            after_id: Last id_responden of the previous page (None = first page)
+            limit: Maximum number of respondents on the page
+        
+        Returns:
+            DataFrame with the respondent card columns, ordered by id_responden
+        """
+        query, params = self._respondents_page_query(after_id, limit)
+        return self.execute_query(query, params, name='get_respondents_page')
+    
+    @staticmethod
+    def _count_result(df: Optional[pd.DataFrame]) -> Optional[int]:
+        """The ``total`` of a COUNT(*) AS total query, None if error"""
+        if df is None or df.empty:
+            return None
+        return int(df['total'].iloc[0])
+    
+    def get_respondent_count(self) -> Optional[int]:
+        """
+        Count all respondents
+        
+        Returns:
+            Number of respondents or None if error
+        """
+        return self._count_result(self.execute_query(RESPONDENT_COUNT_QUERY,
+                                                     name='get_respondent_count'))
+    
+    def get_respondent_names(self) -> Optional[pd.DataFrame]:
+        """
+        Get the id and name of every respondent (source of search.NameIndex)
+        
+        Returns:
+            DataFrame with id_responden and nama
+        """
+        return self.execute_query(RESPONDENT_NAMES_QUERY, name='get_respondent_names')
+    
+    @staticmethod
+    def _search_respondents_query(term: str, limit: int) -> Tuple[str, tuple]:
+        """SQL and params behind search_respondents()"""
+        where, params = SQLFilter().contains('nama', term.strip()).clause()
+        return f"""
+        SELECT id_responden, nama
+        FROM responden
+        {where}
+        ORDER BY id_responden
+        LIMIT %s
+        """, params + (int(limit),)
+    
+    def search_respondents(self, term: str, limit: int = 20) -> Optional[pd.DataFrame]:
+        """
+        Find respondents whose name contains a term (server-side)
+        
+        Case-insensitive through the column collation. This scans the
+        table; the dashboard uses the in-memory search.NameIndex for
+        typeahead and this method where no index is loaded.
+        
+        Args:
+            term: Search text
+            limit: Maximum number of respondents returned
+        
+        Returns:
+            DataFrame with id_responden and nama, ordered by id_responden
+        """
+        query, params = self._search_respondents_query(term, limit)
+        return self.execute_query(query, params, name='search_respondents')
+    
+    @staticmethod
+    def _respondent_detail_queries(id_responden: int) -> Dict[str, QuerySpec]:
+        """Batch behind get_respondent_detail()"""
+        params = (int(id_responden),)
+        return {
+            'responden': ("""
+                SELECT id_responden, nama, usia, jenis_kelamin, status_hubungan,
+                    pekerjaan, menggunakan_medsos
+                FROM responden
+                WHERE id_responden = %s
+            """, params),
+            'usage': ("""
+                SELECT pp.id_penggunaan, pp.id_platform, mp.nama_platform, pp.jam_per_hari,
+                    pp.tujuan_penggunaan, pp.frekuensi_buka_per_hari
+                FROM penggunaan_per_platform pp
+                JOIN master_platform mp ON pp.id_platform = mp.id_platform
+                WHERE pp.id_responden = %s
+                ORDER BY mp.nama_platform
+            """, params),
+            'mental': ("""
+                SELECT id_kesehatan, gangguan_fokus, gelisah, kecemasan, kesulitan_konsentrasi,
+                    perbandingan_diri, sentimen_posting, mencari_validasi, depresi,
+                    fluktuasi_minat, sulit_tidur
+                FROM kesehatan_mental
+                WHERE id_responden = %s
+            """, params),
+        }
+    
+    @staticmethod
+    def _respondent_detail_result(results: Dict[str, Optional[pd.DataFrame]]):
+        """get_respondent_detail() tuple from the batch results"""
+        if any(df is None for df in results.values()):
+            return None, None, None
+        
+        def first_row(df):
+            return df.iloc[0] if not df.empty else None
+        
+        return first_row(results['responden']), results['usage'], first_row(results['mental'])
+    
+    def get_respondent_detail(self, id_responden: int) -> Tuple[Optional[pd.Series], Optional[pd.DataFrame], Optional[pd.Series]]:
         """
-        Test database connection and return status
+        Get one respondent with its usage and mental health rows (one round-trip)
+        
+        Every statement is a primary key / idx_responden lookup.
+        
+        Args:
+            id_responden: Respondent primary key
         
         Returns:
-            Tuple of (success: bool, message: str)
+            Tuple of (respondent Series, usage DataFrame, mental health Series);
+            a Series is None if the row does not exist, everything is None on error
         """
-        try:
-            if self.connect():
-                cursor = self.connection.cursor()
-                cursor.execute("SELECT DATABASE()")
-                db_name = cursor.fetchone()[0]
-                cursor.close()
-                return True, f"Connected to database: {db_name}"
-            else:
-                return False, "Failed to connect to database"
-        except Error as e:
-            return False, f"Connection error: {str(e)}"
+        results = self.execute_batch(self._respondent_detail_queries(id_responden),
+                                     name='get_respondent_detail')
+        return self._respondent_detail_result(results)
     
-    def get_table_info(self) -> Optional[pd.DataFrame]:
+    def view_all_respondents(self):
         """
-        Get information about all tables in database
+        Get all respondents using cursor (dosen pattern)
         
         Returns:
-            DataFrame with table names and row counts
-        """
-        query = """
-        SELECT 
-            TABLE_NAME as table_name,
-            TABLE_ROWS as row_count
-        FROM information_schema.TABLES
-        WHERE TABLE_SCHEMA = %s
-        ORDER BY TABLE_NAME
+            List of tuples with respondent data
         """
-        return self.execute_query(query, (self.database,))
-    
-    # ================================================================
-    # BASIC DATA RETRIEVAL METHODS (For all team members)
-    # ================================================================
+        query = VIEW_ALL_RESPONDENTS_QUERY
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            with self.query_stats.timer('view_all_respondents', query) as timer:
+                cursor.execute(query)
+                timer.executed()
+                rows = cursor.fetchall()
+                timer.fetched(rows)
+            cursor.close()
+        return rows
     
-    def get_all_respondents(self) -> Optional[pd.DataFrame]:
+    def get_table_page(self, table: str, columns: Optional[List[str]] = None,
+                       sort_by: Optional[str] = None, descending: bool = False,
+                       after: Optional[PageCursor] = None,
+                       limit: int = 50) -> Tuple[Optional[pd.DataFrame], Optional[PageCursor]]:
         """
-        Get all respondents data
+        Get one page of a table by keyset pagination
+        
+        Only the requested columns are selected. The page continues after
+        ``after`` with ``(sort, key) > (last sort, last key)`` (``<`` when
+        descending) on an indexed sort key, so no row before the page is
+        read or sent.
+        
+        Args:
+            table: Key of PAGED_TABLES
+            columns: Columns to select (default: all columns of the table)
+            sort_by: Sort key of the table (default: its primary key)
+            descending: Sort descending
+            after: Cursor returned for the previous page (None = first page)
+            limit: Maximum number of rows on the page
         
         Returns:
-            DataFrame with all responden records
+            Tuple of (page DataFrame, cursor of the next page or None if
+            this is the last page); (None, None) if error
+        
+        Raises:
+            ValueError: if the table, a column or the sort key is not allowed
         """
-        query = """
+        query, params = self._table_page_query(table, columns, sort_by, descending, after, limit)
+        return self._table_page_result(
+            self.execute_query(query, params, name=f'get_table_page.{table}'), limit)
+    
+    @staticmethod
+    def _paged_table(table: str) -> dict:
+        """PAGED_TABLES entry of a table, ValueError if it is not browsable"""
+        spec = PAGED_TABLES.get(table)
+        if spec is None:
+            raise ValueError(f"table must be one of {tuple(PAGED_TABLES)}, got {table!r}")
+        return spec
+    
+    @staticmethod
+    def _table_page_query(table: str, columns: Optional[List[str]], sort_by: Optional[str],
+                          descending: bool, after: Optional[PageCursor],
+                          limit: int) -> Tuple[str, tuple]:
+        """SQL and params behind get_table_page() (arguments validated)"""
+        spec = Database._paged_table(table)
+        columns = list(columns) if columns else list(spec['columns'])
+        unknown = [column for column in columns if column not in spec['columns']]
+        if unknown:
+            raise ValueError(f"Unknown columns for {table}: {unknown}")
+        sort_by = sort_by or next(iter(spec['sort_keys']))
+        if sort_by not in spec['sort_keys']:
+            raise ValueError(f"sort_by must be one of {tuple(spec['sort_keys'])}, got {sort_by!r}")
+        
+        sort_expr, key_expr = spec['sort_keys'][sort_by], spec['key']
+        direction, op = ('DESC', '<') if descending else ('ASC', '>')
+        select = ",\n            ".join(
+            [f"{spec['columns'][column]} AS {column}" for column in columns]
+            + [f"{sort_expr} AS _page_sort", f"{key_expr} AS _page_key"]
+        )
+        where, params = "", ()
+        if after is not None:
+            # Bentuk OR (bukan row constructor) agar range scan indeks dipakai di semua versi
+            where = f"WHERE {sort_expr} {op} %s OR ({sort_expr} = %s AND {key_expr} {op} %s)"
+            params = (after[0], after[0], after[1])
+        query = f"""
         SELECT 
-            id_responden,
-            nama,
-            usia,
-            jenis_kelamin,
-            status_hubungan,
-            pekerjaan,
-            menggunakan_medsos
-        FROM responden
-        ORDER BY id_responden
+            {select}
+        FROM {spec['from']}
+        {where}
+        ORDER BY {sort_expr} {direction}, {key_expr} {direction}
+        LIMIT %s
         """
-        return self.execute_query(query)
+        return query, params + (int(limit),)
     
-    def view_all_respondents(self):
+    @staticmethod
+    def _table_page_result(df: Optional[pd.DataFrame],
+                           limit: int) -> Tuple[Optional[pd.DataFrame], Optional[PageCursor]]:
+        """Page without the _page_* columns and the cursor of the next page"""
+        if df is None:
+            return None, None
+        
+        next_cursor = None
+        if len(df) == limit:
+            # _page_* tidak ada di dtype map, jadi nilainya tidak diperkecil ke float32
+            last = df.iloc[-1]
+            sort_value = last['_page_sort']
+            next_cursor = (sort_value.item() if hasattr(sort_value, 'item') else sort_value,
+                           int(last['_page_key']))
+        return df.drop(columns=['_page_sort', '_page_key']), next_cursor
+    
+    def get_table_count(self, table: str) -> Optional[int]:
         """
-        Get all respondents using cursor (dosen pattern)
+        Count the rows of a table browsable with get_table_page()
+        
+        Args:
+            table: Key of PAGED_TABLES
         
         Returns:
-            List of tuples with respondent data
+            Number of rows or None if error
         """
-        if not self.cursor:
-            self.connect()
-        self.cursor.execute('SELECT * FROM responden ORDER BY nama ASC')
-        return self.cursor.fetchall()
+        return self._count_result(self.execute_query(self._table_count_query(table),
+                                                     name=f'get_table_count.{table}'))
+    
+    @staticmethod
+    def _table_count_query(table: str) -> str:
+        """SQL behind get_table_count()"""
+        return f"SELECT COUNT(*) AS total FROM {Database._paged_table(table)['count_from']}"
     
     def get_all_platforms(self) -> Optional[pd.DataFrame]:
         """
@@ -159,12 +1733,7 @@ class Database:
         Returns:
             DataFrame with platform data
         """
-        query = """
-        SELECT id_platform, nama_platform
-        FROM master_platform
-        ORDER BY nama_platform
-        """
-        return self.execute_query(query)
+        return self.execute_query(ALL_PLATFORMS_QUERY, name='get_all_platforms')
     
     def view_usage_with_details(self):
         """
@@ -173,39 +1742,23 @@ class Database:
         Returns:
             List of tuples with complete usage information
         """
-        if not self.cursor:
-            self.connect()
-        self.cursor.execute('''
-            SELECT 
-                pp.id_penggunaan,
-                pp.id_responden,
-                r.nama AS nama_responden,
-                r.usia,
-                r.jenis_kelamin,
-                pp.id_platform,
-                mp.nama_platform,
-                pp.jam_per_hari,
-                pp.tujuan_penggunaan,
-                pp.frekuensi_buka_per_hari
-            FROM 
-                penggunaan_per_platform pp
-            JOIN 
-                responden r ON pp.id_responden = r.id_responden
-            JOIN 
-                master_platform mp ON pp.id_platform = mp.id_platform
-            ORDER BY 
-                r.nama ASC, mp.nama_platform ASC
-        ''')
-        return self.cursor.fetchall()
-    
-    def get_all_usage_data(self) -> Optional[pd.DataFrame]:
-        """
-        Get all platform usage data
-        
-        Returns:
-            DataFrame with usage data
-        """
-        query = """
+        query = VIEW_USAGE_WITH_DETAILS_QUERY
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            with self.query_stats.timer('view_usage_with_details', query) as timer:
+                cursor.execute(query)
+                timer.executed()
+                rows = cursor.fetchall()
+                timer.fetched(rows)
+            cursor.close()
+        return rows
+    
+    @staticmethod
+    def _all_usage_query(id_range: Optional[KeyRange] = None) -> Tuple[str, tuple]:
+        """SQL and params behind get_all_usage_data()"""
+        condition, params = Database._key_range_condition('pp.id_penggunaan', id_range)
+        where = f"WHERE {condition}" if condition else ""
+        return f"""
         SELECT 
             pp.id_penggunaan,
             pp.id_responden,
@@ -218,47 +1771,50 @@ class Database:
         FROM penggunaan_per_platform pp
         JOIN responden r ON pp.id_responden = r.id_responden
         JOIN master_platform mp ON pp.id_platform = mp.id_platform
+        {where}
         ORDER BY pp.id_responden, mp.nama_platform
+        """, params
+    
+    def get_all_usage_data(self, fetch_mode: str = 'pandas',
+                           id_range: Optional[KeyRange] = None) -> Optional[pd.DataFrame]:
+        """
+        Get all platform usage data
+        
+        Args:
+            fetch_mode: 'pandas' or 'arrow' (see execute_query)
+            id_range: Only usage rows with after < id_penggunaan <= upto
+        
+        Returns:
+            DataFrame with usage data
         """
-        return self.execute_query(query)
+        query, params = self._all_usage_query(id_range)
+        return self.execute_query(query, params or None, fetch_mode=fetch_mode,
+                                  name='get_all_usage_data', cache=False)
     
-    def get_all_mental_health_data(self) -> Optional[pd.DataFrame]:
+    def get_all_mental_health_data(self, fetch_mode: str = 'pandas') -> Optional[pd.DataFrame]:
         """
         Get all mental health data
         
+        Args:
+            fetch_mode: 'pandas' or 'arrow' (see execute_query)
+        
         Returns:
             DataFrame with mental health records
         """
-        query = """
-        SELECT 
-            km.id_kesehatan,
-            km.id_responden,
-            r.nama,
-            km.gangguan_fokus,
-            km.gelisah,
-            km.kecemasan,
-            km.kesulitan_konsentrasi,
-            km.perbandingan_diri,
-            km.sentimen_posting,
-            km.mencari_validasi,
-            km.depresi,
-            km.fluktuasi_minat,
-            km.sulit_tidur
-        FROM kesehatan_mental km
-        JOIN responden r ON km.id_responden = r.id_responden
-        ORDER BY km.id_responden
-        """
-        return self.execute_query(query)
+        return self.execute_query(ALL_MENTAL_HEALTH_QUERY, fetch_mode=fetch_mode,
+                                  name='get_all_mental_health_data', cache=False)
     
-    def get_master_dataframe(self) -> Optional[pd.DataFrame]:
+    @staticmethod
+    def _master_query(respondents: str = "responden r", where: str = "") -> str:
         """
-        Get complete master dataframe with all joins
-        This will be used by Nabil for data preparation
+        SQL behind get_master_dataframe()
         
-        Returns:
-            DataFrame with all data joined
+        Args:
+            respondents: FROM clause supplying alias ``r`` (a derived table
+                joined to responden restricts the result to those respondents)
+            where: WHERE clause on the respondent columns (see SQLFilter)
         """
-        query = """
+        return f"""
         SELECT 
             r.id_responden,
             r.nama,
@@ -282,62 +1838,484 @@ class Database:
             km.depresi,
             km.fluktuasi_minat,
             km.sulit_tidur
-        FROM responden r
+        FROM {respondents}
         LEFT JOIN penggunaan_per_platform pp ON r.id_responden = pp.id_responden
         LEFT JOIN master_platform mp ON pp.id_platform = mp.id_platform
         LEFT JOIN kesehatan_mental km ON r.id_responden = km.id_responden
+        {where}
         ORDER BY r.id_responden, mp.nama_platform
         """
-        return self.execute_query(query)
+    
+    @staticmethod
+    def respondent_filter(usia_range: Optional[Tuple[int, int]] = None,
+                          genders: Optional[Sequence[str]] = None,
+                          statuses: Optional[Sequence[str]] = None,
+                          jobs: Optional[Sequence[str]] = None,
+                          search: Optional[str] = None,
+                          ids: Optional[Sequence[int]] = None) -> SQLFilter:
+        """
+        Build the Data Mentah page filters on the responden columns (alias ``r``)
+        
+        Age, gender and job conditions can use idx_usia, idx_jenis_kelamin
+        and idx_pekerjaan. None skips a condition.
+        
+        Args:
+            usia_range: Inclusive (min, max) age range
+            genders: Allowed jenis_kelamin values
+            statuses: Allowed status_hubungan values
+            jobs: Allowed pekerjaan values
+            search: Substring of nama (LIKE scan)
+            ids: Allowed id_responden values, e.g. the result of a
+                search.NameIndex lookup (PRIMARY KEY lookups)
+        
+        Returns:
+            SQLFilter for get_master_dataframe() / iter_master_dataframe()
+        """
+        return (SQLFilter()
+                .between('r.usia', usia_range)
+                .isin('r.jenis_kelamin', genders)
+                .isin('r.status_hubungan', statuses)
+                .isin('r.pekerjaan', jobs)
+                .contains('r.nama', search)
+                .isin('r.id_responden', ids))
+    
+    def get_master_dataframe(self, fetch_mode: str = 'pandas',
+                             filters: Optional[SQLFilter] = None) -> Optional[pd.DataFrame]:
+        """
+        Get complete master dataframe with all joins
+        This will be used by Nabil for data preparation
+        
+        Args:
+            fetch_mode: 'pandas' or 'arrow' (see execute_query)
+            filters: Conditions on the respondent columns (see respondent_filter)
+        
+        Returns:
+            DataFrame with all data joined
+        """
+        where, params = filters.clause() if filters else ("", ())
+        name = 'get_master_dataframe.filtered' if where else 'get_master_dataframe'
+        # Master lengkap sudah disimpan st.cache_resource dan snapshot store;
+        # hanya hasil terfilter yang masuk result cache
+        return self.execute_query(self._master_query(where=where), params or None,
+                                  fetch_mode=fetch_mode, name=name, cache=bool(where))
+    
+    def iter_master_dataframe(self, chunksize: int = DEFAULT_CHUNKSIZE,
+                              filters: Optional[SQLFilter] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream the master dataframe in chunks (see execute_query_iter)
+        
+        Rows stay ordered by id_responden, so one respondent's rows are
+        contiguous but may span two chunks.
+        
+        Args:
+            chunksize: Number of rows per chunk
+            filters: Conditions on the respondent columns (see respondent_filter)
+            
+        Yields:
+            DataFrame chunks of the master join
+        """
+        where, params = filters.clause() if filters else ("", ())
+        return self.execute_query_iter(self._master_query(where=where), params or None,
+                                       chunksize=chunksize, name='iter_master_dataframe')
+    
+    def get_master_rows_for_appends(self, ranges: Dict[str, KeyRange],
+                                    fetch_mode: str = 'pandas') -> Optional[pd.DataFrame]:
+        """
+        Get the complete master rows of every respondent touched by appended rows
+        
+        A respondent is touched if its own row, one of its usage rows or its
+        mental health row lies in the given key range. All of that
+        respondent's rows are returned, so they can replace the old ones.
+        
+        Args:
+            ranges: Table -> (after, upto) key range; master_platform is ignored
+            fetch_mode: 'pandas' or 'arrow' (see execute_query)
+            
+        Returns:
+            DataFrame with the master columns (empty if nothing was touched)
+        """
+        query, params = self._master_rows_for_appends_query(ranges)
+        return self.execute_query(query, params or None,
+                                  fetch_mode=fetch_mode, name='get_master_rows_for_appends')
+    
+    @staticmethod
+    def _master_rows_for_appends_query(ranges: Dict[str, KeyRange]) -> Tuple[str, tuple]:
+        """SQL and params behind get_master_rows_for_appends()"""
+        sources = {
+            'responden': ('responden', 'id_responden'),
+            'penggunaan_per_platform': ('penggunaan_per_platform', 'id_penggunaan'),
+            'kesehatan_mental': ('kesehatan_mental', 'id_kesehatan'),
+        }
+        selects = []
+        params = []
+        for table, (source, key) in sources.items():
+            if table in ranges:
+                condition, range_params = Database._key_range_condition(key, ranges[table])
+                selects.append(f"SELECT id_responden FROM {source} WHERE {condition}")
+                params.extend(range_params)
+        if not selects:
+            selects.append("SELECT id_responden FROM responden WHERE FALSE")
+        
+        # Derived table (bukan IN + UNION) supaya MySQL memakai PRIMARY responden
+        touched = "(" + "\n            UNION ".join(selects) + """) baru
+        JOIN responden r ON r.id_responden = baru.id_responden"""
+        return Database._master_query(touched), tuple(params)
+    
+    # ================================================================
+    # BULK LOAD
+    # ================================================================
+    
+    @staticmethod
+    def _check_batches(batches: Sequence[Tuple[str, Sequence[str], Sequence[tuple]]], method: str):
+        """Validate the bulk_insert() method and every table/column identifier"""
+        if method not in BULK_METHODS:
+            raise ValueError(f"method must be one of {BULK_METHODS}, got {method!r}")
+        for table, columns, _ in batches:
+            if not all(_TABLE_NAME_RE.match(identifier) for identifier in (table, *columns)):
+                raise ValueError(f"Invalid identifier in {table!r} {list(columns)}")
+    
+    @staticmethod
+    def _insert_statement(table: str, columns: Sequence[str]) -> Tuple[str, str]:
+        """Quoted column list and parameterized INSERT for one bulk_insert() batch"""
+        column_list = ", ".join(f"`{column}`" for column in columns)
+        placeholders = ", ".join(["%s"] * len(columns))
+        return column_list, f"INSERT INTO `{table}` ({column_list}) VALUES ({placeholders})"
+    
+    def bulk_insert(self, batches: Sequence[Tuple[str, Sequence[str], Sequence[tuple]]],
+                    defer_checks: bool = False, method: str = 'executemany') -> bool:
+        """
+        Insert rows into one or more tables in a single transaction
+        
+        Args:
+            batches: (table, columns, rows) in insert order (parent tables first)
+            defer_checks: Turn off foreign key and unique checks for the
+                session while loading. Only safe when the caller has already
+                validated every reference and key (see ingest.py).
+            method: 'executemany' (batched multi-row INSERT) or 'load_data'
+                (LOAD DATA LOCAL INFILE from a temporary file; needs
+                allow_local_infile, otherwise and on an embedded backend
+                'executemany' is used)
+                
+        Returns:
+            bool: True if committed
+        """
+        self._check_batches(batches, method)
+        load_data = method == 'load_data' and self.backend is None and self.allow_local_infile
+        
+        committed = False
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    try:
+                        if defer_checks:
+                            cursor.execute("SET foreign_key_checks = 0")
+                            cursor.execute("SET unique_checks = 0")
+                        cursor.execute("START TRANSACTION")
+                        for table, columns, rows in batches:
+                            if not rows:
+                                continue
+                            column_list, statement = self._insert_statement(table, columns)
+                            with self.query_stats.timer(f"bulk_insert.{table}", statement) as timer:
+                                if load_data:
+                                    self._load_data(cursor, table, column_list, rows)
+                                else:
+                                    cursor.executemany(statement, rows)
+                                timer.executed()
+                                timer.rows = len(rows)
+                        conn.commit()
+                    except Error:
+                        # Koneksi (beserta setelan sesinya) dibuang oleh pool
+                        conn.rollback()
+                        raise
+                    committed = True
+                    # Koneksi kembali ke pool; pengecekan harus aktif lagi. Jika
+                    # gagal, error-nya membuat pool membuang koneksi ini
+                    if defer_checks:
+                        cursor.execute("SET unique_checks = 1")
+                        cursor.execute("SET foreign_key_checks = 1")
+                finally:
+                    cursor.close()
+        except (Error, PoolExhaustedError) as e:
+            if not committed:
+                print(f"Error bulk inserting: {e}")
+                return False
+            # Data sudah di-commit; hanya koneksinya yang tidak dipakai lagi
+            print(f"Error restoring session checks after bulk insert (connection discarded): {e}")
+        self.clear_result_cache()
+        return True
+    
+    @staticmethod
+    def _load_data(cursor, table: str, column_list: str, rows: Sequence[tuple]):
+        """Send rows through LOAD DATA LOCAL INFILE using a temporary tab-separated file"""
+        def field(value):
+            if value is None:
+                return "\\N"
+            text = str(value)
+            for char, escaped in (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n")):
+                text = text.replace(char, escaped)
+            return text
+        
+        with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False, encoding='utf-8') as f:
+            for row in rows:
+                f.write("\t".join(field(value) for value in row) + "\n")
+        try:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table}` CHARACTER SET utf8mb4 ({column_list})",
+                (f.name,)
+            )
+        finally:
+            os.remove(f.name)
+    
+    # ================================================================
+    # SUMMARY TABLES
+    # ================================================================
+    
+    def summary_tables_available(self) -> bool:
+        """
+        Check whether the trigger-maintained summary tables can be used
+        
+        The catalog is probed once; a failed probe is retried on the next call.
+        
+        Returns:
+            bool: True if enabled and all SUMMARY_TABLES exist
+        """
+        if not self.use_summary_tables:
+            return False
+        if self._summary_tables_available is None:
+            df = self.execute_query(SUMMARY_TABLES_QUERY, SUMMARY_TABLES, name='summary_tables_available')
+            if df is None or df.empty:
+                return False
+            self._summary_tables_available = int(df['jumlah'].iloc[0]) == len(SUMMARY_TABLES)
+        return self._summary_tables_available
+    
+    def rebuild_summary_tables(self) -> bool:
+        """
+        Recompute the summary tables from the base tables in one transaction
+        
+        The triggers keep the summaries current; this is the recovery path
+        (e.g. after a primary key update or a bulk load with triggers
+        disabled). Same as ``CALL rebuild_ringkasan()`` on MySQL.
+        
+        Returns:
+            bool: True if rebuilt
+        """
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    with self.query_stats.timer('rebuild_summary_tables', "CALL rebuild_ringkasan()"):
+                        cursor.execute("START TRANSACTION")
+                        for statement in SUMMARY_REBUILD_STATEMENTS:
+                            cursor.execute(statement)
+                        conn.commit()
+                except Error:
+                    conn.rollback()
+                    raise
+                finally:
+                    cursor.close()
+        except (Error, PoolExhaustedError) as e:
+            print(f"Error rebuilding summary tables: {e}")
+            return False
+        self._summary_tables_available = None
+        self.clear_result_cache()
+        return True
+    
+    def _aggregate_results(self, queries: Dict[str, QuerySpec], summary_queries: Dict[str, QuerySpec],
+                           name: str) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Run aggregates from the summary tables if available, else from the base tables
+        
+        Args:
+            queries: Base-table queries (run through execute_aggregates())
+            summary_queries: Equivalent queries over the summary tables, with
+                the same names and output columns
+            name: Prefix of the query stats entries
+            
+        Returns:
+            Dictionary of name -> DataFrame (every value is None if the batch fails)
+        """
+        if self.summary_tables_available():
+            return self.execute_batch(summary_queries, name=name)
+        return self.execute_aggregates(queries, name=name)
+    
+    def _summary_statistics_queries(self) -> Dict[str, str]:
+        """Named queries behind get_summary_statistics()"""
+        if self.summary_tables_available():
+            return self._summary_statistics_summary_queries()
+        return self._summary_statistics_base_queries()
+    
+    @staticmethod
+    def _summary_statistics_base_queries() -> Dict[str, str]:
+        """_summary_statistics_queries() over the base tables"""
+        return {
+            # Total responden
+            'total_responden': "SELECT COUNT(*) as total FROM responden",
+            # Total platform
+            'total_platform': "SELECT COUNT(*) as total FROM master_platform",
+            # Rata-rata jam penggunaan
+            'avg_jam_penggunaan': "SELECT AVG(jam_per_hari) as avg_jam FROM penggunaan_per_platform",
+            # Rata-rata kesehatan mental (semua atribut)
+            'avg_mental_health': """
+            SELECT 
+                AVG((gangguan_fokus + gelisah + kecemasan + kesulitan_konsentrasi + 
+                    perbandingan_diri + mencari_validasi + depresi + 
+                    fluktuasi_minat + sulit_tidur) / 9.0) as avg_mental_health
+            FROM kesehatan_mental
+            """
+        }
+    
+    @staticmethod
+    def _summary_statistics_summary_queries() -> Dict[str, str]:
+        """_summary_statistics_queries() answered from the summary tables (O(groups))"""
+        mental_sums = " + ".join(f"sum_{attribute}" for attribute in MENTAL_ATTRIBUTES
+                                 if attribute != 'sentimen_posting')
+        return {
+            'total_responden': "SELECT COALESCE(SUM(jumlah_responden), 0) AS total FROM ringkasan_responden",
+            'total_platform': "SELECT COUNT(*) AS total FROM master_platform",
+            'avg_jam_penggunaan': """
+            SELECT SUM(sum_jam_per_hari) * 1.0 / NULLIF(SUM(jumlah_penggunaan), 0) AS avg_jam
+            FROM ringkasan_penggunaan
+            """,
+            'avg_mental_health': f"""
+            SELECT SUM({mental_sums}) / 9.0 / NULLIF(SUM(jumlah_mental), 0) AS avg_mental_health
+            FROM ringkasan_responden
+            """
+        }
+    
+    @staticmethod
+    def _build_summary_statistics(results: Dict[str, Optional[pd.DataFrame]]) -> dict:
+        """Turn the result frames of _summary_statistics_queries() into the stats dict"""
+        def scalar(name, column, cast):
+            result = results.get(name)
+            if result is None or result.empty or pd.isna(result[column].iloc[0]):
+                return cast(0)
+            return cast(result[column].iloc[0])
+        
+        return {
+            'total_responden': scalar('total_responden', 'total', int),
+            'total_platform': scalar('total_platform', 'total', int),
+            'avg_jam_penggunaan': scalar('avg_jam_penggunaan', 'avg_jam', float),
+            'avg_mental_health': scalar('avg_mental_health', 'avg_mental_health', float)
+        }
     
     def get_summary_statistics(self) -> dict:
         """
-        Get summary statistics for dashboard overview
+        Get summary statistics for dashboard overview (one round-trip)
 
         Returns:
             Dictionary with summary stats
         """
-        stats = {}
-
-        # Total responden
-        query = "SELECT COUNT(*) as total FROM responden"
-        result = self.execute_query(query)
-        stats['total_responden'] = int(result['total'].iloc[0]) if result is not None else 0
-
-        # Total platform
-        query = "SELECT COUNT(*) as total FROM master_platform"
-        result = self.execute_query(query)
-        stats['total_platform'] = int(result['total'].iloc[0]) if result is not None else 0
-
-        # Rata-rata jam penggunaan
-        query = "SELECT AVG(jam_per_hari) as avg_jam FROM penggunaan_per_platform"
-        result = self.execute_query(query)
-        stats['avg_jam_penggunaan'] = float(result['avg_jam'].iloc[0]) if result is not None else 0
-
-        # Rata-rata kesehatan mental (semua atribut)
-        query = """
-        SELECT 
-            AVG((gangguan_fokus + gelisah + kecemasan + kesulitan_konsentrasi + 
-                perbandingan_diri + mencari_validasi + depresi + 
-                fluktuasi_minat + sulit_tidur) / 9.0) as avg_mental_health
-        FROM kesehatan_mental
+        results = self.execute_batch(self._summary_statistics_queries(), name='get_summary_statistics')
+        return self._build_summary_statistics(results)
+    
+    def get_home_data(self) -> Tuple[dict, Optional[pd.DataFrame]]:
         """
-        result = self.execute_query(query)
-        stats['avg_mental_health'] = float(result['avg_mental_health'].iloc[0]) if result is not None else 0
-
-        return stats
+        Get summary statistics and all respondents in a single round-trip
+        
+        Returns:
+            Tuple of (stats dict, respondents DataFrame)
+        """
+        queries = self._summary_statistics_queries()
+        queries['respondents'] = self._all_respondents_query()
+        results = self.execute_batch(queries, name='get_home_data')
+        return self._build_summary_statistics(results), results['respondents']
     
-    # ================================================================
-    # VERA: DEMOGRAPHIC EFFECTS ANALYSIS METHODS
-    # ================================================================
+    def get_home_totals(self, ranges: Optional[Dict[str, KeyRange]] = None) -> Tuple[Optional[dict], Optional[pd.DataFrame]]:
+        """
+        Get additive home page totals and respondents in a single round-trip
+        
+        Unlike get_home_data(), the result consists of counts and sums, so
+        the totals of newly appended key ranges can simply be added to the
+        previous ones (see summary_from_totals()).
+        
+        Args:
+            ranges: Table -> (after, upto) key range for responden,
+                penggunaan_per_platform and kesehatan_mental; all rows if None
+                
+        Returns:
+            Tuple of (totals dict, respondents DataFrame), or (None, None) on error
+        """
+        results = self.execute_batch(self._home_totals_queries(ranges), name='get_home_totals')
+        return self._build_home_totals(results)
     
-    def get_gender_comparison_data(self) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    @staticmethod
+    def _home_totals_queries(ranges: Optional[Dict[str, KeyRange]] = None) -> Dict[str, QuerySpec]:
+        """Batch behind get_home_totals()"""
+        ranges = ranges or {}
+        
+        def where(table, column):
+            condition, params = Database._key_range_condition(column, ranges.get(table))
+            return (f"WHERE {condition}" if condition else ""), params
+        
+        responden_where, responden_params = where('responden', 'id_responden')
+        usage_where, usage_params = where('penggunaan_per_platform', 'id_penggunaan')
+        mental_where, mental_params = where('kesehatan_mental', 'id_kesehatan')
+        return {
+            'responden': (f"SELECT COUNT(*) AS jumlah FROM responden {responden_where}",
+                          responden_params),
+            # Jumlah platform selalu dihitung penuh (tabel master kecil)
+            'platform': "SELECT COUNT(*) AS jumlah FROM master_platform",
+            'penggunaan': (f"""
+            SELECT COUNT(jam_per_hari) AS jumlah, SUM(jam_per_hari) AS total_jam
+            FROM penggunaan_per_platform {usage_where}
+            """, usage_params),
+            'mental': (f"""
+            SELECT 
+                COUNT(*) AS jumlah,
+                SUM((gangguan_fokus + gelisah + kecemasan + kesulitan_konsentrasi + 
+                    perbandingan_diri + mencari_validasi + depresi + 
+                    fluktuasi_minat + sulit_tidur) / 9.0) AS total_mental
+            FROM kesehatan_mental {mental_where}
+            """, mental_params),
+            'respondents': Database._all_respondents_query(ranges.get('responden')),
+        }
+    
+    @staticmethod
+    def _build_home_totals(results: Dict[str, Optional[pd.DataFrame]]) -> Tuple[Optional[dict], Optional[pd.DataFrame]]:
+        """Turn the result frames of _home_totals_queries() into (totals, respondents)"""
+        if any(result is None for result in results.values()):
+            return None, None
+        
+        def scalar(name, column):
+            value = results[name][column].iloc[0]
+            return 0 if pd.isna(value) else value
+        
+        totals = {
+            'responden': int(scalar('responden', 'jumlah')),
+            'platform': int(scalar('platform', 'jumlah')),
+            'penggunaan': int(scalar('penggunaan', 'jumlah')),
+            'total_jam': float(scalar('penggunaan', 'total_jam')),
+            'mental': int(scalar('mental', 'jumlah')),
+            'total_mental': float(scalar('mental', 'total_mental')),
+        }
+        return totals, results['respondents']
+    
+    @staticmethod
+    def summary_from_totals(totals: dict) -> dict:
         """
-        Get all data required for Gender Comparison (Metrics, Radar, Favorite Platform)
+        Turn get_home_totals() totals into the get_summary_statistics() dict
         
+        Args:
+            totals: Totals dict (possibly accumulated over several appends)
+            
         Returns:
-            Tuple of (metrics_df, radar_df, favorit_df)
+            Dictionary with summary stats
         """
+        return {
+            'total_responden': totals['responden'],
+            'total_platform': totals['platform'],
+            'avg_jam_penggunaan': totals['total_jam'] / totals['penggunaan'] if totals['penggunaan'] else 0.0,
+            'avg_mental_health': totals['total_mental'] / totals['mental'] if totals['mental'] else 0.0
+        }
+    
+    # ================================================================
+    # VERA: DEMOGRAPHIC EFFECTS ANALYSIS METHODS
+    # ================================================================
+    
+    @staticmethod
+    def _gender_comparison_queries() -> Dict[str, str]:
+        """Named queries behind get_gender_comparison_data()"""
         
         # 1. Query untuk Metrik Rata-rata (Jam, Depresi, Kecemasan)
         SQL_METRICS = """
@@ -402,21 +2380,79 @@ class Database:
             rank_num = 1;
         """
         
-        # Eksekusi semua query
-        metrics_df = self.execute_query(SQL_METRICS)
-        radar_df = self.execute_query(SQL_RADAR)
-        favorit_df = self.execute_query(SQL_FAVORIT)
-        
-        return metrics_df, radar_df, favorit_df
+        return {
+            'metrics': SQL_METRICS,
+            'radar': SQL_RADAR,
+            'favorit': SQL_FAVORIT
+        }
     
-    def get_status_comparison_data(self) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    @staticmethod
+    def _gender_comparison_summary_queries() -> Dict[str, str]:
+        """_gender_comparison_queries() answered from the summary tables (O(groups))"""
+        radar_columns = {
+            'Fokus': 'gangguan_fokus', 'Gelisah': 'gelisah', 'Kecemasan': 'kecemasan',
+            'Konsentrasi': 'kesulitan_konsentrasi', 'Banding_Diri': 'perbandingan_diri',
+            'Validasi': 'mencari_validasi', 'Depresi': 'depresi', 'Sulit_Tidur': 'sulit_tidur',
+        }
+        radar_select = ",\n            ".join(
+            f"SUM(sum_{attribute}) * 1.0 / SUM(jumlah_mental) AS {alias}"
+            for alias, attribute in radar_columns.items()
+        )
+        return {
+            'metrics': """
+            SELECT
+                jenis_kelamin,
+                sum_jam_per_hari * 1.0 / jumlah_penggunaan AS avg_jam_guna,
+                sum_depresi * 1.0 / jumlah_penggunaan AS avg_depresi,
+                sum_kecemasan * 1.0 / jumlah_penggunaan AS avg_kecemasan
+            FROM ringkasan_penggunaan_mental
+            WHERE jumlah_penggunaan > 0
+            """,
+            'radar': f"""
+            SELECT
+                jenis_kelamin,
+                {radar_select}
+            FROM ringkasan_responden
+            GROUP BY jenis_kelamin
+            HAVING SUM(jumlah_mental) > 0
+            """,
+            'favorit': """
+            WITH RankedUsage AS (
+                SELECT
+                    rp.jenis_kelamin,
+                    mp.nama_platform,
+                    SUM(rp.sum_frekuensi) AS total_frekuensi,
+                    ROW_NUMBER() OVER (PARTITION BY rp.jenis_kelamin ORDER BY SUM(rp.sum_frekuensi) DESC) AS rank_num
+                FROM ringkasan_penggunaan rp
+                JOIN master_platform mp ON rp.id_platform = mp.id_platform
+                WHERE rp.jumlah_penggunaan > 0
+                GROUP BY rp.jenis_kelamin, mp.nama_platform
+            )
+            SELECT
+                jenis_kelamin,
+                nama_platform AS platform_favorit
+            FROM RankedUsage
+            WHERE rank_num = 1
+            """
+        }
+    
+    def get_gender_comparison_data(self) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[pd.DataFrame]]:
         """
-        Get all data required for Relationship Status Comparison (Donut Chart, Detail Table)
+        Get all data required for Gender Comparison (Metrics, Radar, Favorite Platform)
         
         Returns:
-            Tuple of (depression_df, detail_df)
+            Tuple of (metrics_df, radar_df, favorit_df)
         """
+        # Dari tabel ringkasan jika ada; selain itu satu round-trip (atau lokal jika snapshot segar)
+        results = self._aggregate_results(self._gender_comparison_queries(),
+                                          self._gender_comparison_summary_queries(),
+                                          name='get_gender_comparison_data')
+        return results['metrics'], results['radar'], results['favorit']
     
+    @staticmethod
+    def _status_comparison_queries() -> Dict[str, str]:
+        """Named queries behind get_status_comparison_data()"""
+
         # 1. Query untuk Rata-rata Depresi per Status (untuk Donut Chart)
         SQL_DEPRESSION = """
         SELECT
@@ -449,7 +2485,61 @@ class Database:
             AVG(km.depresi) DESC;
         """
         
-        depression_df = self.execute_query(SQL_DEPRESSION)
-        detail_df = self.execute_query(SQL_DETAIL)
+        return {
+            'depression': SQL_DEPRESSION,
+            'detail': SQL_DETAIL
+        }
+    
+    @staticmethod
+    def _status_comparison_summary_queries() -> Dict[str, str]:
+        """_status_comparison_queries() answered from the summary tables (O(groups))"""
+        return {
+            'depression': """
+            SELECT
+                status_hubungan,
+                SUM(sum_depresi) * 1.0 / SUM(jumlah_mental) AS avg_depresi
+            FROM ringkasan_responden
+            GROUP BY status_hubungan
+            HAVING SUM(jumlah_mental) > 0
+            """,
+            'detail': """
+            SELECT
+                status_hubungan,
+                SUM(sum_depresi) * 1.0 / SUM(jumlah_mental) AS Depresi,
+                SUM(sum_kecemasan) * 1.0 / SUM(jumlah_mental) AS Kecemasan,
+                SUM(sum_gelisah) * 1.0 / SUM(jumlah_mental) AS Gelisah,
+                SUM(sum_sulit_tidur) * 1.0 / SUM(jumlah_mental) AS Sulit_Tidur,
+                SUM(sum_perbandingan_diri) * 1.0 / SUM(jumlah_mental) AS Perbandingan_Diri
+            FROM ringkasan_responden
+            GROUP BY status_hubungan
+            HAVING SUM(jumlah_mental) > 0
+            ORDER BY SUM(sum_depresi) * 1.0 / SUM(jumlah_mental) DESC
+            """
+        }
+    
+    def get_status_comparison_data(self) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """
+        Get all data required for Relationship Status Comparison (Donut Chart, Detail Table)
+        
+        Returns:
+            Tuple of (depression_df, detail_df)
+        """
+        results = self._aggregate_results(self._status_comparison_queries(),
+                                          self._status_comparison_summary_queries(),
+                                          name='get_status_comparison_data')
+        return results['depression'], results['detail']
+    
+    def get_demographic_data(self) -> Tuple[Optional[pd.DataFrame], ...]:
+        """
+        Get gender and relationship status comparison data in a single round-trip
         
-        return depression_df, detail_df
+        Returns:
+            Tuple of (metrics_df, radar_df, favorit_df, depression_df, detail_df)
+        """
+        queries = self._gender_comparison_queries()
+        queries.update(self._status_comparison_queries())
+        summary_queries = self._gender_comparison_summary_queries()
+        summary_queries.update(self._status_comparison_summary_queries())
+        results = self._aggregate_results(queries, summary_queries, name='get_demographic_data')
+        return (results['metrics'], results['radar'], results['favorit'],
+                results['depression'], results['detail'])
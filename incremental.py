@@ -0,0 +1,278 @@
+"""
+Incremental Module
+Append-only refresh of cached results using per-table high-water marks
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+# Table -> (after, upto) primary key range of the appended rows
+Ranges = Dict[str, Tuple[int, int]]
+
+
+class IncrementalDataset:
+    """
+    Cached result advanced by fetching only the rows appended since the last load
+
+    Every refresh probes the watermarks of ``tables`` (see
+    Database.get_table_watermarks). When nothing moved the cached state is
+    returned as is; when only new keys appeared, ``delta_loader`` fetches
+    the key ranges above the old marks and ``merge`` folds them in. A full
+    reload through ``full_loader`` happens only if a table saw an UPDATE or
+    DELETE, or if the insert counter moved by a different amount than the
+    number of rows found above the mark (a delete without versi_data, or a
+    row that committed late below the mark).
+
+    Loaders run after the probe, so they may see rows above the new marks;
+    ``merge`` must therefore be idempotent for rows it already holds.
+    """
+
+    def __init__(self, db, tables: Sequence[str],
+                 full_loader: Callable[[Optional[Dict[str, int]]], object],
+                 delta_loader: Callable[[Ranges], object],
+                 merge: Callable[[object, object], object]):
+        """
+        Initialize the dataset (nothing is loaded yet)
+
+        Args:
+            db: Database instance
+            tables: Tables the result depends on (keys of TABLE_KEYS)
+            full_loader: Callable(upto marks or None) returning the full state
+            delta_loader: Callable(ranges) returning the appended part, or None on error
+            merge: Callable(state, delta) returning the new state
+        """
+        self.db = db
+        self.tables = tuple(tables)
+        self.full_loader = full_loader
+        self.delta_loader = delta_loader
+        self.merge = merge
+
+        self.state = None
+        self.marks = None
+        self.full_loads = 0
+        self.delta_loads = 0
+        self.rows_appended = 0
+        self._lock = threading.Lock()
+
+    def _needs_full_reload(self, marks: Dict[str, dict]) -> bool:
+        """Check whether anything other than appends happened since the last marks"""
+        for table in self.tables:
+            old, new = self.marks.get(table), marks.get(table)
+            if old is None or new is None:
+                return True
+            if new['mutations'] != old['mutations'] or new['max_id'] < old['max_id']:
+                return True
+            if new['inserted'] - old['inserted'] != new['new_rows']:
+                return True
+        return False
+
+    def _load_full(self, marks: Optional[Dict[str, dict]]):
+        upto = None if marks is None else {table: mark['max_id'] for table, mark in marks.items()}
+        self.state = self.full_loader(upto)
+        self.marks = marks if self.state is not None else None
+        self.full_loads += 1
+
+    def refresh(self):
+        """
+        Bring the cached state up to date
+
+        Returns:
+            Current state (None if loading failed)
+        """
+        with self._lock:
+            since = None
+            if self.marks is not None:
+                since = {table: mark['max_id'] for table, mark in self.marks.items()}
+            marks = self.db.get_table_watermarks(self.tables, since)
+
+            if marks is None or self.state is None or self.marks is None or self._needs_full_reload(marks):
+                self._load_full(marks)
+                return self.state
+
+            ranges = {
+                table: (self.marks[table]['max_id'], marks[table]['max_id'])
+                for table in self.tables if marks[table]['new_rows'] > 0
+            }
+            if ranges:
+                delta = self.delta_loader(ranges)
+                if delta is None:
+                    self._load_full(marks)
+                    return self.state
+                self.state = self.merge(self.state, delta)
+                self.delta_loads += 1
+                self.rows_appended += sum(marks[table]['new_rows'] for table in ranges)
+            self.marks = marks
+            return self.state
+
+    def reset(self):
+        """Drop the cached state so the next refresh does a full reload"""
+        with self._lock:
+            self.state = None
+            self.marks = None
+
+    def stats(self) -> dict:
+        """
+        Refresh counters
+
+        Returns:
+            Dictionary with full_loads, delta_loads and rows_appended
+        """
+        return {
+            'full_loads': self.full_loads,
+            'delta_loads': self.delta_loads,
+            'rows_appended': self.rows_appended,
+        }
+
+
+# ================================================================
+# MERGE HELPERS
+# ================================================================
+
+def _align_dtypes(delta: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame:
+    """Cast delta columns to the dtypes of the cached frame where possible"""
+    for column in delta.columns.intersection(like.columns):
+        if delta[column].dtype != like[column].dtype:
+            try:
+                delta[column] = delta[column].astype(like[column].dtype)
+            except (TypeError, ValueError):
+                pass
+    return delta
+
+
+def merge_frames(frame: pd.DataFrame, delta: pd.DataFrame, replace_on: str,
+                 sort_by: Sequence[str]) -> pd.DataFrame:
+    """
+    Merge appended rows into a cached frame, keeping the query's ORDER BY
+
+    Rows of ``frame`` whose ``replace_on`` value occurs in ``delta`` are
+    replaced. When every new value sorts after the cached ones (the usual
+    append case) the rows are simply appended; otherwise the result is
+    re-sorted.
+
+    Args:
+        frame: Cached frame
+        delta: Newly fetched rows with the same columns
+        replace_on: Column identifying the rows a delta row supersedes
+        sort_by: ORDER BY columns of the query
+
+    Returns:
+        New merged DataFrame
+    """
+    if delta is None or delta.empty:
+        return frame
+    delta = _align_dtypes(delta.copy(), frame)
+    kept = frame[~frame[replace_on].isin(delta[replace_on].unique())]
+    appended_after = kept.empty or delta[sort_by[0]].min() > kept[sort_by[0]].max()
+    merged = pd.concat([kept, delta], ignore_index=True)
+    if not appended_after:
+        merged = merged.sort_values(list(sort_by), kind='mergesort', na_position='first',
+                                    ignore_index=True)
+    return merged
+
+
+# ================================================================
+# DASHBOARD DATASETS
+# ================================================================
+
+def usage_dataset(db, full_loader: Optional[Callable[[], pd.DataFrame]] = None,
+                  fetch_mode: str = 'pandas') -> IncrementalDataset:
+    """
+    Incremental get_all_usage_data() (Ikhsyan page)
+
+    Args:
+        db: Database instance
+        full_loader: Callable returning the full frame (e.g. from a snapshot);
+            defaults to db.get_all_usage_data
+        fetch_mode: 'pandas' or 'arrow' for the database queries
+
+    Returns:
+        IncrementalDataset whose state is the usage DataFrame
+    """
+    full_loader = full_loader or (lambda: db.get_all_usage_data(fetch_mode=fetch_mode))
+
+    def delta_loader(ranges):
+        if 'penggunaan_per_platform' not in ranges:
+            # Responden/platform baru tanpa baris penggunaan tidak mengubah hasil JOIN
+            return pd.DataFrame()
+        return db.get_all_usage_data(fetch_mode=fetch_mode,
+                                     id_range=ranges['penggunaan_per_platform'])
+
+    return IncrementalDataset(
+        db, ('responden', 'master_platform', 'penggunaan_per_platform'),
+        full_loader=lambda upto: full_loader(),
+        delta_loader=delta_loader,
+        merge=lambda frame, delta: merge_frames(frame, delta, 'id_penggunaan',
+                                                ('id_responden', 'nama_platform')),
+    )
+
+
+def master_dataset(db, full_loader: Optional[Callable[[], pd.DataFrame]] = None,
+                   fetch_mode: str = 'pandas') -> IncrementalDataset:
+    """
+    Incremental get_master_dataframe() (Nabil page)
+
+    Appended rows are mapped to the respondents they belong to, and those
+    respondents' rows are re-fetched and replaced as a whole.
+
+    Args:
+        db: Database instance
+        full_loader: Callable returning the full frame (e.g. from a snapshot);
+            defaults to db.get_master_dataframe
+        fetch_mode: 'pandas' or 'arrow' for the database queries
+
+    Returns:
+        IncrementalDataset whose state is the master DataFrame
+    """
+    full_loader = full_loader or (lambda: db.get_master_dataframe(fetch_mode=fetch_mode))
+    return IncrementalDataset(
+        db, ('responden', 'penggunaan_per_platform', 'master_platform', 'kesehatan_mental'),
+        full_loader=lambda upto: full_loader(),
+        delta_loader=lambda ranges: db.get_master_rows_for_appends(ranges, fetch_mode=fetch_mode),
+        merge=lambda frame, delta: merge_frames(frame, delta, 'id_responden',
+                                                ('id_responden', 'nama_platform')),
+    )
+
+
+def home_dataset(db) -> IncrementalDataset:
+    """
+    Incremental get_home_totals() (Home page)
+
+    The state is (totals, respondents). The full load is bounded by the
+    probed marks so appended totals are never counted twice.
+
+    Args:
+        db: Database instance
+
+    Returns:
+        IncrementalDataset whose state is a (totals dict, respondents DataFrame) tuple
+    """
+    additive = ('responden', 'penggunaan', 'total_jam', 'mental', 'total_mental')
+
+    def full_loader(upto):
+        ranges = None if upto is None else {table: (0, max_id) for table, max_id in upto.items()}
+        totals, respondents = db.get_home_totals(ranges)
+        return None if totals is None else (totals, respondents)
+
+    def delta_loader(ranges):
+        # Tabel tanpa baris baru mendapat rentang kosong (bukan "semua baris")
+        ranges = {table: ranges.get(table, (0, 0))
+                  for table in ('responden', 'penggunaan_per_platform', 'kesehatan_mental')}
+        totals, respondents = db.get_home_totals(ranges)
+        return None if totals is None else (totals, respondents)
+
+    def merge(state, delta):
+        totals, respondents = state
+        delta_totals, delta_respondents = delta
+        merged = {key: totals[key] + delta_totals[key] for key in additive}
+        merged['platform'] = delta_totals['platform']
+        return merged, merge_frames(respondents, delta_respondents, 'id_responden', ('id_responden',))
+
+    return IncrementalDataset(
+        db, ('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental'),
+        full_loader=full_loader,
+        delta_loader=delta_loader,
+        merge=merge,
+    )
@@ -0,0 +1,249 @@
+"""
+Index Advisor Module
+EXPLAIN-based scan report and covering-index migrations for the dashboard queries
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from database import Database
+from query_stats import plan_warnings
+
+
+# Composite indexes proposed for the dashboard joins and aggregates. Each
+# one covers the columns a query reads from its table, so the join is
+# answered from the index without looking up the row.
+INDEX_MIGRATIONS = [
+    {
+        'name': 'idx_penggunaan_covering',
+        'table': 'penggunaan_per_platform',
+        'columns': ('id_responden', 'id_platform', 'jam_per_hari', 'frekuensi_buka_per_hari'),
+        'reason': "Join ke responden/master_platform plus agregat jam dan frekuensi tanpa lookup baris",
+    },
+    {
+        'name': 'idx_penggunaan_platform_covering',
+        'table': 'penggunaan_per_platform',
+        'columns': ('id_platform', 'id_responden', 'jam_per_hari', 'frekuensi_buka_per_hari'),
+        'reason': "Agregat per platform (GROUP BY id_platform) dibaca urut dari index",
+    },
+    {
+        'name': 'idx_responden_demografi',
+        'table': 'responden',
+        'columns': ('jenis_kelamin', 'status_hubungan', 'id_responden'),
+        'reason': "Perbandingan gender/status dan filter Data Mentah tanpa scan tabel responden",
+    },
+]
+
+# Database calls whose statements are profiled: (method, args). Summary
+# tables are disabled while profiling, so the aggregates hit the base tables.
+PROFILED_CALLS = [
+    ('get_home_data', ()),
+    ('get_demographic_data', ()),
+    ('get_all_usage_data', ()),
+    ('get_all_mental_health_data', ()),
+    ('get_master_dataframe', ()),
+    ('get_master_dataframe', ('pandas', Database.respondent_filter(genders=['Perempuan'],
+                                                                    statuses=['Kawin']))),
+    ('get_respondents_page', ()),
+    ('get_respondent_count', ()),
+    ('get_respondent_detail', (1,)),
+    ('get_table_page', ('penggunaan', None, 'jam_per_hari')),
+    ('get_table_page', ('kesehatan_mental', None, 'depresi', True)),
+]
+
+
+def _profiling_database(db: Database) -> Database:
+    """Separate Database (own pool and stats) on the same server or backend"""
+    return Database(host=db.host, user=db.user, password=db.password, database=db.database,
+                    pool_size=1, compact_dtypes=bool(db.dtype_map), backend=db.backend,
+                    slow_query_threshold=float('inf'),
+                    statement_cache_size=db.statement_cache_size,
+                    use_summary_tables=False)
+
+
+def profile_queries(db: Database, repeat: int = 3) -> pd.DataFrame:
+    """
+    Time every profiled statement and check its EXPLAIN plan
+
+    Args:
+        db: Database to profile (its own pool and query stats are not touched)
+        repeat: Number of runs averaged per statement
+
+    Returns:
+        DataFrame with name, avg_ms, rows, warnings (list of plan warnings)
+        and sql per statement, slowest first
+    """
+    profiler = _profiling_database(db)
+    try:
+        for _ in range(repeat):
+            for method, args in PROFILED_CALLS:
+                getattr(profiler, method)(*args)
+        records = []
+        for row in profiler.query_stats.summary().itertuples(index=False):
+            sql, params = profiler.query_stats.last_query(row.name)
+            plan = profiler.explain(sql, params)
+            records.append({
+                'name': row.name,
+                'avg_ms': row.avg_time * 1000,
+                'rows': row.avg_rows,
+                'warnings': plan_warnings(plan) if plan is not None else ["EXPLAIN gagal"],
+                'sql': ' '.join(sql.split()),
+            })
+    finally:
+        profiler.disconnect()
+    return pd.DataFrame.from_records(records, columns=['name', 'avg_ms', 'rows', 'warnings', 'sql'])
+
+
+def _covered(columns: Sequence[str], indexes: Optional[pd.DataFrame], table: str) -> Optional[str]:
+    """Name of an existing index of the table that starts with the columns, if any"""
+    if indexes is None:
+        return None
+    for index in indexes[indexes['table_name'] == table].itertuples(index=False):
+        if list(index.columns[:len(columns)]) == list(columns):
+            return index.index_name
+    return None
+
+
+def propose_migrations(db: Database) -> pd.DataFrame:
+    """
+    Check which INDEX_MIGRATIONS are not yet covered by an existing index
+
+    Args:
+        db: Database
+
+    Returns:
+        DataFrame with name, table, columns, reason, existing (covering
+        index name or None) and pending (True if the migration is needed)
+    """
+    indexes = db.get_indexes()
+    records = []
+    for migration in INDEX_MIGRATIONS:
+        existing = _covered(migration['columns'], indexes, migration['table'])
+        records.append({
+            'name': migration['name'],
+            'table': migration['table'],
+            'columns': ", ".join(migration['columns']),
+            'reason': migration['reason'],
+            'existing': existing,
+            'pending': indexes is not None and existing is None,
+        })
+    return pd.DataFrame.from_records(
+        records, columns=['name', 'table', 'columns', 'reason', 'existing', 'pending'])
+
+
+def apply_migrations(db: Database, names: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Create the pending covering indexes
+
+    Args:
+        db: Database
+        names: Migrations to apply (None = every pending one)
+
+    Returns:
+        Names of the indexes created
+    """
+    proposals = propose_migrations(db)
+    applied = []
+    for migration in INDEX_MIGRATIONS:
+        pending = proposals.loc[proposals['name'] == migration['name'], 'pending'].iloc[0]
+        if not pending or (names is not None and migration['name'] not in names):
+            continue
+        if db.create_index(migration['table'], migration['name'], migration['columns']):
+            applied.append(migration['name'])
+    return applied
+
+
+def revert_migrations(db: Database, names: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Drop indexes created by apply_migrations()
+
+    Args:
+        db: Database
+        names: Migrations to revert (None = all of them)
+
+    Returns:
+        Names of the indexes dropped
+    """
+    indexes = db.get_indexes()
+    if indexes is None:
+        return []
+    reverted = []
+    for migration in INDEX_MIGRATIONS:
+        if names is not None and migration['name'] not in names:
+            continue
+        exists = ((indexes['table_name'] == migration['table'])
+                  & (indexes['index_name'] == migration['name'])).any()
+        if exists and db.drop_index(migration['table'], migration['name']):
+            reverted.append(migration['name'])
+    return reverted
+
+
+def compare_profiles(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Join two profile_queries() results into a before/after report
+
+    Args:
+        before: Profile taken before the migrations
+        after: Profile taken after the migrations
+
+    Returns:
+        DataFrame with name, before_ms, after_ms, speedup and the plan
+        warnings before and after, per statement
+    """
+    report = before[['name', 'avg_ms', 'warnings']].merge(
+        after[['name', 'avg_ms', 'warnings']], on='name', how='outer', suffixes=('_before', '_after'))
+    report = report.rename(columns={'avg_ms_before': 'before_ms', 'avg_ms_after': 'after_ms'})
+    report['speedup'] = report['before_ms'] / report['after_ms']
+    return report[['name', 'before_ms', 'after_ms', 'speedup', 'warnings_before', 'warnings_after']]
+
+
+def run_advisor(db: Database, apply: bool = False, repeat: int = 3) -> Dict[str, object]:
+    """
+    Profile the dashboard queries, optionally apply the migrations and re-profile
+
+    Args:
+        db: Database
+        apply: Create the pending covering indexes and time the queries again
+        repeat: Number of runs averaged per statement
+
+    Returns:
+        Dictionary with 'before' (profile), 'migrations' (proposals before
+        applying), 'applied' (created index names) and, if applied,
+        'after' (profile) and 'comparison' (compare_profiles() report)
+    """
+    report: Dict[str, object] = {
+        'before': profile_queries(db, repeat),
+        'migrations': propose_migrations(db),
+        'applied': [],
+    }
+    if apply:
+        report['applied'] = apply_migrations(db)
+        report['after'] = profile_queries(db, repeat)
+        report['comparison'] = compare_profiles(report['before'], report['after'])
+    return report
+
+
+def format_report(report: Dict[str, object]) -> List[Tuple[str, pd.DataFrame]]:
+    """
+    Display-ready tables of a run_advisor() report
+
+    Args:
+        report: Result of run_advisor()
+
+    Returns:
+        List of (title, DataFrame) with warnings joined into text
+    """
+    def joined(df, columns):
+        df = df.copy()
+        for column in columns:
+            df[column] = df[column].map(lambda warnings: "; ".join(warnings)
+                                        if isinstance(warnings, list) else "")
+        return df
+
+    tables = [("Profil query", joined(report['before'], ['warnings'])),
+              ("Migrasi index", report['migrations'])]
+    if 'comparison' in report:
+        tables.append(("Sebelum / sesudah",
+                       joined(report['comparison'], ['warnings_before', 'warnings_after'])))
+    return tables
@@ -0,0 +1,345 @@
+"""
+Ingest Module
+Bulk loader for new survey waves (responden, penggunaan_per_platform, kesehatan_mental)
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from database import Database, MENTAL_ATTRIBUTES
+from schema import parse_schema
+
+
+# Wave-local respondent key linking the usage and mental files to the
+# respondents file (replaced by the new id_responden on load)
+KEY_COLUMN = 'kode_responden'
+
+RESPONDENT_COLUMNS = ('nama', 'usia', 'jenis_kelamin', 'status_hubungan', 'pekerjaan', 'menggunakan_medsos')
+USAGE_COLUMNS = ('id_platform', 'jam_per_hari', 'tujuan_penggunaan', 'frekuensi_buka_per_hari')
+MENTAL_COLUMNS = MENTAL_ATTRIBUTES
+
+# Value ranges not expressed in the column types
+SCORE_RANGE = (1, 5)
+HOURS_RANGE = (0.1, 24.0)
+
+
+def read_table(source) -> pd.DataFrame:
+    """
+    Read one input file
+
+    Args:
+        source: Path or file-like object (e.g. a Streamlit upload) of a
+            .csv or .parquet file, or a DataFrame (used as is)
+
+    Returns:
+        DataFrame with the source row number (1-based) in a ``baris`` column
+    """
+    if isinstance(source, pd.DataFrame):
+        df = source.copy()
+    else:
+        name = str(getattr(source, 'name', source)).lower()
+        if name.endswith(('.parquet', '.pq')):
+            df = pd.read_parquet(source)
+        else:
+            df = pd.read_csv(source)
+    df.columns = [str(column).strip() for column in df.columns]
+    df['baris'] = np.arange(1, len(df) + 1)
+    return df.reset_index(drop=True)
+
+
+def _schema_types(schema) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """(table, column) -> (sql_type, type_arguments)"""
+    return {(table, column): (sql_type, args)
+            for table, columns in schema.items() for column, sql_type, args in columns}
+
+
+def _enum_values(args: str) -> List[str]:
+    return [value.strip("'").replace("''", "'") for value in args.split("','")]
+
+
+class _Rejections:
+    """Collects rejected rows (first failing check per row)"""
+
+    def __init__(self):
+        self.frames = []
+
+    def drop(self, table: str, df: pd.DataFrame, bad: pd.Series, reason: str) -> pd.DataFrame:
+        bad = bad.fillna(False).astype(bool)
+        if bad.any():
+            rejected = df.loc[bad, ['baris']].copy()
+            rejected.insert(0, 'tabel', table)
+            rejected['kode_responden'] = df.loc[bad, KEY_COLUMN] if KEY_COLUMN in df else None
+            rejected['alasan'] = reason
+            self.frames.append(rejected)
+        return df.loc[~bad]
+
+    def frame(self) -> pd.DataFrame:
+        columns = ['tabel', 'baris', 'kode_responden', 'alasan']
+        if not self.frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(self.frames, ignore_index=True)[columns]
+
+
+def _require(df: pd.DataFrame, columns: Sequence[str], table: str):
+    missing = [column for column in columns if column not in df]
+    if missing:
+        raise ValueError(f"Missing columns for {table}: {missing}")
+
+
+def _integral(values: pd.Series, low, high) -> pd.Series:
+    """True where a numeric value is a whole number within [low, high]"""
+    return values.notna() & (values == values.round()) & values.between(low, high)
+
+
+def _check_enum(rejections: _Rejections, table: str, df: pd.DataFrame, column: str,
+                types) -> pd.DataFrame:
+    """Drop rows with an unknown ENUM value, normalizing case like a _ci collation"""
+    allowed = {value.lower(): value for value in _enum_values(types[(table, column)][1])}
+    canonical = df[column].astype('string').str.strip().str.lower().map(allowed)
+    df = df.assign(**{column: canonical})
+    return rejections.drop(table, df, df[column].isna(),
+                           f"{column} harus salah satu dari {list(allowed.values())}")
+
+
+def validate_wave(respondents: pd.DataFrame, usage: Optional[pd.DataFrame] = None,
+                  mental: Optional[pd.DataFrame] = None, platforms: Optional[pd.DataFrame] = None,
+                  usia_range: Tuple[int, int] = (1, 120),
+                  create_platforms: bool = False) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame, List[str]]:
+    """
+    Validate a survey wave in vectorized form
+
+    Every check runs on whole columns. A failing row is rejected (with the
+    first failing check as reason) instead of aborting the wave; usage and
+    mental rows of rejected respondents are rejected too.
+
+    Args:
+        respondents: kode_responden plus RESPONDENT_COLUMNS (menggunakan_medsos
+            defaults to 'Ya', nama is optional)
+        usage: kode_responden, nama_platform (or id_platform), jam_per_hari,
+            tujuan_penggunaan, frekuensi_buka_per_hari
+        mental: kode_responden plus the ten 1-5 scores
+        platforms: Existing master_platform rows (id_platform, nama_platform)
+        usia_range: Accepted ages (inclusive)
+        create_platforms: Keep usage rows of unknown platform names (the
+            names are returned for insertion) instead of rejecting them
+
+    Returns:
+        Tuple of (table -> valid rows, rejected rows, new platform names).
+        Usage rows of new platforms have id_platform NaN and keep nama_platform.
+    """
+    types = _schema_types(parse_schema())
+    rejections = _Rejections()
+    platforms = platforms if platforms is not None else pd.DataFrame(columns=['id_platform', 'nama_platform'])
+
+    # Responden
+    table = 'responden'
+    df = respondents.copy()
+    if 'menggunakan_medsos' not in df:
+        df['menggunakan_medsos'] = 'Ya'
+    df['menggunakan_medsos'] = df['menggunakan_medsos'].fillna('Ya')
+    if 'nama' not in df:
+        df['nama'] = None
+    _require(df, (KEY_COLUMN, *RESPONDENT_COLUMNS), table)
+    df = rejections.drop(table, df, df[KEY_COLUMN].isna(), f"{KEY_COLUMN} kosong")
+    df = rejections.drop(table, df, df[KEY_COLUMN].duplicated(), f"{KEY_COLUMN} duplikat")
+    nama = df['nama'].astype('string').str.strip()
+    df = df.assign(nama=nama.where(nama != ''))
+    max_nama = int(types[(table, 'nama')][1])
+    df = rejections.drop(table, df, df['nama'].str.len() > max_nama,
+                         f"nama lebih dari {max_nama} karakter")
+    df = df.assign(usia=pd.to_numeric(df['usia'], errors='coerce'))
+    df = rejections.drop(table, df, ~_integral(df['usia'], *usia_range),
+                         f"usia harus bilangan bulat {usia_range[0]}-{usia_range[1]}")
+    for column in ('jenis_kelamin', 'status_hubungan', 'pekerjaan', 'menggunakan_medsos'):
+        df = _check_enum(rejections, table, df, column, types)
+    valid = {table: df.astype({'usia': 'int64'})}
+    keys = set(df[KEY_COLUMN])
+    new_platforms: List[str] = []
+
+    # Penggunaan per platform
+    table = 'penggunaan_per_platform'
+    if usage is not None:
+        df = usage.copy()
+        _require(df, (KEY_COLUMN, 'jam_per_hari', 'tujuan_penggunaan', 'frekuensi_buka_per_hari'), table)
+        df = rejections.drop(table, df, ~df[KEY_COLUMN].isin(keys), "responden tidak ada atau ditolak")
+        if 'nama_platform' in df:
+            by_name = {str(name).strip().lower(): platform_id for platform_id, name
+                       in zip(platforms['id_platform'], platforms['nama_platform'])}
+            names = df['nama_platform'].astype('string').str.strip()
+            df = df.assign(nama_platform=names, id_platform=names.str.lower().map(by_name).astype('float'))
+            unknown = df['id_platform'].isna() & df['nama_platform'].notna() & (df['nama_platform'] != '')
+            max_name = int(types[('master_platform', 'nama_platform')][1])
+            if create_platforms:
+                df = rejections.drop(table, df, unknown & (df['nama_platform'].str.len() > max_name),
+                                     f"nama_platform lebih dari {max_name} karakter")
+                unknown = df['id_platform'].isna() & df['nama_platform'].notna() & (df['nama_platform'] != '')
+                new_platforms = list(dict.fromkeys(df.loc[unknown, 'nama_platform'].tolist()))
+                df = rejections.drop(table, df, df['id_platform'].isna() & ~unknown, "platform kosong")
+            else:
+                df = rejections.drop(table, df, df['id_platform'].isna(), "platform tidak dikenal")
+        else:
+            _require(df, ('id_platform',), table)
+            df = df.assign(id_platform=pd.to_numeric(df['id_platform'], errors='coerce'))
+            df = rejections.drop(table, df, ~df['id_platform'].isin(platforms['id_platform']),
+                                 "id_platform tidak ada di master_platform")
+        df = df.assign(jam_per_hari=pd.to_numeric(df['jam_per_hari'], errors='coerce').round(1))
+        df = rejections.drop(table, df, ~df['jam_per_hari'].between(*HOURS_RANGE),
+                             f"jam_per_hari harus {HOURS_RANGE[0]}-{HOURS_RANGE[1]}")
+        df = df.assign(frekuensi_buka_per_hari=pd.to_numeric(df['frekuensi_buka_per_hari'], errors='coerce'))
+        df = rejections.drop(table, df, ~_integral(df['frekuensi_buka_per_hari'], 0, 127),
+                             "frekuensi_buka_per_hari harus bilangan bulat 0-127")
+        df = _check_enum(rejections, table, df, 'tujuan_penggunaan', types)
+        platform_key = df['id_platform'].fillna(df.get('nama_platform', pd.Series(dtype='string')))
+        df = rejections.drop(table, df, pd.Series(list(zip(df[KEY_COLUMN], platform_key)),
+                                                  index=df.index).duplicated(),
+                             "platform yang sama dua kali untuk satu responden")
+        valid[table] = df.astype({'frekuensi_buka_per_hari': 'int64'})
+
+    # Kesehatan mental
+    table = 'kesehatan_mental'
+    if mental is not None:
+        df = mental.copy()
+        _require(df, (KEY_COLUMN, *MENTAL_COLUMNS), table)
+        df = rejections.drop(table, df, ~df[KEY_COLUMN].isin(keys), "responden tidak ada atau ditolak")
+        df = rejections.drop(table, df, df[KEY_COLUMN].duplicated(), "lebih dari satu baris per responden")
+        scores = df[list(MENTAL_COLUMNS)].apply(pd.to_numeric, errors='coerce')
+        out_of_range = ~scores.apply(lambda column: _integral(column, *SCORE_RANGE)).all(axis=1)
+        df = df.assign(**{column: scores[column] for column in MENTAL_COLUMNS})
+        df = rejections.drop(table, df, out_of_range,
+                             f"skor harus bilangan bulat {SCORE_RANGE[0]}-{SCORE_RANGE[1]}")
+        valid[table] = df.astype({column: 'int64' for column in MENTAL_COLUMNS})
+
+    return valid, rejections.frame(), new_platforms
+
+
+def _rows(df: pd.DataFrame, columns: Sequence[str]) -> List[tuple]:
+    """Row tuples of Python values (NaN/NA -> None) for executemany"""
+    values = []
+    for column in columns:
+        series = df[column]
+        values.append([None if pd.isna(value) else value for value in series.tolist()])
+    return list(zip(*values))
+
+
+def ingest_wave(db: Database, respondents, usage=None, mental=None, batch_size: int = 5000,
+                method: str = 'executemany', defer_checks: bool = True,
+                create_platforms: bool = False, usia_range: Tuple[int, int] = (1, 120)) -> dict:
+    """
+    Validate and load a survey wave
+
+    Respondents get new ids above the current maximum. Each transaction
+    holds ``batch_size`` respondents together with their usage and mental
+    rows, so a failure never leaves a respondent half loaded; the load
+    stops at the first failing transaction.
+
+    Foreign key and unique checks are deferred (``defer_checks``) because
+    every reference and key was validated beforehand: new respondent ids
+    cannot collide, platforms come from master_platform. A concurrent
+    insert into responden or a deleted platform makes the failing batch
+    roll back with a duplicate key or stays an orphan row respectively,
+    so keep defer_checks off while other writers are active.
+
+    Args:
+        db: Database
+        respondents: Respondents file (see read_table() and validate_wave())
+        usage: Usage file, optional
+        mental: Mental health file, optional
+        batch_size: Respondents per transaction
+        method: 'executemany' or 'load_data' (see Database.bulk_insert())
+        defer_checks: Turn off FK/unique checks while loading
+        create_platforms: Add unknown platform names to master_platform
+        usia_range: Accepted ages (inclusive)
+
+    Returns:
+        Report dict: rows (per table), rejected (DataFrame), new_platforms,
+        batches (rows and seconds per transaction), validation_seconds,
+        write_seconds, rows_per_sec, id_range (first, last new id_responden)
+        and error (None if every batch committed)
+    """
+    start = time.perf_counter()
+    frames = {
+        'responden': read_table(respondents),
+        'penggunaan_per_platform': read_table(usage) if usage is not None else None,
+        'kesehatan_mental': read_table(mental) if mental is not None else None,
+    }
+    platforms = db.get_all_platforms()
+    watermarks = db.get_table_watermarks(['responden', 'master_platform'])
+    report = {
+        'rows': {table: 0 for table in frames},
+        'rejected': None,
+        'new_platforms': [],
+        'batches': [],
+        'validation_seconds': 0.0,
+        'write_seconds': 0.0,
+        'rows_per_sec': 0.0,
+        'id_range': None,
+        'error': None,
+    }
+    if platforms is None or watermarks is None:
+        report['error'] = "Gagal membaca master_platform / high-water mark dari database"
+        return report
+
+    valid, report['rejected'], new_platforms = validate_wave(
+        frames['responden'], frames['penggunaan_per_platform'], frames['kesehatan_mental'],
+        platforms, usia_range=usia_range, create_platforms=create_platforms)
+    report['validation_seconds'] = time.perf_counter() - start
+
+    # Id baru di atas maksimum saat ini
+    write_start = time.perf_counter()
+    if new_platforms:
+        first_platform = watermarks['master_platform']['max_id'] + 1
+        platform_ids = dict(zip(new_platforms, range(first_platform, first_platform + len(new_platforms))))
+        if not db.bulk_insert([('master_platform', ('id_platform', 'nama_platform'),
+                                [(platform_id, name) for name, platform_id in platform_ids.items()])]):
+            report['error'] = "Gagal menambah platform baru"
+            return report
+        report['new_platforms'] = new_platforms
+        usage_df = valid['penggunaan_per_platform']
+        valid['penggunaan_per_platform'] = usage_df.assign(
+            id_platform=usage_df['id_platform'].fillna(usage_df['nama_platform'].map(platform_ids)))
+
+    responden = valid['responden']
+    first_id = watermarks['responden']['max_id'] + 1
+    ids = pd.Series(np.arange(first_id, first_id + len(responden)), index=responden[KEY_COLUMN].values)
+    responden = responden.assign(id_responden=ids.values)
+    children = {}
+    for table in ('penggunaan_per_platform', 'kesehatan_mental'):
+        df = valid.get(table)
+        if df is not None:
+            df = df.assign(id_responden=df[KEY_COLUMN].map(ids).astype('int64')).sort_values('id_responden')
+            if table == 'penggunaan_per_platform':
+                df = df.astype({'id_platform': 'int64'})
+            children[table] = df
+    columns = {
+        'responden': ('id_responden', *RESPONDENT_COLUMNS),
+        'penggunaan_per_platform': ('id_responden', *USAGE_COLUMNS),
+        'kesehatan_mental': ('id_responden', *MENTAL_COLUMNS),
+    }
+
+    for batch_start in range(0, len(responden), batch_size):
+        chunk = responden.iloc[batch_start:batch_start + batch_size]
+        low, high = int(chunk['id_responden'].iloc[0]), int(chunk['id_responden'].iloc[-1])
+        batches = [('responden', columns['responden'], _rows(chunk, columns['responden']))]
+        for table, df in children.items():
+            # Anak sudah diurutkan per id_responden: potong dengan searchsorted
+            ids_sorted = df['id_responden'].values
+            part = df.iloc[np.searchsorted(ids_sorted, low):np.searchsorted(ids_sorted, high, side='right')]
+            batches.append((table, columns[table], _rows(part, columns[table])))
+        batch_time = time.perf_counter()
+        if not db.bulk_insert(batches, defer_checks=defer_checks, method=method):
+            report['error'] = f"Batch id_responden {low}-{high} gagal dan di-rollback; batch sebelumnya sudah tersimpan"
+            break
+        rows = sum(len(batch_rows) for _, _, batch_rows in batches)
+        report['batches'].append({'id_responden': f"{low}-{high}", 'rows': rows,
+                                  'seconds': time.perf_counter() - batch_time})
+        for table, _, batch_rows in batches:
+            report['rows'][table] += len(batch_rows)
+        report['id_range'] = (first_id, high)
+
+    report['write_seconds'] = time.perf_counter() - write_start
+    total_rows = sum(report['rows'].values())
+    report['rows_per_sec'] = total_rows / report['write_seconds'] if report['write_seconds'] else 0.0
+    return report
@@ -0,0 +1,133 @@
+"""
+Local Engine Module
+In-process DuckDB engine answering aggregate queries from the cached master frame
+"""
+
+import threading
+from typing import Dict, Optional
+
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # duckdb opsional; tanpa duckdb query agregat tetap ke MySQL
+    duckdb = None
+
+
+# Base tables rebuilt as views over the master LEFT JOIN. master_platform
+# only lists platforms that have usage rows, which is all the inner joins
+# of the aggregate queries can see anyway.
+MASTER_VIEWS = {
+    'responden': """
+        SELECT DISTINCT id_responden, nama, usia, jenis_kelamin, status_hubungan,
+            pekerjaan, menggunakan_medsos
+        FROM master
+    """,
+    'master_platform': """
+        SELECT DISTINCT id_platform, nama_platform
+        FROM master
+        WHERE id_platform IS NOT NULL
+    """,
+    'penggunaan_per_platform': """
+        SELECT id_responden, id_platform, jam_per_hari, tujuan_penggunaan, frekuensi_buka_per_hari
+        FROM master
+        WHERE id_platform IS NOT NULL
+    """,
+    'kesehatan_mental': """
+        SELECT DISTINCT id_responden, gangguan_fokus, gelisah, kecemasan, kesulitan_konsentrasi,
+            perbandingan_diri, sentimen_posting, mencari_validasi, depresi, fluktuasi_minat, sulit_tidur
+        FROM master
+        WHERE gangguan_fokus IS NOT NULL
+    """,
+}
+
+
+class LocalEngine:
+    """
+    DuckDB connection over the cached master dataframe
+
+    The frame is registered without copying and exposed through views named
+    after the MySQL tables, so the existing aggregate SQL runs unchanged.
+    Results are only valid for the table versions the frame was loaded at;
+    Database checks is_fresh() before routing a query here.
+    """
+
+    tables = tuple(MASTER_VIEWS)
+
+    def __init__(self):
+        """Initialize the engine (an empty in-memory DuckDB database)"""
+        self.versions = None
+        self.queries_served = 0
+        self._lock = threading.Lock()
+        self._con = duckdb.connect(':memory:') if duckdb is not None else None
+
+    @property
+    def available(self) -> bool:
+        """True if duckdb is installed"""
+        return self._con is not None
+
+    def load(self, master: pd.DataFrame, versions) -> bool:
+        """
+        Register a master dataframe as the source of the table views
+
+        Args:
+            master: Output of Database.get_master_dataframe() (or its cached copy)
+            versions: Table versions the frame was loaded at (mapping or
+                (table, token) pairs), probed before the frame was loaded
+
+        Returns:
+            bool: True if registered
+        """
+        if not self.available or master is None:
+            return False
+        with self._lock:
+            try:
+                self._con.register('master', master)
+                for table, sql in MASTER_VIEWS.items():
+                    self._con.execute(f"CREATE OR REPLACE VIEW {table} AS {sql}")
+            except duckdb.Error as e:
+                print(f"Error loading local engine: {e}")
+                self.versions = None
+                return False
+            self.versions = dict(versions)
+        return True
+
+    def is_fresh(self, versions) -> bool:
+        """
+        Check whether the loaded frame matches the given table versions
+
+        Args:
+            versions: Current versions from Database.get_table_versions()
+
+        Returns:
+            bool: True if every table of the engine is unchanged
+        """
+        if self.versions is None or versions is None:
+            return False
+        versions = dict(versions)
+        return all(versions.get(table) == self.versions.get(table) for table in self.tables)
+
+    def execute_batch(self, queries: Dict[str, object]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Run named queries against the views
+
+        Args:
+            queries: Mapping of name -> SQL string or (SQL string, params)
+
+        Returns:
+            Dictionary of name -> DataFrame, or None if any query failed
+        """
+        if not self.available:
+            return None
+        results = {}
+        with self._lock:
+            try:
+                for name, spec in queries.items():
+                    query, params = spec if isinstance(spec, tuple) else (spec, None)
+                    query = query.strip().rstrip(';').replace('%s', '?')
+                    results[name] = self._con.execute(query, list(params or ())).df()
+            except duckdb.Error as e:
+                print(f"Error executing local query: {e}")
+                return None
+            self.queries_served += len(results)
+        return results
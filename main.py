@@ -3,11 +3,29 @@ Main Streamlit Dashboard Application
 Mental Health & Social Media Usage Analysis
 """
 
+import functools
+import threading
+import time
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+try:
+    from streamlit.runtime.scriptrunner_utils.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+except ImportError:  # Streamlit lama: modul context masih di dalam paket scriptrunner
+    from streamlit.runtime.scriptrunner.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from database import Database
+from database import Database, PAGED_TABLES
+from async_database import AsyncDatabase, AsyncRunner, INSTALL_HINT, async_available
+from sqlite_backend import SQLiteBackend
+from snapshot import SNAPSHOT_DATASETS, RedisSnapshotStore, SnapshotCache, SnapshotStore
+from incremental import home_dataset, usage_dataset, master_dataset
+from local_engine import LocalEngine
+from search import NameIndex
+from index_advisor import run_advisor, revert_migrations, format_report
+from ingest import ingest_wave, KEY_COLUMN as INGEST_KEY_COLUMN
+from analysis import (build_regression_frame, chunks_to_csv, regression_summary,
+                      respondent_options, usage_summary)
 from config import *
 
 # ================================================================
@@ -24,17 +42,39 @@ st.set_page_config(
 # 🚨 KRITIS: INITIALIZE AND CACHE DATABASE CONNECTION
 # ================================================================
 
-@st.cache_resource(ttl=DATA_CONFIG['cache_ttl'])
+@st.cache_resource
 def init_db():
     """
     Menginisialisasi dan mengetes koneksi database.
     CATATAN KRITIS: Tidak boleh ada pemanggilan Streamlit element di sini.
+    Satu instance Database (beserta connection pool-nya) dipakai bersama oleh
+    semua sesi; setiap query meminjam koneksi sendiri dari pool.
     """
+    backend = None
+    if DB_CONFIG.get('backend') == 'sqlite':
+        # Engine embedded dari dump: tanpa jaringan, untuk benchmark/uji offline
+        backend = SQLiteBackend(
+            dump_path=EMBEDDED_CONFIG['dump_path'],
+            database=DB_CONFIG['database'],
+            path=EMBEDDED_CONFIG['path']
+        )
     db = Database(
         host=DB_CONFIG['host'],
         user=DB_CONFIG['user'],
         password=DB_CONFIG['password'],
-        database=DB_CONFIG['database']
+        database=DB_CONFIG['database'],
+        pool_size=POOL_CONFIG['pool_size'],
+        checkout_timeout=POOL_CONFIG['checkout_timeout'],
+        max_idle_time=POOL_CONFIG['max_idle_time'],
+        max_lifetime=POOL_CONFIG['max_lifetime'],
+        statement_cache_size=POOL_CONFIG['statement_cache_size'],
+        batch_mode=POOL_CONFIG['batch_mode'],
+        parallel_workers=POOL_CONFIG['parallel_workers'],
+        backend=backend,
+        slow_query_threshold=DIAGNOSTICS_CONFIG['slow_query_threshold'],
+        allow_local_infile=INGEST_CONFIG['method'] == 'load_data',
+        result_cache_bytes=RESULT_CACHE_CONFIG['max_bytes'],
+        result_cache_ttl=RESULT_CACHE_CONFIG['ttl']
     )
     success, message = db.test_connection()
     return db, success, message
@@ -44,11 +84,106 @@ db, success, message = init_db()
 
 # Pindahkan penanganan UI/Error ke LUAR fungsi yang di-cache
 if not success:
+    # Jangan cache koneksi yang gagal agar rerun berikutnya mencoba lagi
+    db.disconnect()
+    init_db.clear()
     st.error(f"{ERROR_MESSAGES['db_connection']} Detail: {message}")
     st.stop()
 else:
     st.toast("✅ Koneksi database berhasil.", icon='💾')
 
+@st.cache_resource
+def init_snapshots(_db):
+    """
+    Menyiapkan snapshot kolumnar untuk hasil query besar, dipakai bersama
+    oleh semua proses server: hanya satu replika yang men-query database
+    saat tabel berubah, replika lain membaca snapshot-nya.
+    """
+    store = None
+    if SNAPSHOT_CONFIG['backend'] == 'redis':
+        store = RedisSnapshotStore(
+            url=SNAPSHOT_CONFIG['redis_url'],
+            prefix=SNAPSHOT_CONFIG['redis_prefix'],
+            ttl=SNAPSHOT_CONFIG['redis_ttl'],
+            lock_timeout=SNAPSHOT_CONFIG['lock_timeout']
+        )
+    if store is None or not store.available or not store.ping():
+        # Tanpa redis (atau server tidak bisa dihubungi): kembali ke snapshot file lokal
+        store = SnapshotStore(SNAPSHOT_CONFIG['directory'], SNAPSHOT_CONFIG['format'],
+                              lock_timeout=SNAPSHOT_CONFIG['lock_timeout'])
+    return SnapshotCache(_db, store)
+
+snapshots = init_snapshots(db)
+
+def load_dataset(name, **kwargs):
+    """Ambil dataset besar dari snapshot di disk (atau database jika tabel berubah)."""
+    if SNAPSHOT_CONFIG['enabled']:
+        return snapshots.get(name, **kwargs)
+    method_name, _ = SNAPSHOT_DATASETS[name]
+    return getattr(db, method_name)(**kwargs)
+
+@st.cache_resource
+def init_incremental(_db):
+    """
+    Dataset yang di-refresh secara incremental: hanya baris di atas
+    high-water mark tiap tabel yang diambil, full reload hanya jika ada
+    UPDATE/DELETE. Full load pertama tetap lewat snapshot di disk.
+    """
+    fetch_mode = DATA_CONFIG['fetch_mode']
+    return {
+        'home': home_dataset(_db),
+        'usage': usage_dataset(_db, lambda: load_dataset('usage', fetch_mode=fetch_mode), fetch_mode),
+        'master': master_dataset(_db, lambda: load_dataset('master', fetch_mode=fetch_mode), fetch_mode),
+    }
+
+incremental = init_incremental(db)
+
+@st.cache_resource
+def init_local_engine(_db):
+    """
+    Engine DuckDB in-process: query agregat demografi dijalankan di atas
+    master dataframe yang sudah di-cache (tanpa duckdb: tetap ke MySQL).
+    """
+    engine = LocalEngine()
+    if engine.available and DATA_CONFIG['local_aggregates']:
+        _db.attach_local_engine(engine)
+    return engine
+
+local_engine = init_local_engine(db)
+
+@st.cache_resource
+def init_async_db(_db):
+    """
+    Klien asyncio dengan pool sendiri, dijalankan di event loop thread
+    terpisah: loader yang butuh beberapa query independen menunggu query
+    paling lambat saja, bukan jumlah semuanya. (None, None) jika dimatikan
+    atau driver async (aiomysql) tidak terpasang.
+    """
+    if not DATA_CONFIG['async_loaders']:
+        return None, None
+    if not async_available(_db.backend):
+        print(f"Loader async nonaktif: driver aiomysql tidak terpasang ({INSTALL_HINT})")
+        return None, None
+    async_db = AsyncDatabase(
+        host=DB_CONFIG['host'],
+        user=DB_CONFIG['user'],
+        password=DB_CONFIG['password'],
+        database=DB_CONFIG['database'],
+        pool_size=POOL_CONFIG['pool_size'],
+        checkout_timeout=POOL_CONFIG['checkout_timeout'],
+        max_idle_time=POOL_CONFIG['max_idle_time'],
+        max_lifetime=POOL_CONFIG['max_lifetime'],
+        backend=_db.backend,
+        # Statistik query dan cache hasil digabung dengan Database
+        # (tampil di halaman Diagnostics, dikosongkan bersama saat data berubah)
+        query_stats=_db.query_stats,
+        result_cache=_db.result_cache
+    )
+    async_db.attach_local_engine(_db.local_engine)
+    return AsyncRunner(), async_db
+
+async_runner, async_db = init_async_db(db)
+
 # ================================================================
 # HELPER FUNCTIONS
 # ================================================================
@@ -58,34 +193,255 @@ def convert_df_to_csv(df):
     """Convert DataFrame to CSV for download"""
     return df.to_csv(index=False).encode('utf-8')
 
+def filter_choices(container, label, option_key):
+    """
+    Multiselect dari FILTER_CONFIG (tanpa opsi 'Semua').
+    
+    Returns:
+        Tuple nilai terpilih, atau None jika semua opsi dipilih (tanpa kondisi)
+    """
+    options = [option for option in FILTER_CONFIG[option_key] if option != 'Semua']
+    selected = container.multiselect(label, options=options, default=options)
+    return None if len(selected) == len(options) else tuple(selected)
+
+def page_navigation(cursors, next_cursor, total_pages, key):
+    """
+    Tombol sebelumnya/berikutnya untuk keyset pagination.
+    
+    Args:
+        cursors: List di session_state berisi posisi awal tiap halaman yang
+            sudah dilewati (elemen terakhir = halaman saat ini)
+        next_cursor: Posisi awal halaman berikutnya (None = halaman terakhir)
+        total_pages: Jumlah halaman (dari COUNT yang di-cache)
+        key: Prefix key widget
+    """
+    page_number = len(cursors)
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("⬅️ Sebelumnya", disabled=page_number == 1, key=f"{key}_prev"):
+            cursors.pop()
+            st.rerun()
+    with col_info:
+        st.markdown(f"<div style='text-align: center'>Halaman {page_number} dari {max(total_pages, page_number)}</div>",
+                    unsafe_allow_html=True)
+    with col_next:
+        if st.button("Berikutnya ➡️", disabled=next_cursor is None, key=f"{key}_next"):
+            cursors.append(next_cursor)
+            st.rerun()
+
+def paged_table(table, columns, labels=None, key='tabel'):
+    """
+    Tabel dengan keyset pagination: hanya halaman yang terlihat (dan kolom
+    yang dipilih) diambil dari database dan dikirim ke browser.
+    
+    Args:
+        table: Key dari PAGED_TABLES
+        columns: Kolom yang ditampilkan (proyeksi di SELECT)
+        labels: Mapping nama kolom -> label tampilan
+        key: Prefix key widget dan session_state
+    """
+    labels = labels or {}
+    sort_keys = list(PAGED_TABLES[table]['sort_keys'])
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    sort_by = col1.selectbox("Urutkan berdasarkan:", sort_keys,
+                             format_func=lambda column: labels.get(column, column), key=f"{key}_sort")
+    descending = col2.checkbox("Urutan menurun", key=f"{key}_desc")
+    page_size = col3.selectbox("Baris per halaman:", DATA_CONFIG['table_page_sizes'], key=f"{key}_size")
+    
+    # Posisi halaman di-reset jika urutan, ukuran halaman atau kolom berubah
+    state = st.session_state.setdefault(f"{key}_pages", {'signature': None, 'cursors': [None]})
+    signature = (sort_by, descending, page_size, tuple(columns))
+    if state['signature'] != signature:
+        state['signature'] = signature
+        state['cursors'] = [None]
+    cursors = state['cursors']
+    
+    df_page, next_cursor = load_table_page(table, tuple(columns), sort_by, descending,
+                                           cursors[-1], page_size)
+    if df_page is None:
+        st.error(ERROR_MESSAGES['no_data'])
+        return
+    
+    st.dataframe(df_page.rename(columns=labels), use_container_width=True, hide_index=True)
+    total = load_table_count(table) or 0
+    page_navigation(cursors, next_cursor, -(-total // page_size), key)
+
+# ----------------------------------------------------------------
+# CHANGE DETECTION
+# ----------------------------------------------------------------
+
+# Tabel yang dipantau versinya oleh probe
+TRACKED_TABLES = ('responden', 'penggunaan_per_platform', 'master_platform', 'kesehatan_mental')
+
+@st.cache_data(ttl=DATA_CONFIG['version_probe_interval'], show_spinner=False)
+def probe_table_versions():
+    """Cek versi tabel ke database (paling sering sekali per interval probe)."""
+    return db.get_table_versions(TRACKED_TABLES)
+
+def data_version(tables):
+    """Kunci versi untuk sekumpulan tabel, dipakai sebagai kunci cache loader."""
+    versions = probe_table_versions()
+    if versions is None:
+        # Probe gagal: kembali ke perilaku TTL lama
+        return ('ttl', int(time.time() // DATA_CONFIG['cache_ttl']))
+    return tuple((table, versions.get(table)) for table in sorted(tables))
+
+def depends_on(*tables, shared=False):
+    """
+    Decorator untuk loader: hasil di-cache tanpa TTL dan hanya diinvalidasi
+    jika salah satu tabel dependensinya berubah. Fungsi yang didekorasi
+    menerima `version` sebagai argumen pertama (diisi otomatis).
+    
+    shared=True memakai st.cache_resource: semua sesi menerima objek yang
+    sama tanpa pickle/salinan, jadi kolom Arrow tetap menunjuk ke snapshot
+    yang di-memory-map. Hanya satu versi disimpan; hasilnya harus
+    diperlakukan read-only oleh pemanggil.
+    
+    CATATAN: DELETE CASCADE dari responden/master_platform tidak memicu
+    trigger di tabel anak, jadi loader yang membaca tabel anak juga harus
+    bergantung pada tabel induknya.
+    """
+    def decorator(func):
+        if shared:
+            cached = st.cache_resource(max_entries=1, show_spinner=False)(func)
+        else:
+            cached = st.cache_data(max_entries=DATA_CONFIG['cache_max_entries'])(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            return cached(data_version(tables), *args)
+        
+        wrapper.tables = tables
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
 # ----------------------------------------------------------------
 # CACHED DATA LOADERS
 # ----------------------------------------------------------------
 
-@st.cache_data(ttl=DATA_CONFIG['cache_ttl'])
-def load_home_data():
-    """Memuat data untuk halaman Home."""
-    stats = db.get_summary_statistics()
-    df_responden = db.get_all_respondents()
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental')
+def load_home_data(version):
+    """Memuat data untuk halaman Home (satu round-trip ke database)."""
+    if DATA_CONFIG['incremental_refresh']:
+        state = incremental['home'].refresh()
+        if state is not None:
+            totals, df_responden = state
+            return db.summary_from_totals(totals), df_responden
+    stats, df_responden = db.get_home_data()
     return stats, df_responden
 
-@st.cache_data(ttl=DATA_CONFIG['cache_ttl'])
-def load_usage_data():
-    """Memuat data untuk halaman Ikhsyan."""
-    usage_data = db.get_all_usage_data()
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', shared=True)
+def load_usage_data(version):
+    """Memuat data untuk halaman Ikhsyan (dibagi antar sesi, read-only)."""
+    if DATA_CONFIG['incremental_refresh']:
+        return incremental['usage'].refresh()
+    usage_data = load_dataset('usage', fetch_mode=DATA_CONFIG['fetch_mode'])
     return usage_data
 
-@st.cache_data(ttl=DATA_CONFIG['cache_ttl'])
-def load_vera_data():
-    """Memuat data untuk halaman Vera."""
-    metrics_df, radar_df, favorit_df = db.get_gender_comparison_data()
-    depression_df, detail_df = db.get_status_comparison_data()
-    return metrics_df, radar_df, favorit_df, depression_df, detail_df
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental')
+def load_vera_data(version):
+    """
+    Memuat data untuk halaman Vera (satu round-trip, atau lima query
+    bersamaan jika klien async aktif).
+    Jika engine lokal aktif, master dataframe dimuat dulu sehingga query
+    agregat dijalankan in-process di atas data yang sama.
+    """
+    if db.local_engine is not None:
+        load_nabil_data()
+    if async_db is not None:
+        # Kelima query agregat berjalan bersamaan, masing-masing di koneksinya sendiri
+        return async_runner.run(async_db.get_demographic_data())
+    return db.get_demographic_data()
+
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental', shared=True)
+def load_nabil_data(version):
+    """Memuat master dataframe (dibagi antar sesi, read-only)."""
+    if DATA_CONFIG['incremental_refresh']:
+        df = incremental['master'].refresh()
+    else:
+        df = load_dataset('master', fetch_mode=DATA_CONFIG['fetch_mode'])
+    # Versi diprobe sebelum data dimuat, jadi engine lokal tidak pernah
+    # menganggap data lama sebagai segar
+    if db.local_engine is not None and version and isinstance(version[0], tuple):
+        local_engine.load(df, version)
+    return df
+
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental')
+def load_regression_data(version):
+    """
+    Memuat data regresi (satu baris per responden) untuk halaman Nazwa.
+    Master dataframe di-stream per chunk sehingga tidak pernah dimuat utuh.
+    """
+    return build_regression_frame(db.iter_master_dataframe(DATA_CONFIG['chunksize']))
 
-@st.cache_data(ttl=DATA_CONFIG['cache_ttl'])
-def load_nabil_data():
-    """Memuat data untuk halaman Nabil (Data Mentah)."""
-    return db.get_master_dataframe()
+@st.cache_resource(max_entries=2)
+def build_name_index(version):
+    """Index n-gram nama responden, dibangun sekali per versi tabel responden."""
+    return NameIndex.from_frame(db.get_respondent_names())
+
+def search_filter(term):
+    """
+    Kondisi pencarian nama untuk Database.respondent_filter: (search, ids).
+    Id dicari lewat index di memori dan dikirim sebagai IN (...) hanya jika
+    hasilnya sedikit; term pendek atau yang cocok dengan terlalu banyak nama
+    dikirim sebagai LIKE (MySQL membatasi 65.535 placeholder per statement,
+    dan tuple id ikut menjadi kunci cache).
+    """
+    term = term.strip()
+    if not term:
+        return None, None
+    if len(term) <= DATA_CONFIG['search_min_length']:
+        return term, None
+    max_ids = DATA_CONFIG['search_max_ids']
+    ids = build_name_index(data_version(('responden',))).search(term, limit=max_ids + 1)
+    if len(ids) > max_ids:
+        return term, None
+    return None, tuple(ids)
+
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental')
+def load_filtered_master(version, usia_range, genders, statuses, jobs, search, ids):
+    """Master dataframe yang difilter di database (di-cache per kombinasi filter)."""
+    filters = db.respondent_filter(usia_range, genders, statuses, jobs, search, ids)
+    return db.get_master_dataframe(DATA_CONFIG['fetch_mode'], filters)
+
+@depends_on('responden')
+def load_respondents_page(version, after_id, limit):
+    """Satu halaman kartu responden (keyset pagination, bukan seluruh tabel)."""
+    return db.get_respondents_page(after_id, limit)
+
+@depends_on('responden')
+def load_respondent_count(version):
+    """Jumlah responden untuk navigasi halaman."""
+    return db.get_respondent_count()
+
+@depends_on('responden', 'kesehatan_mental')
+def load_mental_health_data(version):
+    """
+    Data kesehatan mental dan jumlah responden untuk halaman Kesehatan Mental.
+    Tanpa snapshot di disk, kedua query dijalankan bersamaan lewat klien async.
+    """
+    if async_db is not None and not SNAPSHOT_CONFIG['enabled']:
+        df_mental, total_responden = async_runner.gather(
+            async_db.get_all_mental_health_data(), async_db.get_respondent_count())
+        return df_mental, total_responden
+    return load_dataset('mental_health'), load_respondent_count()
+
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental')
+def load_respondent_detail(version, id_responden):
+    """Detail satu responden, diambil per primary key saat 'Lihat Detail' diklik."""
+    return db.get_respondent_detail(id_responden)
+
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental')
+def load_table_page(version, table, columns, sort_by, descending, after, limit):
+    """Satu halaman tabel (keyset pagination, hanya kolom yang dipilih)."""
+    return db.get_table_page(table, list(columns), sort_by, descending, after, limit)
+
+@depends_on('responden', 'master_platform', 'penggunaan_per_platform', 'kesehatan_mental')
+def load_table_count(version, table):
+    """Jumlah baris tabel untuk navigasi halaman."""
+    return db.get_table_count(table)
 
 # ================================================================
 # PAGE: HOME / OVERVIEW
@@ -174,55 +530,43 @@ def page_data_mentah():
     st.title("📊 Data Mentah & Preprocessing")
     st.markdown("---")
     
-    # Load data
-    df = load_nabil_data()
-    
-    if df is None or df.empty:
-        st.error("❌ Gagal memuat data")
-        return
-    
-    df_filter = df.copy()
-    
     # ============ FILTER ============
+    # Filter diterjemahkan ke WHERE berparameter (lihat Database.respondent_filter),
+    # jadi hanya baris yang cocok yang diambil dari database
     st.subheader("🔍 Filter & Search")
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
-    # Filter Usia
-    usia_col = 'usia' if 'usia' in df.columns else None
-    if usia_col:
-        usia_range = col1.slider("Usia:", int(df[usia_col].min()), int(df[usia_col].max()), 
-                                   (int(df[usia_col].min()), int(df[usia_col].max())))
-        df_filter = df_filter[(df_filter[usia_col] >= usia_range[0]) & (df_filter[usia_col] <= usia_range[1])]
-    
-    # Filter Gender
-    gender_col = 'jenis_kelamin' if 'jenis_kelamin' in df.columns else None
-    if gender_col:
-        genders = df[gender_col].unique()
-        selected_gender = col2.multiselect("Gender:", options=genders, default=genders)
-        df_filter = df_filter[df_filter[gender_col].isin(selected_gender)]
-    
-    # Filter Status
-    status_col = 'status_hubungan' if 'status_hubungan' in df.columns else None
-    if status_col:
-        statuses = df[status_col].unique()
-        selected_status = col3.multiselect("Status:", options=statuses, default=statuses)
-        df_filter = df_filter[df_filter[status_col].isin(selected_status)]
+    min_age, max_age = FILTER_CONFIG['min_age'], FILTER_CONFIG['max_age']
+    usia_range = col1.slider("Usia:", min_age, max_age, (min_age, max_age))
+    genders = filter_choices(col2, "Gender:", 'gender_options')
+    statuses = filter_choices(col3, "Status:", 'status_options')
+    jobs = filter_choices(col4, "Pekerjaan:", 'job_options')
     
     # Search Box
     search = st.text_input("🔎 Cari Nama:", placeholder="Ketik nama...")
-    if search:
-        df_filter = df_filter[df_filter.apply(
-            lambda row: search.lower() in str(row.get('nama', '')).lower(),
-            axis=1
-        )]
+    
+    # Nama dicari lewat index n-gram di memori (hasil sedikit: filter per primary
+    # key) atau LIKE (lihat search_filter).
+    # Rentang usia penuh = tanpa kondisi (usia di luar rentang slider tetap ikut)
+    filters = (
+        None if usia_range == (min_age, max_age) else usia_range,
+        genders, statuses, jobs,
+        *search_filter(search)
+    )
+    df_filter = load_filtered_master(*filters)
+    total_responden = load_respondent_count()
+    
+    if df_filter is None or total_responden is None:
+        st.error("❌ Gagal memuat data")
+        return
     
     # ============ INFO JUMLAH DATA TERFILTER ============
-    st.info(f"📊 Menampilkan **{len(df_filter)}** dari **{len(df)}** responden")
+    jumlah_responden, responden_list = respondent_options(df_filter)
+    st.info(f"📊 Menampilkan **{jumlah_responden}** dari **{total_responden}** responden")
     
     # ============ DROPDOWN PILIH RESPONDEN ============
     st.subheader("👤 Pilih Responden")
     if 'nama' in df_filter.columns and len(df_filter) > 0:
-        responden_list = df_filter['nama'].unique()
         selected_responden = st.selectbox("Nama Responden:", options=responden_list)
         
         # Detail Lengkap
@@ -237,17 +581,73 @@ def page_data_mentah():
     else:
         st.warning("⚠️ Tidak ada data yang sesuai filter")
     
+    # ============ TABEL MENTAH ============
+    st.markdown("---")
+    st.subheader("🗂️ Tabel Mentah")
+    raw_tables = {'responden': 'Responden', 'penggunaan': 'Penggunaan per Platform',
+                  'kesehatan_mental': 'Kesehatan Mental'}
+    raw_table = st.selectbox("Tabel:", list(raw_tables), format_func=raw_tables.get)
+    raw_columns = list(PAGED_TABLES[raw_table]['columns'])
+    selected_raw_columns = st.multiselect("Kolom:", options=raw_columns, default=raw_columns,
+                                          key=f"raw_columns_{raw_table}")
+    if selected_raw_columns:
+        paged_table(raw_table, selected_raw_columns, key=f"raw_{raw_table}")
+    else:
+        st.warning("Pilih minimal satu kolom untuk ditampilkan")
+    
     # ============ DOWNLOAD ============
     st.markdown("---")
     st.subheader("📥 Download Data")
     
-    csv = df_filter.to_csv(index=False)
+    # CSV dibangun dari df_filter (tanpa query ulang) hanya saat tombol diklik
     st.download_button(
         "⬇️ Download CSV",
-        csv.encode('utf-8'),
+        functools.partial(chunks_to_csv, [df_filter], EXPORT_CONFIG['csv_encoding']),
         "data_responden_filtered.csv",
         "text/csv"
     )
+    
+    # ============ IMPOR GELOMBANG SURVEI ============
+    st.markdown("---")
+    with st.expander("📤 Impor Gelombang Survei (Bulk)"):
+        st.caption(f"File CSV/Parquet. Kolom `{INGEST_KEY_COLUMN}` menghubungkan file penggunaan dan "
+                   "kesehatan mental ke file responden; platform boleh berupa `nama_platform`.")
+        file_responden = st.file_uploader("Responden:", type=['csv', 'parquet'], key="ingest_responden")
+        file_usage = st.file_uploader("Penggunaan per platform (opsional):", type=['csv', 'parquet'],
+                                      key="ingest_usage")
+        file_mental = st.file_uploader("Kesehatan mental (opsional):", type=['csv', 'parquet'],
+                                       key="ingest_mental")
+        create_platforms = st.checkbox("Tambahkan platform baru ke master_platform",
+                                       value=INGEST_CONFIG['create_platforms'])
+        if st.button("Impor", disabled=file_responden is None):
+            try:
+                with st.spinner("Memvalidasi dan memuat data..."):
+                    report = ingest_wave(
+                        db, file_responden, file_usage, file_mental,
+                        batch_size=INGEST_CONFIG['batch_size'],
+                        method=INGEST_CONFIG['method'],
+                        defer_checks=INGEST_CONFIG['defer_checks'],
+                        create_platforms=create_platforms
+                    )
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                return
+            if report['error']:
+                st.error(f"❌ {report['error']}")
+            else:
+                st.success(f"✅ {sum(report['rows'].values())} baris dimuat "
+                           f"({report['rows_per_sec']:,.0f} baris/detik)")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Responden", report['rows']['responden'])
+            col2.metric("Penggunaan", report['rows']['penggunaan_per_platform'])
+            col3.metric("Kesehatan Mental", report['rows']['kesehatan_mental'])
+            st.caption(f"Validasi {report['validation_seconds']:.2f} detik, "
+                       f"tulis {report['write_seconds']:.2f} detik dalam {len(report['batches'])} transaksi")
+            if report['new_platforms']:
+                st.info(f"Platform baru: {', '.join(report['new_platforms'])}")
+            if report['rejected'] is not None and len(report['rejected']) > 0:
+                st.warning(f"⚠️ {len(report['rejected'])} baris ditolak")
+                st.dataframe(report['rejected'], use_container_width=True, hide_index=True)
 
 # ================================================================
 # PAGE: USAGE DASHBOARD (IKHSYAN)
@@ -269,16 +669,8 @@ def page_usage_dashboard():
         return
     
     # Rename columns
-    df_usage = df_usage.rename(columns={
-        'id_penggunaan': 'ID Penggunaan',
-        'id_responden': 'ID Responden',
-        'nama': 'Nama Responden',
-        'id_platform': 'ID Platform',
-        'nama_platform': 'Nama Platform',
-        'jam_per_hari': 'Jam per Hari',
-        'tujuan_penggunaan': 'Tujuan Penggunaan',
-        'frekuensi_buka_per_hari': 'Frekuensi Buka'
-    })
+    df_usage = df_usage.rename(columns=USAGE_COLUMN_LABELS)
+    summary = usage_summary(df_usage)
     
     # Display summary metrics
     st.subheader("📊 Summary Metrics")
@@ -286,27 +678,23 @@ def page_usage_dashboard():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_jam = df_usage['Jam per Hari'].sum()
-        st.metric("Total Jam Penggunaan", f"{total_jam:.1f} jam")
+        st.metric("Total Jam Penggunaan", f"{summary['total_jam']:.1f} jam")
     
     with col2:
-        avg_jam = df_usage['Jam per Hari'].mean()
-        st.metric("Rata-rata Jam/Hari", f"{avg_jam:.2f} jam")
+        st.metric("Rata-rata Jam/Hari", f"{summary['avg_jam']:.2f} jam")
     
     with col3:
-        total_platform = df_usage['Nama Platform'].nunique()
-        st.metric("Jumlah Platform", total_platform)
+        st.metric("Jumlah Platform", summary['total_platform'])
     
     with col4:
-        total_users = df_usage['ID Responden'].nunique()
-        st.metric("Total Users", total_users)
+        st.metric("Total Users", summary['total_users'])
     
     st.markdown("---")
     
     # Visualization 1: Bar Chart - Jam Penggunaan per Platform
     st.subheader("📊 Analisis 1: Jam Penggunaan Rata-Rata per Platform")
     
-    platform_usage = df_usage.groupby('Nama Platform')['Jam per Hari'].mean().sort_values(ascending=False)
+    platform_usage = summary['platform_usage']
     
     fig_bar = px.bar(
         x=platform_usage.index,
@@ -322,7 +710,7 @@ def page_usage_dashboard():
     # Visualization 2: Pie Chart - Platform Paling Populer
     st.subheader("📊 Platform Paling Populer (by User Count)")
     
-    platform_counts = df_usage['Nama Platform'].value_counts()
+    platform_counts = summary['platform_counts']
     fig_pie = px.pie(
         values=platform_counts.values,
         names=platform_counts.index,
@@ -349,16 +737,18 @@ def page_usage_dashboard():
     st.markdown("---")
     st.subheader("📋 Detail Data Penggunaan Platform")
     
-    all_columns = df_usage.columns.tolist()
+    all_columns = list(PAGED_TABLES['penggunaan']['columns'])
     selected_columns = st.multiselect(
         "Pilih kolom yang ingin ditampilkan:",
         options=all_columns,
-        default=['Nama Responden', 'Nama Platform', 'Jam per Hari', 'Tujuan Penggunaan', 'Frekuensi Buka']
+        default=['nama', 'nama_platform', 'jam_per_hari', 'tujuan_penggunaan', 'frekuensi_buka_per_hari'],
+        format_func=lambda column: USAGE_COLUMN_LABELS[column]
     )
     
     if selected_columns:
-        st.dataframe(df_usage[selected_columns], use_container_width=True)
-        csv = convert_df_to_csv(df_usage[selected_columns])
+        paged_table('penggunaan', selected_columns, USAGE_COLUMN_LABELS, key='usage_table')
+        labels = [USAGE_COLUMN_LABELS[column] for column in selected_columns]
+        csv = convert_df_to_csv(df_usage[labels])
         st.download_button(
             label="📥 Download Data as CSV",
             data=csv,
@@ -553,11 +943,15 @@ def show_responden_detail_modal(responden_data, usage_data, mental_data):
                 st.markdown(f"{color} **{MENTAL_HEALTH_ATTRIBUTES[col]}:** {value}")
 
 
-def open_responden_modal(responden_id, df_responden, df_usage, df_mental):
+def open_responden_modal(responden_id):
     """Show respondent detail (regular function, not a decorator dialog)."""
-    responden_data = df_responden[df_responden['id_responden'] == responden_id].iloc[0]
-    usage_data = df_usage[df_usage['id_responden'] == responden_id]
-    mental_data = df_mental[df_mental['id_responden'] == responden_id].iloc[0]
+    responden_data, usage_data, mental_data = load_respondent_detail(int(responden_id))
+    if responden_data is None:
+        st.error("❌ Detail responden tidak tersedia.")
+        return
+    if mental_data is None:
+        st.warning("Data kesehatan mental untuk responden ini belum diisi.")
+        return
     show_responden_detail_modal(responden_data, usage_data, mental_data)
 
 
@@ -568,11 +962,9 @@ def page_mental_health():
     st.title("🧠 Dashboard Kesehatan Mental")
     # Fetch data using cached loaders (reusing existing connection)
     with st.spinner("Memuat data..."):
-        df_responden = db.get_all_respondents()
-        df_usage = db.get_all_usage_data()
-        df_mental = db.get_all_mental_health_data()
+        df_mental, total_responden = load_mental_health_data()
 
-    if df_responden is None or df_mental is None or df_usage is None:
+    if df_mental is None or total_responden is None:
         st.error("❌ Data tidak tersedia atau gagal diambil dari database.")
         return
 
@@ -589,25 +981,33 @@ def page_mental_health():
     st.markdown("## 👥 Daftar Responden")
     st.markdown("**Klik 'Lihat Detail' untuk membuka detail responden**")
 
+    # Keyset pagination: simpan id terakhir tiap halaman yang sudah dilewati
+    page_size = DATA_CONFIG['page_size']
+    cursors = st.session_state.setdefault('responden_page_cursors', [None])
+    df_page = load_respondents_page(cursors[-1], page_size)
+    if df_page is None:
+        st.error("❌ Gagal memuat daftar responden.")
+        return
+
     num_cols = 3
     cols = st.columns(num_cols)
 
-    for idx, (_, responden) in enumerate(df_responden.iterrows()):
+    for idx, responden in enumerate(df_page.itertuples(index=False)):
         col = cols[idx % num_cols]
         with col:
             with st.container(border=True):
-                st.markdown(f"### {responden['nama']}")
-                st.markdown(f"**Usia:** {responden.get('usia', 'N/A')} tahun")
-                st.markdown(f"**Gender:** {responden.get('jenis_kelamin', 'N/A')}")
-                st.markdown(f"**Status:** {responden.get('status_hubungan', 'N/A')}")
-
-                if st.button("📋 Lihat Detail", key=f"btn_responden_{responden['id_responden']}"):
-                    open_responden_modal(
-                        responden['id_responden'],
-                        df_responden,
-                        df_usage,
-                        df_mental
-                    )
+                st.markdown(f"### {responden.nama}")
+                st.markdown(f"**Usia:** {responden.usia} tahun")
+                st.markdown(f"**Gender:** {responden.jenis_kelamin}")
+                st.markdown(f"**Status:** {responden.status_hubungan}")
+
+                if st.button("📋 Lihat Detail", key=f"btn_responden_{responden.id_responden}"):
+                    open_responden_modal(responden.id_responden)
+
+    next_cursor = None
+    if len(df_page) == page_size:
+        next_cursor = int(df_page['id_responden'].iloc[-1])
+    page_navigation(cursors, next_cursor, -(-total_responden // page_size), 'responden')
 
     st.markdown("---")
 
@@ -616,7 +1016,6 @@ def page_mental_health():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        total_responden = len(df_responden)
         st.metric("Total Responden", total_responden)
 
     with col2:
@@ -841,50 +1240,22 @@ def page_regression():
     """
     Regression & Correlation Analysis
     """
-    import numpy as np
-    import statsmodels.api as sm
     import plotly.express as px
 
     st.title("📈 Regression & Correlation Analysis")
     st.markdown("---")
 
-    # Load master dataframe (long format dari Nabil)
-    df_raw = load_nabil_data()
+    # Load data regresi (master dataframe di-fold per chunk)
+    try:
+        df_master = load_regression_data()
+    except Exception as e:
+        st.error(f"❌ Gagal memuat data dari database: {e}")
+        return
     
-    if df_raw is None or df_raw.empty:
+    if df_master is None or df_master.empty:
         st.error("❌ Gagal memuat data dari database")
         return
     
-    # Agregasi: Total jam penggunaan per responden
-    df_usage_total = df_raw.groupby('id_responden').agg({
-        'jam_per_hari': 'sum'  # Total jam semua platform
-    }).reset_index()
-    df_usage_total.rename(columns={'jam_per_hari': 'jam_penggunaan_total'}, inplace=True)
-    
-    # Pivot: Jam per platform (untuk multi-regression)
-    df_platform = df_raw.pivot_table(
-        index='id_responden',
-        columns='nama_platform',
-        values='jam_per_hari',
-        aggfunc='sum',
-        fill_value=0
-    ).reset_index()
-    
-    # Mental health columns (ambil data unik per responden)
-    mental_cols = ['gangguan_fokus', 'gelisah', 'kecemasan', 'kesulitan_konsentrasi',
-                   'perbandingan_diri', 'sentimen_posting', 'mencari_validasi', 'depresi',
-                   'fluktuasi_minat', 'sulit_tidur']
-    
-    df_mental = df_raw[['id_responden'] + mental_cols].drop_duplicates(subset='id_responden')
-    
-    # Hitung skor mental health (rata-rata dari semua indikator)
-    df_mental['skor_mental_health'] = df_mental[mental_cols].mean(axis=1)
-    
-    # Merge semua data
-    df_master = df_usage_total.merge(df_mental, on='id_responden')
-    df_master = df_master.merge(df_platform, on='id_responden')
-
-    
     # Preview data
     st.markdown("### 📋 Sample Data (Preview)")
     preview_cols = ['id_responden', 'jam_penggunaan_total', 'skor_mental_health']
@@ -897,12 +1268,13 @@ def page_regression():
     st.subheader("📊 Scatter Plot + Regression Line")
     st.markdown("**X:** Total Jam Penggunaan (semua platform) | **Y:** Rata-rata Skor Mental Health")
     
-    # Remove NaN
-    df_plot = df_master[['jam_penggunaan_total', 'skor_mental_health']].dropna()
+    # Regresi global dan per platform (lihat analysis.regression_summary)
+    summary = regression_summary(df_master, PLATFORMS)
     
-    if df_plot.empty:
+    if summary is None:
         st.error("❌ Data kosong setelah filter NaN")
         return
+    df_plot = summary['plot']
     
     # Scatter + trendline
     fig = px.scatter(
@@ -919,17 +1291,11 @@ def page_regression():
     fig.update_traces(marker=dict(size=8, opacity=0.6, color=COLOR_PALETTE['primary']))
     st.plotly_chart(fig, use_container_width=True)
     
-    # Compute regression statistics
-    X = df_plot['jam_penggunaan_total'].values
-    Y = df_plot['skor_mental_health'].values
-    X_sm = sm.add_constant(X)
-    model = sm.OLS(Y, X_sm).fit()
-    
-    intercept = model.params[0]
-    slope = model.params[1]
-    r_sq = model.rsquared
-    p_value = model.pvalues[1]
-    corr = np.corrcoef(X, Y)[0, 1]
+    intercept = summary['global']['intercept']
+    slope = summary['global']['slope']
+    r_sq = summary['global']['R2']
+    p_value = summary['global']['p_value']
+    corr = summary['global']['r']
     
     # Display results
     col1, col2, col3 = st.columns(3)
@@ -967,42 +1333,7 @@ def page_regression():
         st.warning("⚠️ Tidak ditemukan kolom platform. Skip multi-regression.")
         multi_results = []
     else:
-        multi_results = []
-        for platform in platform_cols:
-            df_tmp = df_master[[platform, 'skor_mental_health']].dropna()
-            
-            if df_tmp.empty or df_tmp[platform].sum() == 0:
-                continue  # Skip jika tidak ada data
-            
-            X_p = sm.add_constant(df_tmp[platform].values)
-            Y_p = df_tmp['skor_mental_health'].values
-            
-            try:
-                model_p = sm.OLS(Y_p, X_p).fit()
-                slope_p = model_p.params[1]
-                pval = model_p.pvalues[1]
-                r2 = model_p.rsquared
-                
-                # Interpretasi
-                if r2 > 0.5:
-                    strength = "Kuat"
-                elif r2 > 0.25:
-                    strength = "Sedang"
-                else:
-                    strength = "Lemah"
-                
-                signif = "Signifikan" if pval < 0.05 else "Tidak Signifikan"
-                
-                multi_results.append({
-                    "Platform": platform,
-                    "Slope (β)": slope_p,
-                    "P-value": pval,
-                    "R²": r2,
-                    "Kekuatan": strength,
-                    "Signifikansi": signif
-                })
-            except Exception as e:
-                continue
+        multi_results = summary['per_platform']
         
         if multi_results:
             df_multi = pd.DataFrame(multi_results).sort_values(by='R²', ascending=False)
@@ -1023,13 +1354,7 @@ def page_regression():
     
     # Save to session_state untuk halaman Conclusion
     st.session_state['regression_summary'] = {
-        "global": {
-            "slope": float(slope),
-            "intercept": float(intercept),
-            "r": float(corr),
-            "R2": float(r_sq),
-            "p_value": float(p_value)
-        },
+        "global": summary['global'],
         "per_platform": multi_results
     }
     
@@ -1181,10 +1506,225 @@ def page_conclusion():
     
     st.dataframe(pd.DataFrame(summary_data), use_container_width=True, hide_index=True)
 
+# ================================================================
+# PAGE: DIAGNOSTICS
+# ================================================================
+
+def page_diagnostics():
+    """Statistik query, slow-query log dan EXPLAIN untuk semua query Database"""
+
+    st.title("🩺 Diagnostics - Query Performance")
+    st.markdown("---")
+
+    # Connection pool
+    st.subheader("🔌 Connection Pool")
+    pool_stats = db.get_pool_stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Koneksi Dipakai", f"{pool_stats.get('in_use', 0)} / {pool_stats.get('pool_size', 0)}")
+    with col2:
+        st.metric("Koneksi Idle", pool_stats.get('idle', 0))
+    with col3:
+        st.metric("Rata-rata Tunggu", f"{pool_stats.get('wait_time_avg', 0.0) * 1000:.1f} ms")
+    with col4:
+        st.metric("Timeout", pool_stats.get('timeouts', 0))
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Prepared Statement Di-cache", pool_stats.get('statements_cached', 0))
+    with col2:
+        st.metric("Cache Hit / Miss",
+                  f"{pool_stats.get('statement_hits', 0)} / {pool_stats.get('statement_misses', 0)}")
+    with col3:
+        st.metric("Eviction", pool_stats.get('statement_evictions', 0))
+
+    if DATA_CONFIG['async_loaders'] and async_db is None:
+        st.info(f"Loader async nonaktif karena driver aiomysql tidak terpasang. "
+                f"Pasang dengan `{INSTALL_HINT}` agar query independen berjalan bersamaan.")
+
+    # Cache hasil query di dalam Database
+    st.subheader("🗃️ Result Cache")
+    cache_stats = db.get_cache_stats()
+    if not cache_stats:
+        st.info("Result cache nonaktif (RESULT_CACHE_CONFIG['max_bytes'] = 0).")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Hasil Di-cache", cache_stats['entries'])
+        with col2:
+            st.metric("Memori",
+                      f"{cache_stats['bytes'] / 2**20:.1f} / {cache_stats['max_bytes'] / 2**20:.0f} MB")
+        with col3:
+            st.metric("Hit / Miss", f"{cache_stats['hits']} / {cache_stats['misses']}",
+                      f"{cache_stats['hit_rate']:.0%} hit rate", delta_color="off")
+        with col4:
+            st.metric("Eviction / Kedaluwarsa",
+                      f"{cache_stats['evictions']} / {cache_stats['expirations']}")
+        st.caption(f"Dikosongkan {cache_stats['invalidations']} kali karena data berubah; "
+                   f"{cache_stats['stale']} hasil dibuang karena data berubah selama query berjalan; "
+                   f"{cache_stats['rejected']} hasil terlalu besar untuk di-cache.")
+
+    st.markdown("---")
+
+    # Statistik per query
+    st.subheader("⏱️ Statistik per Query")
+    df_stats = db.get_query_stats()
+    if df_stats.empty:
+        st.info("Belum ada query yang tercatat. Buka halaman lain terlebih dahulu.")
+    else:
+        df_view = df_stats.copy()
+        for column in ['total_time', 'avg_time', 'max_time', 'avg_server_time', 'avg_fetch_time']:
+            df_view[column] = df_view[column] * 1000
+        df_view = df_view.rename(columns={
+            'name': 'Query', 'calls': 'Panggilan', 'errors': 'Error',
+            'total_time': 'Total (ms)', 'avg_time': 'Rata-rata (ms)', 'max_time': 'Maks (ms)',
+            'avg_server_time': 'Server (ms)', 'avg_fetch_time': 'Fetch (ms)',
+            'rows': 'Total Baris', 'avg_rows': 'Rata-rata Baris', 'bytes': 'Byte (estimasi)'
+        })
+        st.dataframe(df_view, use_container_width=True, hide_index=True)
+        st.caption("Server = sampai hasil pertama tersedia; Fetch = menarik dan mendekode baris. "
+                   "Byte diestimasi dari sampel baris (protokol teks).")
+
+    # Slow query log
+    st.subheader("🐢 Slow Query Log")
+    st.caption(f"Query dengan waktu ≥ {db.query_stats.slow_threshold} detik (terbaru di atas)")
+    slow_queries = db.get_slow_queries()
+    if slow_queries:
+        st.dataframe(pd.DataFrame(slow_queries), use_container_width=True, hide_index=True)
+    else:
+        st.success("Tidak ada slow query.")
+
+    st.markdown("---")
+
+    # EXPLAIN
+    st.subheader("🔍 EXPLAIN Plan")
+    names = db.query_stats.names()
+    if not names:
+        st.info("Belum ada query untuk di-EXPLAIN.")
+    else:
+        selected_name = st.selectbox("Pilih query:", names)
+        analyze = st.checkbox("EXPLAIN ANALYZE (query benar-benar dijalankan)")
+        if st.button("Jalankan EXPLAIN"):
+            sql, _ = db.query_stats.last_query(selected_name)
+            st.code(sql.strip(), language='sql')
+            plan, warnings = db.explain_named(selected_name, analyze=analyze)
+            if plan is None:
+                st.error("EXPLAIN gagal dijalankan untuk query ini.")
+            else:
+                for warning in warnings:
+                    st.warning(f"⚠️ {warning}")
+                if not warnings:
+                    st.success("✅ Tidak ada full table scan, filesort atau temporary table.")
+                st.dataframe(plan, use_container_width=True, hide_index=True)
+
+    st.markdown("---")
+
+    # Index advisor
+    st.subheader("🧭 Index Advisor")
+    st.caption("Menjalankan semua query dashboard pada pool terpisah (tanpa tabel ringkasan), "
+               "memeriksa EXPLAIN-nya dan mengusulkan index komposit yang meng-cover join.")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("Analisis Query"):
+            with st.spinner("Memprofil query..."):
+                st.session_state['index_advisor_report'] = run_advisor(db)
+    with col2:
+        if st.button("Terapkan Migrasi Index"):
+            with st.spinner("Memprofil, membuat index, lalu memprofil ulang..."):
+                st.session_state['index_advisor_report'] = run_advisor(db, apply=True)
+    with col3:
+        if st.button("Batalkan Migrasi Index"):
+            reverted = revert_migrations(db)
+            st.session_state.pop('index_advisor_report', None)
+            st.info(f"Index dihapus: {', '.join(reverted) or '-'}")
+    report = st.session_state.get('index_advisor_report')
+    if report is not None:
+        if report['applied']:
+            st.success(f"✅ Index dibuat: {', '.join(report['applied'])}")
+        for title, df_report in format_report(report):
+            st.markdown(f"**{title}**")
+            st.dataframe(df_report, use_container_width=True, hide_index=True)
+
+    st.markdown("---")
+
+    # Refresh incremental & engine lokal
+    st.subheader("♻️ Refresh Incremental & Engine Lokal")
+    df_refresh = pd.DataFrame([
+        {'Dataset': name, **dataset.stats()} for name, dataset in incremental.items()
+    ])
+    st.dataframe(df_refresh, use_container_width=True, hide_index=True)
+    if local_engine.available:
+        st.metric("Query Agregat Dijawab Lokal", local_engine.queries_served)
+
+    # Tabel ringkasan (dijaga trigger)
+    st.subheader("🧮 Tabel Ringkasan")
+    if db.summary_tables_available():
+        st.caption("Statistik Home dan perbandingan gender/status dibaca dari tabel ringkasan_* "
+                   "yang diperbarui trigger. Rebuild hanya perlu jika ringkasan tidak sinkron.")
+        if st.button("🔁 Rebuild Tabel Ringkasan"):
+            if db.rebuild_summary_tables():
+                st.cache_data.clear()
+                st.success("✅ Tabel ringkasan dihitung ulang dari tabel sumber.")
+            else:
+                st.error("Rebuild tabel ringkasan gagal.")
+    else:
+        st.info("Tabel ringkasan tidak tersedia; agregat dihitung dari tabel sumber.")
+
+    if st.button("🔄 Reset Statistik Query"):
+        db.query_stats.reset()
+        st.rerun()
+
 # ================================================================
 # MAIN NAVIGATION
 # ================================================================
 
+# Halaman sidebar: (label, fungsi halaman, loader ter-cache yang bisa dimuat duluan)
+PAGES = [
+    ("Home", page_home, [load_home_data]),
+    ("Data Mentah", page_data_mentah, [load_respondent_count]),
+    ("Usage Dashboard", page_usage_dashboard, [load_usage_data]),
+    ("Mental Health Dashboard", page_mental_health,
+     [load_respondent_count, functools.partial(load_respondents_page, None, DATA_CONFIG['page_size'])]),
+    ("Demographic Analysis", page_demographic, [load_vera_data]),
+    ("Regression Analysis", page_regression, [load_regression_data]),
+    ("Conclusion", page_conclusion, []),
+    ("Diagnostics", page_diagnostics, []),
+]
+
+def prefetch_pages(loaders):
+    """
+    Memuat data semua halaman yang dicentang secara paralel (tiap loader di
+    thread dan koneksi pool sendiri), sehingga halaman dirender dari cache
+    alih-alih memuat satu per satu. Error diabaikan di sini: halaman
+    memanggil loader-nya lagi dan menampilkan pesan error sendiri.
+    """
+    ctx = get_script_run_ctx()
+    
+    def in_session(loader):
+        # Thread pool dipakai bersama; context sesi dipasang ulang setiap tugas
+        def run():
+            thread = threading.current_thread()
+            previous = get_script_run_ctx(suppress_warning=True)
+            add_script_run_ctx(thread, ctx)
+            try:
+                return loader()
+            finally:
+                # Context sesi ini tidak boleh tertinggal di worker untuk tugas berikutnya
+                if previous is not None:
+                    add_script_run_ctx(thread, previous)
+                else:
+                    thread.__dict__.pop(SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+        return run
+    
+    calls = {}
+    for loader in loaders:
+        key = getattr(loader, '__name__', None) or repr(loader)
+        calls.setdefault(key, in_session(loader))
+    if len(calls) < 2:
+        return
+    with st.spinner("Memuat data halaman terpilih..."):
+        db.run_parallel(calls)
+
 def main():
     """Main application with navigation"""
     
@@ -1193,20 +1733,11 @@ def main():
     st.sidebar.markdown("---")
     
     st.sidebar.success("Pilih Halaman:")
-    if st.sidebar.checkbox("Home"):
-        page_home()
-    if st.sidebar.checkbox("Data Mentah"):
-        page_data_mentah()
-    if st.sidebar.checkbox("Usage Dashboard"):
-        page_usage_dashboard()
-    if st.sidebar.checkbox("Mental Health Dashboard"):
-        page_mental_health()
-    if st.sidebar.checkbox("Demographic Analysis"):
-        page_demographic()
-    if st.sidebar.checkbox("Regression Analysis"):
-        page_regression()
-    if st.sidebar.checkbox("Conclusion"):
-        page_conclusion()
+    selected = [(page, loaders) for label, page, loaders in PAGES if st.sidebar.checkbox(label)]
+    if DATA_CONFIG['parallel_prefetch']:
+        prefetch_pages([loader for _, loaders in selected for loader in loaders])
+    for page, _ in selected:
+        page()
 
 if __name__ == "__main__":
     main()
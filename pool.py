@@ -0,0 +1,641 @@
+"""
+Connection Pool Module
+Bounded, thread-safe connection pool used by the Database class (and its
+asyncio counterpart used by AsyncDatabase)
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Optional
+
+
+class PoolExhaustedError(RuntimeError):
+    """Raised when no connection becomes available within the checkout timeout"""
+
+
+class StatementCache:
+    """
+    LRU cache of server-side prepared cursors for one connection, keyed by SQL text
+
+    Each cursor keeps its statement prepared on the server, so executing
+    the same SQL again only sends the parameters (binary protocol).
+    Closing an evicted cursor deallocates its statement. A cache is only
+    used by the thread that checked its connection out, so it needs no lock.
+    """
+
+    def __init__(self, raw: Any, max_size: int,
+                 on_event: Optional[Callable[[str], None]] = None):
+        """
+        Initialize an empty cache
+
+        Args:
+            raw: Raw connection the statements are prepared on
+            max_size: Maximum number of prepared statements kept open
+            on_event: Callable receiving 'hit', 'miss' or 'eviction'
+        """
+        self.raw = raw
+        self.max_size = max_size
+        self.on_event = on_event
+        self._cursors = OrderedDict()
+
+    def _event(self, kind: str):
+        if self.on_event is not None:
+            self.on_event(kind)
+
+    def cursor(self, sql: str) -> Any:
+        """
+        Get the prepared cursor for a SQL text, preparing it on a miss
+
+        Args:
+            sql: Parameterized SQL string (%s placeholders)
+
+        Returns:
+            Prepared cursor; the caller must fetch all rows and not close it
+        """
+        cursor = self._cursors.get(sql)
+        if cursor is not None:
+            self._cursors.move_to_end(sql)
+            self._event('hit')
+            return cursor
+        self._event('miss')
+        cursor = self.raw.cursor(prepared=True)
+        self._cursors[sql] = cursor
+        while len(self._cursors) > self.max_size:
+            _, evicted = self._cursors.popitem(last=False)
+            self._close_cursor(evicted)
+            self._event('eviction')
+        return cursor
+
+    def discard(self, sql: str):
+        """Drop the cursor of a SQL text (e.g. after it failed)"""
+        cursor = self._cursors.pop(sql, None)
+        if cursor is not None:
+            self._close_cursor(cursor)
+
+    @staticmethod
+    def _close_cursor(cursor: Any):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Deallocate every cached statement"""
+        cursors, self._cursors = list(self._cursors.values()), OrderedDict()
+        for cursor in cursors:
+            self._close_cursor(cursor)
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+
+class PooledConnection:
+    """Raw DB-API connection plus the bookkeeping the pool needs"""
+
+    __slots__ = ('raw', 'created_at', 'last_used', 'last_validated', 'statements')
+
+    def __init__(self, raw: Any, statements: Optional[StatementCache] = None):
+        now = time.monotonic()
+        self.raw = raw
+        self.created_at = now
+        self.last_used = now
+        self.last_validated = now
+        self.statements = statements
+
+
+class ConnectionPool:
+    """
+    Bounded connection pool with per-query checkout/checkin
+
+    Connections are created lazily up to ``pool_size``. Idle connections
+    older than ``max_idle_time`` (or alive longer than ``max_lifetime``)
+    are swept out on every checkout and checkin, and connections that
+    have been idle longer than ``validate_interval`` are pinged before
+    being handed out instead of pinging on every query.
+    """
+
+    def __init__(self, factory: Callable[[], Any], pool_size: int = 5,
+                 checkout_timeout: float = 10.0, max_idle_time: float = 300.0,
+                 max_lifetime: float = 3600.0, validate_interval: float = 30.0,
+                 validate: Optional[Callable[[Any], bool]] = None,
+                 statement_cache_size: int = 0):
+        """
+        Initialize the pool (no connection is opened yet)
+
+        Args:
+            factory: Callable returning a new raw connection
+            pool_size: Maximum number of open connections
+            checkout_timeout: Seconds to wait for a free connection
+            max_idle_time: Seconds an idle connection is kept before recycling
+            max_lifetime: Seconds after which a connection is always recycled
+            validate_interval: Idle seconds after which a connection is pinged
+            validate: Callable returning True if a raw connection is usable
+            statement_cache_size: Prepared statements cached per connection
+                (0 disables the cache, see StatementCache)
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.factory = factory
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.validate_interval = validate_interval
+        self.validate = validate
+        self.statement_cache_size = statement_cache_size
+
+        self._idle = deque()
+        self._in_use = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+        self._created = 0
+        self._recycled = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._statement_events = {'hit': 0, 'miss': 0, 'eviction': 0}
+
+    # ----------------------------------------------------------------
+    # CHECKOUT / CHECKIN
+    # ----------------------------------------------------------------
+
+    def checkout(self) -> PooledConnection:
+        """
+        Take a connection out of the pool, creating one if allowed
+
+        Returns:
+            PooledConnection ready for use
+
+        Raises:
+            PoolExhaustedError: if no connection frees up in time
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        waited = False
+
+        with self._available:
+            while True:
+                if self._closed:
+                    raise PoolExhaustedError("Connection pool is closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._in_use += 1
+                    break
+                if self._in_use < self.pool_size:
+                    conn = None
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolExhaustedError(
+                        f"No connection available after {self.checkout_timeout:.1f}s "
+                        f"(pool_size={self.pool_size})"
+                    )
+                waited = True
+                self._available.wait(remaining)
+
+            expired = self._detach_expired()
+            wait_time = time.monotonic() - start
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+
+        # Network work (connect / ping / close) happens outside the lock
+        for stale in expired:
+            self._close_raw(stale)
+        try:
+            if conn is not None and not self._is_usable(conn):
+                self._close_raw(conn)
+                with self._lock:
+                    self._recycled += 1
+                conn = None
+            if conn is None:
+                conn = self._new_connection()
+                with self._lock:
+                    self._created += 1
+        except BaseException:
+            self._release_slot()
+            raise
+
+        conn.last_used = time.monotonic()
+        return conn
+
+    def checkin(self, conn: PooledConnection, discard: bool = False):
+        """
+        Return a connection to the pool
+
+        Args:
+            conn: Connection obtained from checkout()
+            discard: Close the connection instead of keeping it (e.g. after an error)
+        """
+        conn.last_used = time.monotonic()
+        with self._available:
+            self._in_use -= 1
+            keep = not discard and not self._closed
+            if keep:
+                self._idle.append(conn)
+            expired = self._detach_expired()
+            self._available.notify()
+        if not keep:
+            self._close_raw(conn)
+        for stale in expired:
+            self._close_raw(stale)
+
+    @contextmanager
+    def pooled_connection(self):
+        """
+        Context manager yielding a PooledConnection for one unit of work
+
+        Use this instead of connection() to reach the connection's
+        statement cache. The connection is discarded instead of reused if
+        the block raises.
+        """
+        conn = self.checkout()
+        try:
+            yield conn
+        except BaseException:
+            self.checkin(conn, discard=True)
+            raise
+        else:
+            self.checkin(conn)
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager yielding a raw connection for one unit of work
+
+        The connection is discarded instead of reused if the block raises.
+        """
+        with self.pooled_connection() as conn:
+            yield conn.raw
+
+    # ----------------------------------------------------------------
+    # MAINTENANCE
+    # ----------------------------------------------------------------
+
+    def _new_connection(self) -> PooledConnection:
+        raw = self.factory()
+        statements = None
+        if self.statement_cache_size > 0:
+            statements = StatementCache(raw, self.statement_cache_size, self._count_statement_event)
+        return PooledConnection(raw, statements)
+
+    def _count_statement_event(self, kind: str):
+        with self._lock:
+            self._statement_events[kind] += 1
+
+    def _is_usable(self, conn: PooledConnection) -> bool:
+        """Check lifetime, idle time and (occasionally) liveness"""
+        now = time.monotonic()
+        if now - conn.created_at > self.max_lifetime:
+            return False
+        if now - conn.last_used > self.max_idle_time:
+            return False
+        if self.validate is not None and now - conn.last_used > self.validate_interval:
+            try:
+                if not self.validate(conn.raw):
+                    return False
+            except Exception:
+                return False
+            conn.last_validated = now
+        return True
+
+    def _release_slot(self):
+        with self._available:
+            self._in_use -= 1
+            self._available.notify()
+
+    @staticmethod
+    def _close_raw(conn: PooledConnection):
+        if conn.statements is not None:
+            conn.statements.close()
+        try:
+            conn.raw.close()
+        except Exception:
+            pass
+
+    def _detach_expired(self) -> list:
+        """
+        Remove idle connections past max_idle_time or max_lifetime
+
+        checkout() pops the most recently used connection, so the oldest
+        ones at the left of the deque would otherwise never be looked at.
+        Must be called with the lock held; the caller closes the returned
+        connections after releasing it.
+        """
+        now = time.monotonic()
+        expired = [conn for conn in self._idle
+                   if now - conn.last_used > self.max_idle_time
+                   or now - conn.created_at > self.max_lifetime]
+        if expired:
+            self._idle = deque(conn for conn in self._idle if conn not in expired)
+            self._recycled += len(expired)
+        return expired
+
+    def recycle_idle(self) -> int:
+        """
+        Close idle connections that exceeded max_idle_time or max_lifetime
+
+        Returns:
+            Number of connections closed
+        """
+        with self._lock:
+            expired = self._detach_expired()
+        for conn in expired:
+            self._close_raw(conn)
+        return len(expired)
+
+    def close(self):
+        """Close every idle connection and refuse further checkouts"""
+        with self._available:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._available.notify_all()
+        for conn in idle:
+            self._close_raw(conn)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of pool metrics
+
+        Returns:
+            Dictionary with sizing, usage and wait-time metrics
+        """
+        with self._lock:
+            return {
+                'pool_size': self.pool_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'created': self._created,
+                'recycled': self._recycled,
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'timeouts': self._timeouts,
+                'wait_time_total': self._wait_time_total,
+                'wait_time_avg': self._wait_time_total / self._checkouts if self._checkouts else 0.0,
+                'wait_time_max': self._wait_time_max,
+                'statement_cache_size': self.statement_cache_size,
+                'statements_cached': sum(len(conn.statements) for conn in self._idle
+                                         if conn.statements is not None),
+                'statement_hits': self._statement_events['hit'],
+                'statement_misses': self._statement_events['miss'],
+                'statement_evictions': self._statement_events['eviction'],
+            }
+
+
+class AsyncConnectionPool:
+    """
+    asyncio counterpart of ConnectionPool (used by AsyncDatabase)
+
+    Same sizing, recycling and metrics, but a task waiting for a free
+    connection is suspended instead of blocking its thread. The pool
+    belongs to the event loop that first uses it. Connections carry no
+    statement cache: the async drivers only speak the text protocol.
+    """
+
+    def __init__(self, factory: Callable[[], Awaitable[Any]], pool_size: int = 5,
+                 checkout_timeout: float = 10.0, max_idle_time: float = 300.0,
+                 max_lifetime: float = 3600.0, validate_interval: float = 30.0,
+                 validate: Optional[Callable[[Any], Awaitable[bool]]] = None):
+        """
+        Initialize the pool (no connection is opened yet)
+
+        Args:
+            factory: Coroutine function returning a new raw connection
+            pool_size: Maximum number of open connections
+            checkout_timeout: Seconds to wait for a free connection
+            max_idle_time: Seconds an idle connection is kept before recycling
+            max_lifetime: Seconds after which a connection is always recycled
+            validate_interval: Idle seconds after which a connection is pinged
+            validate: Coroutine function returning True if a raw connection is usable
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.factory = factory
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.validate_interval = validate_interval
+        self.validate = validate
+
+        self._idle = deque()
+        self._in_use = 0
+        self._closed = False
+        # Counters need no lock: every task runs on the same event loop
+        self._available = asyncio.Condition()
+
+        self._created = 0
+        self._recycled = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    # ----------------------------------------------------------------
+    # CHECKOUT / CHECKIN
+    # ----------------------------------------------------------------
+
+    async def checkout(self) -> PooledConnection:
+        """
+        Take a connection out of the pool, creating one if allowed
+
+        Returns:
+            PooledConnection ready for use
+
+        Raises:
+            PoolExhaustedError: if no connection frees up in time
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        waited = False
+
+        async with self._available:
+            while True:
+                if self._closed:
+                    raise PoolExhaustedError("Connection pool is closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._in_use += 1
+                    break
+                if self._in_use < self.pool_size:
+                    conn = None
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolExhaustedError(
+                        f"No connection available after {self.checkout_timeout:.1f}s "
+                        f"(pool_size={self.pool_size})"
+                    )
+                waited = True
+                try:
+                    await asyncio.wait_for(self._available.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+            expired = self._detach_expired()
+            wait_time = time.monotonic() - start
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+
+        # Network work (connect / ping) happens outside the condition
+        for stale in expired:
+            self._close_raw(stale)
+        try:
+            if conn is not None and not await self._is_usable(conn):
+                self._close_raw(conn)
+                self._recycled += 1
+                conn = None
+            if conn is None:
+                conn = PooledConnection(await self.factory())
+                self._created += 1
+        except BaseException:
+            await self._release_slot()
+            raise
+
+        conn.last_used = time.monotonic()
+        return conn
+
+    async def checkin(self, conn: PooledConnection, discard: bool = False):
+        """
+        Return a connection to the pool
+
+        Args:
+            conn: Connection obtained from checkout()
+            discard: Close the connection instead of keeping it (e.g. after an error)
+        """
+        conn.last_used = time.monotonic()
+        async with self._available:
+            self._in_use -= 1
+            keep = not discard and not self._closed
+            if keep:
+                self._idle.append(conn)
+            expired = self._detach_expired()
+            self._available.notify()
+        if not keep:
+            self._close_raw(conn)
+        for stale in expired:
+            self._close_raw(stale)
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Async context manager yielding a raw connection for one unit of work
+
+        The connection is discarded instead of reused if the block raises
+        (including cancellation, which can leave a result half read).
+        """
+        conn = await self.checkout()
+        try:
+            yield conn.raw
+        except BaseException:
+            await self.checkin(conn, discard=True)
+            raise
+        else:
+            await self.checkin(conn)
+
+    # ----------------------------------------------------------------
+    # MAINTENANCE
+    # ----------------------------------------------------------------
+
+    async def _is_usable(self, conn: PooledConnection) -> bool:
+        """Check lifetime, idle time and (occasionally) liveness"""
+        now = time.monotonic()
+        if now - conn.created_at > self.max_lifetime:
+            return False
+        if now - conn.last_used > self.max_idle_time:
+            return False
+        if self.validate is not None and now - conn.last_used > self.validate_interval:
+            try:
+                if not await self.validate(conn.raw):
+                    return False
+            except Exception:
+                return False
+            conn.last_validated = now
+        return True
+
+    async def _release_slot(self):
+        async with self._available:
+            self._in_use -= 1
+            self._available.notify()
+
+    @staticmethod
+    def _close_raw(conn: PooledConnection):
+        try:
+            conn.raw.close()
+        except Exception:
+            pass
+
+    def _detach_expired(self) -> list:
+        """Remove idle connections past max_idle_time or max_lifetime (see ConnectionPool)"""
+        now = time.monotonic()
+        expired = [conn for conn in self._idle
+                   if now - conn.last_used > self.max_idle_time
+                   or now - conn.created_at > self.max_lifetime]
+        if expired:
+            self._idle = deque(conn for conn in self._idle if conn not in expired)
+            self._recycled += len(expired)
+        return expired
+
+    def recycle_idle(self) -> int:
+        """
+        Close idle connections that exceeded max_idle_time or max_lifetime
+
+        Returns:
+            Number of connections closed
+        """
+        expired = self._detach_expired()
+        for conn in expired:
+            self._close_raw(conn)
+        return len(expired)
+
+    async def close(self):
+        """Close every idle connection and refuse further checkouts"""
+        async with self._available:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._available.notify_all()
+        for conn in idle:
+            self._close_raw(conn)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of pool metrics (same keys as ConnectionPool.stats())
+
+        Returns:
+            Dictionary with sizing, usage and wait-time metrics
+        """
+        return {
+            'pool_size': self.pool_size,
+            'in_use': self._in_use,
+            'idle': len(self._idle),
+            'created': self._created,
+            'recycled': self._recycled,
+            'checkouts': self._checkouts,
+            'waits': self._waits,
+            'timeouts': self._timeouts,
+            'wait_time_total': self._wait_time_total,
+            'wait_time_avg': self._wait_time_total / self._checkouts if self._checkouts else 0.0,
+            'wait_time_max': self._wait_time_max,
+            'statement_cache_size': 0,
+            'statements_cached': 0,
+            'statement_hits': 0,
+            'statement_misses': 0,
+            'statement_evictions': 0,
+        }
@@ -0,0 +1,276 @@
+"""
+Query Stats Module
+Per-query timing, row/byte counts, slow-query log and EXPLAIN plan checks
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+
+# Rows inspected when estimating the size of a result on the wire
+BYTES_SAMPLE_ROWS = 200
+
+
+def estimate_bytes(rows: list) -> int:
+    """
+    Estimate the text-protocol size of a result from a sample of its rows
+
+    Args:
+        rows: Row tuples as fetched from the cursor
+
+    Returns:
+        Approximate number of bytes transferred
+    """
+    if not rows:
+        return 0
+    sample = rows[:BYTES_SAMPLE_ROWS]
+    # Setiap nilai dikirim sebagai string dengan prefix panjang 1 byte
+    size = sum(len(str(value)) + 1 for row in sample for value in row if value is not None)
+    size += sum(1 for row in sample for value in row if value is None)
+    return int(size * len(rows) / len(sample))
+
+
+class QueryTimer:
+    """
+    Times one statement, split into server time and fetch time
+
+    Server time runs from the start until executed() (the server has
+    produced the first result); fetch time is the rest, spent pulling and
+    decoding rows.
+    """
+
+    def __init__(self, stats: 'QueryStats', name: str, sql: str, params=None):
+        self.stats = stats
+        self.name = name
+        self.sql = sql
+        self.params = params
+        self.rows = 0
+        self.bytes = 0
+        self._start = None
+        self._executed = None
+
+    def __enter__(self) -> 'QueryTimer':
+        self._start = time.perf_counter()
+        return self
+
+    def executed(self):
+        """Mark the end of server time"""
+        self._executed = time.perf_counter()
+
+    def fetched(self, rows: list):
+        """Count a block of fetched rows"""
+        self.rows += len(rows)
+        self.bytes += estimate_bytes(rows)
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        executed = self._executed if self._executed is not None else end
+        self.stats.record(
+            self.name, self.sql, self.params,
+            server_time=executed - self._start,
+            fetch_time=end - executed,
+            rows=self.rows,
+            nbytes=self.bytes,
+            # GeneratorExit = konsumen berhenti membaca stream lebih awal (bukan error)
+            error=None if exc is None or isinstance(exc, GeneratorExit) else str(exc),
+        )
+        return False
+
+
+class QueryStats:
+    """Thread-safe per-name aggregates plus a rolling log of slow statements"""
+
+    def __init__(self, slow_threshold: float = 0.5, slow_log_size: int = 100):
+        """
+        Initialize the recorder
+
+        Args:
+            slow_threshold: Wall time in seconds from which a statement is logged as slow
+            slow_log_size: Number of slow statements kept (oldest dropped first)
+        """
+        self.slow_threshold = slow_threshold
+        self._lock = threading.Lock()
+        self._totals: Dict[str, dict] = {}
+        self._last_sql: Dict[str, tuple] = {}
+        self._slow_log = deque(maxlen=slow_log_size)
+
+    def timer(self, name: str, sql: str, params=None) -> QueryTimer:
+        """
+        Create a timer that records into these stats when its block exits
+
+        Args:
+            name: Query name (e.g. the Database method)
+            sql: SQL text
+            params: Query parameters
+
+        Returns:
+            QueryTimer context manager
+        """
+        return QueryTimer(self, name, sql, params)
+
+    def record(self, name: str, sql: str, params=None, server_time: float = 0.0,
+               fetch_time: float = 0.0, rows: int = 0, nbytes: int = 0,
+               error: Optional[str] = None):
+        """
+        Record one executed statement
+
+        Args:
+            name: Query name
+            sql: SQL text
+            params: Query parameters
+            server_time: Seconds until the server produced the result
+            fetch_time: Seconds spent fetching and decoding rows
+            rows: Rows returned
+            nbytes: Estimated bytes transferred
+            error: Error message if the statement failed
+        """
+        wall_time = server_time + fetch_time
+        with self._lock:
+            totals = self._totals.setdefault(name, {
+                'calls': 0, 'errors': 0, 'wall_time': 0.0, 'max_wall_time': 0.0,
+                'server_time': 0.0, 'fetch_time': 0.0, 'rows': 0, 'bytes': 0,
+            })
+            totals['calls'] += 1
+            totals['errors'] += error is not None
+            totals['wall_time'] += wall_time
+            totals['max_wall_time'] = max(totals['max_wall_time'], wall_time)
+            totals['server_time'] += server_time
+            totals['fetch_time'] += fetch_time
+            totals['rows'] += rows
+            totals['bytes'] += nbytes
+            self._last_sql[name] = (sql, params)
+            if wall_time >= self.slow_threshold:
+                self._slow_log.append({
+                    'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'name': name,
+                    'wall_time': wall_time,
+                    'server_time': server_time,
+                    'fetch_time': fetch_time,
+                    'rows': rows,
+                    'bytes': nbytes,
+                    'error': error,
+                    'sql': ' '.join(sql.split()),
+                })
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Per-name aggregates, slowest total first
+
+        Returns:
+            DataFrame with calls, errors, total/avg/max wall time, avg server
+            and fetch time, total/avg rows and total bytes per query name
+        """
+        with self._lock:
+            items = [(name, dict(totals)) for name, totals in self._totals.items()]
+        records = []
+        for name, totals in items:
+            calls = totals['calls']
+            records.append({
+                'name': name,
+                'calls': calls,
+                'errors': totals['errors'],
+                'total_time': totals['wall_time'],
+                'avg_time': totals['wall_time'] / calls,
+                'max_time': totals['max_wall_time'],
+                'avg_server_time': totals['server_time'] / calls,
+                'avg_fetch_time': totals['fetch_time'] / calls,
+                'rows': totals['rows'],
+                'avg_rows': totals['rows'] / calls,
+                'bytes': totals['bytes'],
+            })
+        columns = ['name', 'calls', 'errors', 'total_time', 'avg_time', 'max_time',
+                   'avg_server_time', 'avg_fetch_time', 'rows', 'avg_rows', 'bytes']
+        df = pd.DataFrame.from_records(records, columns=columns)
+        return df.sort_values('total_time', ascending=False, ignore_index=True)
+
+    def slow_queries(self) -> List[dict]:
+        """
+        Rolling slow-query log, most recent first
+
+        Returns:
+            List of slow statement records
+        """
+        with self._lock:
+            return list(reversed(self._slow_log))
+
+    def last_query(self, name: str) -> Optional[tuple]:
+        """
+        SQL text and params of the last statement recorded under a name
+
+        Args:
+            name: Query name
+
+        Returns:
+            Tuple of (sql, params), or None if never recorded
+        """
+        with self._lock:
+            return self._last_sql.get(name)
+
+    def names(self) -> List[str]:
+        """Recorded query names, sorted"""
+        with self._lock:
+            return sorted(self._last_sql)
+
+    def reset(self):
+        """Clear all aggregates and the slow-query log"""
+        with self._lock:
+            self._totals.clear()
+            self._last_sql.clear()
+            self._slow_log.clear()
+
+
+# ================================================================
+# EXPLAIN PLAN CHECKS
+# ================================================================
+
+def plan_warnings(plan: pd.DataFrame) -> List[str]:
+    """
+    Flag full table scans, filesorts and temporary tables in an EXPLAIN plan
+
+    Understands tabular MySQL/MariaDB EXPLAIN (and MariaDB ANALYZE), the
+    MySQL EXPLAIN ANALYZE tree and SQLite EXPLAIN QUERY PLAN output.
+
+    Args:
+        plan: Result of Database.explain()
+
+    Returns:
+        List of human-readable warnings (empty if none)
+    """
+    warnings = []
+    if plan is None or plan.empty:
+        return warnings
+    columns = {column.lower(): column for column in plan.columns}
+
+    if 'type' in columns:
+        for _, row in plan.iterrows():
+            table = row.get(columns.get('table', ''), '')
+            access = str(row[columns['type']] or '')
+            extra = str(row.get(columns.get('extra', ''), '') or '')
+            if access.upper() == 'ALL':
+                warnings.append(f"Full table scan on {table}")
+            if 'filesort' in extra:
+                warnings.append(f"Filesort on {table}")
+            if 'temporary' in extra:
+                warnings.append(f"Temporary table for {table}")
+    elif 'detail' in columns:
+        for detail in plan[columns['detail']].astype(str):
+            if detail.startswith('SCAN ') and 'INDEX' not in detail:
+                warnings.append(f"Full table scan: {detail}")
+            if 'TEMP B-TREE' in detail:
+                kind = 'Filesort' if 'ORDER BY' in detail else 'Temporary table'
+                warnings.append(f"{kind}: {detail}")
+    else:
+        text = '\n'.join(plan.iloc[:, 0].astype(str))
+        for line in text.splitlines():
+            line = line.strip().lstrip('-> ').strip()
+            if line.startswith('Table scan on'):
+                warnings.append(f"Full table scan: {line}")
+            elif line.startswith('Sort'):
+                warnings.append(f"Filesort: {line}")
+            elif 'temporary' in line.lower():
+                warnings.append(f"Temporary table: {line}")
+    return warnings
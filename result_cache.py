@@ -0,0 +1,262 @@
+"""
+Result Cache Module
+Byte-bounded LRU cache of query results with per-entry TTL, used by the Database class
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Canonical form of a SQL text for cache keys
+
+    Whitespace runs collapse to one space and a trailing semicolon is
+    dropped, so the same query written with different indentation shares
+    one entry. Case is kept (string literals are case-sensitive).
+
+    Args:
+        sql: SQL string
+
+    Returns:
+        Normalized SQL string
+    """
+    return _WHITESPACE_RE.sub(' ', sql).strip().rstrip(';').rstrip()
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """
+    Memory held by a DataFrame, including the contents of object columns
+
+    Args:
+        df: DataFrame
+
+    Returns:
+        Size in bytes
+    """
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class _Entry:
+    __slots__ = ('frame', 'nbytes', 'expires_at')
+
+    def __init__(self, frame: pd.DataFrame, nbytes: int, expires_at: float):
+        self.frame = frame
+        self.nbytes = nbytes
+        self.expires_at = expires_at
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of result DataFrames bounded by their total size
+
+    Entries are keyed by normalized SQL, params and a variant (e.g. the
+    fetch mode) and expire after their TTL. When the total size exceeds
+    ``max_bytes``, least recently used entries are evicted; a result larger
+    than ``max_bytes`` is not stored at all. Callers always receive their
+    own copy, so mutating a returned frame never changes the cache.
+
+    Every clear() starts a new ``generation``. A caller reads it before
+    running a query and passes it to put(), so a result fetched before an
+    invalidation is dropped instead of being cached after it.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float = 60.0):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_bytes: Upper bound of the summed frame sizes
+            ttl: Default seconds an entry stays valid
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+        self._invalidations = 0
+        self._stale = 0
+        self._generation = 0
+        # Last version/watermark token seen per table (see observe)
+        self._tokens: Dict[Hashable, object] = {}
+
+    @property
+    def generation(self) -> int:
+        """Number of clear() calls so far (read before running a query, see put)"""
+        return self._generation
+
+    @staticmethod
+    def key(sql: str, params=None, variant: Hashable = None) -> Tuple:
+        """
+        Cache key of a statement
+
+        Args:
+            sql: SQL string
+            params: Query parameters (any sequence)
+            variant: Anything else that changes the result, e.g. the fetch mode
+
+        Returns:
+            Hashable key
+        """
+        return normalize_sql(sql), tuple(params) if params is not None else None, variant
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """
+        Look up a result
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            Copy of the cached DataFrame, or None on a miss (or an expired entry)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            frame = entry.frame
+        return frame.copy()
+
+    def put(self, key: Hashable, frame: pd.DataFrame, ttl: Optional[float] = None,
+            generation: Optional[int] = None) -> bool:
+        """
+        Store a result, evicting least recently used entries to stay within max_bytes
+
+        Args:
+            key: Key from key()
+            frame: Result DataFrame (a copy is stored)
+            ttl: Seconds the entry stays valid (default: the cache's ttl)
+            generation: ``generation`` read before the query ran; the result
+                is dropped if the cache was cleared since (None = no check)
+
+        Returns:
+            bool: True if stored, False if the frame alone exceeds max_bytes
+            or the cache was cleared while it was being fetched
+        """
+        nbytes = frame_nbytes(frame)
+        if nbytes > self.max_bytes:
+            with self._lock:
+                self._rejected += 1
+            return False
+        entry = _Entry(frame.copy(), nbytes, time.monotonic() + (self.ttl if ttl is None else ttl))
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self._stale += 1
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._drop_expired(time.monotonic())
+            self._entries[key] = entry
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+        return True
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry now instead of on its next lookup
+
+        Also run on every put() and observe(), so an entry that is never
+        looked up again does not stay in memory until it is evicted.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            return self._drop_expired(time.monotonic())
+
+    def _drop_expired(self, now: float) -> int:
+        # Caller holds the lock
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+        return len(expired)
+
+    def observe(self, tokens: Dict[Hashable, object]) -> bool:
+        """
+        Clear the cache when a table changed since the last observation
+
+        Fed with the results of the change probes (table versions,
+        watermarks), so a result cached before a write is never served
+        once the write has been seen.
+
+        Args:
+            tokens: Table (or any name) -> opaque token of its current state
+
+        Returns:
+            bool: True if a token changed and the cache was cleared
+        """
+        with self._lock:
+            changed = any(key in self._tokens and self._tokens[key] != token
+                          for key, token in tokens.items())
+            self._tokens.update(tokens)
+            if not changed:
+                self._drop_expired(time.monotonic())
+        if changed:
+            self.clear()
+        return changed
+
+    def clear(self):
+        """Drop every entry (e.g. after the data changed)"""
+        with self._lock:
+            if self._entries:
+                self._invalidations += 1
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of cache metrics
+
+        Returns:
+            Dictionary with size, hit/miss and eviction counters
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'rejected': self._rejected,
+                'invalidations': self._invalidations,
+                'stale': self._stale,
+            }
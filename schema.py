@@ -0,0 +1,312 @@
+"""
+Schema Module
+Derives compact pandas dtypes from the table definitions in uas_basdat.sql
+"""
+
+import os
+import re
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow opsional, hanya dibutuhkan untuk fetch mode 'arrow'
+    pa = None
+
+
+# Default location of the phpMyAdmin dump shipped with the project
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uas_basdat.sql')
+
+_CREATE_TABLE_RE = re.compile(r"CREATE TABLE `(\w+)` \((.*?)\n\)", re.S)
+_COLUMN_RE = re.compile(r"^\s*`(\w+)`\s+(\w+)(?:\(([^)]*)\))?", re.M)
+_ENUM_VALUE_RE = re.compile(r"'((?:[^']|'')*)'")
+
+
+def parse_schema(path: str = SCHEMA_PATH) -> Dict[str, List[Tuple[str, str, str]]]:
+    """
+    Parse CREATE TABLE statements from a MySQL dump
+
+    Args:
+        path: Path to the .sql dump
+
+    Returns:
+        Dictionary of table -> list of (column, sql_type, type_arguments)
+    """
+    with open(path, encoding='utf-8') as f:
+        sql = f.read()
+
+    tables = {}
+    for table, body in _CREATE_TABLE_RE.findall(sql):
+        tables[table] = [
+            (column, sql_type.lower(), args or '')
+            for column, sql_type, args in _COLUMN_RE.findall(body)
+        ]
+    return tables
+
+
+def _column_dtypes(sql_type: str, args: str) -> Optional[Tuple[object, object]]:
+    """
+    Map one SQL column type to (dtype, dtype used when the column has NULLs)
+
+    Returns:
+        Tuple of dtypes, or None to leave the column as fetched
+    """
+    if sql_type == 'enum':
+        categories = [value.replace("''", "'") for value in _ENUM_VALUE_RE.findall(args)]
+        dtype = pd.CategoricalDtype(categories=categories)
+        return dtype, dtype
+    if sql_type == 'tinyint':
+        # Skor skala 1-5 dan frekuensi (< 128) muat di int8
+        return 'int8', 'Int8'
+    if sql_type == 'smallint':
+        return 'int16', 'Int16'
+    if sql_type in ('int', 'mediumint'):
+        return 'int32', 'Int32'
+    if sql_type == 'bigint':
+        return 'int64', 'Int64'
+    if sql_type in ('decimal', 'float'):
+        return 'float32', 'float32'
+    return None
+
+
+def build_dtype_map(schema: Dict[str, List[Tuple[str, str, str]]]) -> Dict[str, Tuple[object, object]]:
+    """
+    Build a column-name keyed dtype map from a parsed schema
+
+    Column names that appear in several tables with different types are
+    left out, since a result column cannot be traced back to its table.
+
+    Args:
+        schema: Output of parse_schema()
+
+    Returns:
+        Dictionary of column -> (dtype, nullable dtype)
+    """
+    dtype_map = {}
+    conflicts = set()
+    for columns in schema.values():
+        for column, sql_type, args in columns:
+            dtypes = _column_dtypes(sql_type, args)
+            if dtypes is None:
+                continue
+            if column in dtype_map and dtype_map[column] != dtypes:
+                conflicts.add(column)
+            dtype_map[column] = dtypes
+    for column in conflicts:
+        del dtype_map[column]
+    return dtype_map
+
+
+def load_dtype_map(path: str = SCHEMA_PATH) -> Dict[str, Tuple[object, object]]:
+    """
+    Build the dtype map from the dump, or an empty map if it is missing
+
+    Args:
+        path: Path to the .sql dump
+
+    Returns:
+        Dictionary of column -> (dtype, nullable dtype)
+    """
+    if not os.path.exists(path):
+        return {}
+    return build_dtype_map(parse_schema(path))
+
+
+def apply_dtypes(df: pd.DataFrame, dtype_map: Dict[str, Tuple[object, object]]) -> pd.DataFrame:
+    """
+    Convert the columns of a query result to compact, schema-aware dtypes
+
+    Known columns get categoricals (ENUM), int8 (TINYINT), int32 (INT) or
+    float32 (DECIMAL); integer columns containing NULLs from LEFT JOINs use
+    the nullable equivalents. Unknown object columns holding Decimal values
+    (e.g. AVG results) become float64.
+
+    Args:
+        df: Query result
+        dtype_map: Output of build_dtype_map()
+
+    Returns:
+        The same DataFrame with converted columns
+    """
+    for column in df.columns:
+        series = df[column]
+        dtypes = dtype_map.get(column)
+        if dtypes is not None:
+            dtype = dtypes[1] if series.isna().any() else dtypes[0]
+            if (isinstance(dtype, str) and dtype.lower().startswith('int')
+                    and series.dtype.kind == 'f' and (series.dropna() % 1 != 0).any()):
+                # Kolom alias hasil agregasi (mis. AVG) jangan dipotong ke integer
+                continue
+            try:
+                df[column] = series.astype(dtype)
+            except (TypeError, ValueError):
+                pass
+        elif series.dtype == object:
+            first = series.first_valid_index()
+            if first is not None and isinstance(series[first], Decimal):
+                df[column] = pd.to_numeric(series, errors='coerce').astype('float64')
+    return df
+
+
+# ================================================================
+# ARROW TYPES
+# ================================================================
+
+def _column_arrow_type(sql_type: str, args: str):
+    """
+    Map one SQL column type to (Arrow type, enum categories or None)
+
+    Returns:
+        Tuple, or None to let Arrow infer the type
+    """
+    if sql_type == 'enum':
+        categories = [value.replace("''", "'") for value in _ENUM_VALUE_RE.findall(args)]
+        return pa.dictionary(pa.int8(), pa.string()), categories
+    simple = {
+        'tinyint': pa.int8(),
+        'smallint': pa.int16(),
+        'int': pa.int32(),
+        'mediumint': pa.int32(),
+        'bigint': pa.int64(),
+        'decimal': pa.float32(),
+        'float': pa.float32(),
+        'double': pa.float64(),
+        'varchar': pa.string(),
+        'char': pa.string(),
+        'text': pa.string(),
+    }
+    if sql_type in simple:
+        return simple[sql_type], None
+    return None
+
+
+def build_arrow_type_map(schema: Dict[str, List[Tuple[str, str, str]]]) -> Dict[str, tuple]:
+    """
+    Build a column-name keyed Arrow type map from a parsed schema
+
+    Args:
+        schema: Output of parse_schema()
+
+    Returns:
+        Dictionary of column -> (Arrow type, enum categories or None);
+        empty if pyarrow is not installed
+    """
+    if pa is None:
+        return {}
+    type_map = {}
+    conflicts = set()
+    for columns in schema.values():
+        for column, sql_type, args in columns:
+            arrow_type = _column_arrow_type(sql_type, args)
+            if arrow_type is None:
+                continue
+            if column in type_map and type_map[column] != arrow_type:
+                conflicts.add(column)
+            type_map[column] = arrow_type
+    for column in conflicts:
+        del type_map[column]
+    return type_map
+
+
+def load_arrow_type_map(path: str = SCHEMA_PATH) -> Dict[str, tuple]:
+    """
+    Build the Arrow type map from the dump, or an empty map if unavailable
+
+    Args:
+        path: Path to the .sql dump
+
+    Returns:
+        Dictionary of column -> (Arrow type, enum categories or None)
+    """
+    if pa is None or not os.path.exists(path):
+        return {}
+    return build_arrow_type_map(parse_schema(path))
+
+
+def rows_to_record_batch(columns: List[str], rows: List[tuple],
+                         type_map: Dict[str, tuple]):
+    """
+    Build an Arrow RecordBatch column-by-column from cursor rows
+
+    The rows are the driver's Python tuples; they are transposed per batch
+    and copied into Arrow buffers, so the Python objects of one batch can
+    be freed before the next is fetched. Known columns are built straight
+    into their compact Arrow type (enums as int8-indexed dictionaries over
+    the full enum value list); other columns are inferred, with DECIMAL
+    aggregates cast to float64.
+
+    Args:
+        columns: Column names from the cursor
+        rows: Row tuples from fetchmany()/fetchall()
+        type_map: Output of build_arrow_type_map()
+
+    Returns:
+        pyarrow.RecordBatch
+    """
+    values_by_column = list(zip(*rows)) if rows else [()] * len(columns)
+    arrays = []
+    for column, values in zip(columns, values_by_column):
+        arrow_type, categories = type_map.get(column, (None, None))
+        if categories is not None:
+            lookup = {value: index for index, value in enumerate(categories)}
+            indices = [lookup.get(value) for value in values]
+            if any(index is None and value is not None for index, value in zip(indices, values)):
+                # Nilai di luar daftar enum: biarkan Arrow membangun dictionary sendiri
+                array = pa.array(values, type=pa.string()).dictionary_encode()
+            else:
+                array = pa.DictionaryArray.from_arrays(
+                    pa.array(indices, type=pa.int8()), pa.array(categories, type=pa.string())
+                )
+        elif arrow_type is not None:
+            array = pa.array(values)
+            array = array.cast(arrow_type) if array.type != arrow_type else array
+        else:
+            array = pa.array(values)
+            if pa.types.is_decimal(array.type):
+                array = array.cast(pa.float64())
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, names=list(columns))
+
+
+def concat_record_batches(batches: list, columns: List[str]):
+    """
+    Combine record batches into one Table, unifying inferred column types
+
+    Args:
+        batches: List of RecordBatches (may be empty)
+        columns: Column names, used to build an empty table
+
+    Returns:
+        pyarrow.Table
+    """
+    if not batches:
+        return pa.table({column: pa.array([], type=pa.null()) for column in columns})
+    tables = [pa.Table.from_batches([batch]) for batch in batches]
+    try:
+        return pa.concat_tables(tables, promote_options='default')
+    except TypeError:  # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def arrow_to_pandas(table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas at the edge, keeping Arrow-backed dtypes
+
+    Dictionary (enum) columns become pandas categoricals; every other
+    column uses pd.ArrowDtype over the table's buffers, so the frame holds
+    no per-cell Python objects (string columns included).
+
+    Args:
+        table: pyarrow.Table
+
+    Returns:
+        DataFrame with Arrow-backed dtypes
+    """
+    def types_mapper(arrow_type):
+        if pa.types.is_dictionary(arrow_type):
+            return None
+        return pd.ArrowDtype(arrow_type)
+
+    return table.to_pandas(types_mapper=types_mapper)
@@ -0,0 +1,125 @@
+"""
+Search Module
+In-memory n-gram index for typeahead search on respondent names
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+
+# Longest n-gram indexed; longer terms are matched by intersecting their
+# trigrams and verifying the candidates
+MAX_GRAM = 3
+
+
+def _normalize(text) -> str:
+    """Lowercase and collapse whitespace (NULL names become '')"""
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return ''
+    return ' '.join(str(text).lower().split())
+
+
+def _grams(text: str, n: int) -> Set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class NameIndex:
+    """
+    Substring index over respondent names
+
+    Every 1-, 2- and 3-gram of each (lowercased) name maps to the set of
+    ids containing it. A term of up to three characters is exactly one
+    posting, kept sorted once so a limited lookup is a slice. Longer terms
+    intersect the postings of their trigrams, smallest first, and verify
+    the candidate names, so the cost depends on the number of matching
+    names rather than on the table size. Results equal a case-insensitive
+    ``LIKE '%term%'``.
+    """
+
+    def __init__(self, names: Iterable[Tuple[int, object]] = ()):
+        """
+        Build the index
+
+        Args:
+            names: (id_responden, nama) pairs
+        """
+        self.names: Dict[int, str] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self._sorted: Dict[str, List[int]] = {}
+        for id_responden, nama in names:
+            self.add(int(id_responden), nama)
+
+    @classmethod
+    def from_frame(cls, df: Optional[pd.DataFrame]) -> 'NameIndex':
+        """
+        Build the index from a frame with id_responden and nama columns
+
+        Args:
+            df: Respondents frame (None builds an empty index)
+
+        Returns:
+            NameIndex
+        """
+        if df is None or df.empty:
+            return cls()
+        return cls(zip(df['id_responden'].tolist(), df['nama'].tolist()))
+
+    def add(self, id_responden: int, nama):
+        """Index one name (replacing an earlier name of the same id)"""
+        if id_responden in self.names:
+            self.remove(id_responden)
+        text = _normalize(nama)
+        self.names[id_responden] = text
+        for n in range(1, MAX_GRAM + 1):
+            for gram in _grams(text, n):
+                self.postings.setdefault(gram, set()).add(id_responden)
+                self._sorted.pop(gram, None)
+
+    def remove(self, id_responden: int):
+        """Drop one id from the index"""
+        text = self.names.pop(id_responden, None)
+        if text is None:
+            return
+        for n in range(1, MAX_GRAM + 1):
+            for gram in _grams(text, n):
+                self._sorted.pop(gram, None)
+                ids = self.postings.get(gram)
+                if ids is not None:
+                    ids.discard(id_responden)
+                    if not ids:
+                        del self.postings[gram]
+
+    def search(self, term: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Find the ids whose name contains a term
+
+        Args:
+            term: Search text (case-insensitive)
+            limit: Maximum number of ids returned (None = all)
+
+        Returns:
+            Matching ids in ascending order (every id for an empty term)
+        """
+        term = _normalize(term)
+        if not term:
+            return sorted(self.names)[:limit]
+        if len(term) <= MAX_GRAM:
+            return self._sorted_posting(term)[:limit]
+        postings = sorted((self.postings.get(gram, set()) for gram in _grams(term, MAX_GRAM)), key=len)
+        candidates = [i for i in postings[0].intersection(*postings[1:]) if term in self.names[i]]
+        if limit is None:
+            return sorted(candidates)
+        return heapq.nsmallest(limit, candidates)
+
+    def _sorted_posting(self, gram: str) -> List[int]:
+        """Posting of one gram in ascending id order (cached until it changes)"""
+        ids = self._sorted.get(gram)
+        if ids is None:
+            ids = sorted(self.postings.get(gram, ()))
+            self._sorted[gram] = ids
+        return ids
+
+    def __len__(self) -> int:
+        return len(self.names)
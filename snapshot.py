@@ -0,0 +1,489 @@
+"""
+Snapshot Module
+Columnar snapshots of large query results, keyed by table fingerprint and
+shared by every server process (on-disk files or a Redis-protocol server)
+"""
+
+import glob
+import os
+import re
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from schema import arrow_to_pandas
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional; tanpa pyarrow snapshot dinonaktifkan
+    pa = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: tanpa file lock, tiap proses memuat sendiri saat miss
+    fcntl = None
+
+try:
+    import redis
+except ImportError:  # redis opsional; tanpa redis hanya SnapshotStore (file) yang tersedia
+    redis = None
+
+
+# Dataset name -> (Database method, tables the result depends on)
+SNAPSHOT_DATASETS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'master': ('get_master_dataframe',
+               ('responden', 'penggunaan_per_platform', 'master_platform', 'kesehatan_mental')),
+    'usage': ('get_all_usage_data',
+              ('responden', 'penggunaan_per_platform', 'master_platform')),
+    'mental_health': ('get_all_mental_health_data',
+                      ('responden', 'kesehatan_mental')),
+    'respondents': ('get_all_respondents',
+                    ('responden',)),
+}
+
+SNAPSHOT_FORMATS = {'feather': '.feather', 'parquet': '.parquet'}
+
+_SAFE_NAME_RE = re.compile(r'^[\w-]+$')
+
+# Seconds between attempts to take a busy load lock
+_LOCK_POLL_INTERVAL = 0.05
+
+
+def _check_key(name: str, fingerprint: str):
+    """Reject dataset names / fingerprints that are unsafe in file names and keys"""
+    if not _SAFE_NAME_RE.match(name) or not _SAFE_NAME_RE.match(fingerprint):
+        raise ValueError(f"Invalid snapshot key: {name!r}, {fingerprint!r}")
+
+
+def _to_frame(table, arrow: bool) -> pd.DataFrame:
+    """
+    Convert a snapshot table to pandas
+
+    With ``arrow=True`` the columns stay Arrow-backed, so they reference the
+    memory-mapped file (or the fetched buffer) instead of being copied.
+    """
+    return arrow_to_pandas(table) if arrow else table.to_pandas()
+
+
+class BaseSnapshotStore(ABC):
+    """
+    Shared part of the snapshot stores: load-or-query under a load lock
+
+    The lock is shared by every process using the same store, so when a
+    fingerprint changes only one of them queries the database and the
+    others read its snapshot.
+    """
+
+    @property
+    @abstractmethod
+    def available(self) -> bool:
+        """True if the store can be used"""
+
+    @abstractmethod
+    def load(self, name: str, fingerprint: str, arrow: bool = False) -> Optional[pd.DataFrame]:
+        """Read a snapshot, or None on a miss"""
+
+    @abstractmethod
+    def save(self, name: str, fingerprint: str, df: pd.DataFrame) -> bool:
+        """Write a snapshot, returning True if written"""
+
+    @abstractmethod
+    def lock(self, name: str):
+        """Context manager holding the dataset's load lock, yielding True if held"""
+
+    def get_or_load(self, name: str, fingerprint: str,
+                    loader: Callable[[], Optional[pd.DataFrame]],
+                    arrow: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Serve a snapshot, or run the loader and snapshot its result
+
+        On a miss the dataset's load lock is taken first; if another process
+        held it, its snapshot is usually there once the lock is free. If
+        the lock is not free within ``lock_timeout``, the loader runs anyway.
+
+        Args:
+            name: Dataset name
+            fingerprint: Table-version fingerprint
+            loader: Callable querying the database on a miss
+            arrow: Return Arrow-backed (zero-copy) columns, see _to_frame()
+
+        Returns:
+            DataFrame, or None if the loader failed
+        """
+        df = self.load(name, fingerprint, arrow)
+        if df is not None:
+            return df
+        with self.lock(name) as locked:
+            if locked:
+                df = self.load(name, fingerprint, arrow)
+                if df is not None:
+                    return df
+            df = loader()
+            if df is not None:
+                self.save(name, fingerprint, df)
+        return df
+
+
+class SnapshotStore(BaseSnapshotStore):
+    """
+    Directory of Feather/Parquet files named ``<dataset>-<fingerprint>``
+
+    A snapshot is only valid for the fingerprint it was written with, so a
+    changed fingerprint simply misses and the stale file is replaced on the
+    next save. Feather files are written uncompressed so they can be read
+    memory-mapped; processes on one host sharing the directory (e.g. on
+    /dev/shm) then share the pages of one copy. Loads are serialized
+    across processes by a ``<dataset>.lock`` file (flock).
+    """
+
+    def __init__(self, directory: str, fmt: str = 'feather', lock_timeout: float = 30.0):
+        """
+        Initialize the store
+
+        Args:
+            directory: Directory holding the snapshot files (created if missing)
+            fmt: 'feather' or 'parquet'
+            lock_timeout: Seconds to wait for another process loading the same dataset
+        """
+        if fmt not in SNAPSHOT_FORMATS:
+            raise ValueError(f"fmt must be one of {tuple(SNAPSHOT_FORMATS)}, got {fmt!r}")
+        self.directory = directory
+        self.fmt = fmt
+        self.extension = SNAPSHOT_FORMATS[fmt]
+        self.lock_timeout = lock_timeout
+
+    @property
+    def available(self) -> bool:
+        """True if pyarrow is installed"""
+        return pa is not None
+
+    def path_for(self, name: str, fingerprint: str) -> str:
+        """
+        Get the file path of a snapshot
+
+        Args:
+            name: Dataset name
+            fingerprint: Table-version fingerprint
+
+        Returns:
+            Absolute file path
+        """
+        _check_key(name, fingerprint)
+        return os.path.join(self.directory, f"{name}-{fingerprint}{self.extension}")
+
+    def load(self, name: str, fingerprint: str, arrow: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Read a snapshot memory-mapped, if one exists for this fingerprint
+
+        Args:
+            name: Dataset name
+            fingerprint: Table-version fingerprint
+            arrow: Return Arrow-backed columns over the mapped file (no copy)
+
+        Returns:
+            DataFrame, or None on a miss
+        """
+        if not self.available:
+            return None
+        path = self.path_for(name, fingerprint)
+        if not os.path.exists(path):
+            return None
+        try:
+            if self.fmt == 'feather':
+                table = feather.read_table(path, memory_map=True)
+            else:
+                table = pq.read_table(path, memory_map=True)
+            return _to_frame(table, arrow)
+        except (OSError, pa.ArrowException) as e:
+            print(f"Error reading snapshot {path}: {e}")
+            return None
+
+    def save(self, name: str, fingerprint: str, df: pd.DataFrame) -> bool:
+        """
+        Write a snapshot atomically and remove older snapshots of the dataset
+
+        Args:
+            name: Dataset name
+            fingerprint: Table-version fingerprint
+            df: Result to store
+
+        Returns:
+            bool: True if written
+        """
+        if not self.available:
+            return False
+        path = self.path_for(name, fingerprint)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            os.close(fd)
+            try:
+                if self.fmt == 'feather':
+                    feather.write_feather(table, tmp_path, compression='uncompressed')
+                else:
+                    pq.write_table(table, tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except (OSError, pa.ArrowException) as e:
+            print(f"Error writing snapshot {path}: {e}")
+            return False
+        self.prune(name, keep=path)
+        return True
+
+    def prune(self, name: str, keep: Optional[str] = None):
+        """
+        Delete snapshots of a dataset except ``keep``
+
+        Args:
+            name: Dataset name
+            keep: Path to keep
+        """
+        pattern = os.path.join(self.directory, f"{name}-*{self.extension}")
+        for path in glob.glob(pattern):
+            if path != keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @contextmanager
+    def lock(self, name: str) -> Iterator[bool]:
+        """
+        Hold the dataset's load lock (an exclusive flock, so across processes)
+
+        Args:
+            name: Dataset name
+
+        Yields:
+            True if the lock is held, False if it timed out or file locks
+            are not supported
+        """
+        if fcntl is None:
+            yield False
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            handle = open(os.path.join(self.directory, f"{name}.lock"), 'a')
+        except OSError as e:
+            print(f"Error opening snapshot lock {name}: {e}")
+            yield False
+            return
+        with handle:
+            deadline = time.monotonic() + self.lock_timeout
+            while True:
+                try:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        yield False
+                        return
+                    time.sleep(_LOCK_POLL_INTERVAL)
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class RedisSnapshotStore(BaseSnapshotStore):
+    """
+    Snapshots kept on a Redis-protocol server, shared by every replica
+
+    Each snapshot is serialized once as an uncompressed Arrow IPC stream
+    under ``<prefix>:<dataset>:<fingerprint>``; readers build the table
+    over the fetched buffer without copying it. ``<prefix>:<dataset>``
+    points at the current fingerprint, so the previous snapshot is deleted
+    on the next save. Loads are serialized across replicas by a
+    ``SET NX PX`` lock that expires after ``lock_timeout``.
+
+    Any client with redis-py's get/set/delete signatures works, e.g. a
+    local stand-in server for offline runs.
+    """
+
+    def __init__(self, client=None, url: str = 'redis://localhost:6379/0',
+                 prefix: str = 'uas_basdat:snapshot', ttl: Optional[float] = None,
+                 lock_timeout: float = 30.0):
+        """
+        Initialize the store
+
+        Args:
+            client: Redis client; None connects to ``url`` with redis-py
+            url: Server URL used when no client is given
+            prefix: Key prefix of this dashboard's snapshots
+            ttl: Seconds a snapshot is kept (None = until replaced)
+            lock_timeout: Seconds to wait for another replica loading the
+                same dataset (also the lock's expiry)
+        """
+        if client is None and redis is not None:
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self._errors = (redis.RedisError, OSError) if redis is not None else (OSError,)
+
+    @property
+    def available(self) -> bool:
+        """True if pyarrow is installed and there is a client (see ping for the server)"""
+        return pa is not None and self.client is not None
+
+    def ping(self) -> bool:
+        """
+        Check that the server answers
+
+        Returns:
+            bool: True if reachable
+        """
+        if self.client is None:
+            return False
+        try:
+            return bool(self.client.ping())
+        except self._errors as e:
+            print(f"Error reaching snapshot server: {e}")
+            return False
+
+    def _key(self, name: str, fingerprint: str) -> str:
+        _check_key(name, fingerprint)
+        return f"{self.prefix}:{name}:{fingerprint}"
+
+    def load(self, name: str, fingerprint: str, arrow: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Read a snapshot, if one exists for this fingerprint
+
+        Args:
+            name: Dataset name
+            fingerprint: Table-version fingerprint
+            arrow: Return Arrow-backed columns over the fetched buffer (no copy)
+
+        Returns:
+            DataFrame, or None on a miss
+        """
+        if not self.available:
+            return None
+        key = self._key(name, fingerprint)
+        try:
+            payload = self.client.get(key)
+            if payload is None:
+                return None
+            table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+            return _to_frame(table, arrow)
+        except self._errors + (pa.ArrowException,) as e:
+            print(f"Error reading snapshot {key}: {e}")
+            return None
+
+    def save(self, name: str, fingerprint: str, df: pd.DataFrame) -> bool:
+        """
+        Write a snapshot and delete the dataset's previous one
+
+        Args:
+            name: Dataset name
+            fingerprint: Table-version fingerprint
+            df: Result to store
+
+        Returns:
+            bool: True if written
+        """
+        if not self.available:
+            return False
+        key = self._key(name, fingerprint)
+        current_key = f"{self.prefix}:{name}"
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            expiry = int(self.ttl * 1000) if self.ttl else None
+            self.client.set(key, sink.getvalue().to_pybytes(), px=expiry)
+            previous = self.client.get(current_key)
+            self.client.set(current_key, fingerprint, px=expiry)
+        except self._errors + (pa.ArrowException,) as e:
+            print(f"Error writing snapshot {key}: {e}")
+            return False
+        if isinstance(previous, bytes):
+            previous = previous.decode('utf-8')
+        if previous and previous != fingerprint:
+            try:
+                self.client.delete(self._key(name, previous))
+            except (self._errors + (ValueError,)):
+                pass
+        return True
+
+    @contextmanager
+    def lock(self, name: str) -> Iterator[bool]:
+        """
+        Hold the dataset's load lock on the server (so across replicas)
+
+        Args:
+            name: Dataset name
+
+        Yields:
+            True if the lock is held, False if it timed out or the server
+            is unreachable
+        """
+        key = f"{self.prefix}:{name}:lock"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_timeout
+        acquired = False
+        try:
+            while not acquired and time.monotonic() < deadline:
+                acquired = bool(self.client.set(key, token, nx=True,
+                                                px=int(self.lock_timeout * 1000)))
+                if not acquired:
+                    time.sleep(_LOCK_POLL_INTERVAL)
+        except self._errors as e:
+            print(f"Error taking snapshot lock {key}: {e}")
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    # Hanya hapus lock milik sendiri (bisa sudah kedaluwarsa)
+                    if self.client.get(key) in (token, token.encode('utf-8')):
+                        self.client.delete(key)
+                except self._errors:
+                    pass
+
+
+class SnapshotCache:
+    """Serves the SNAPSHOT_DATASETS from a SnapshotStore, querying MySQL only on change"""
+
+    def __init__(self, db, store: BaseSnapshotStore):
+        """
+        Initialize the cache
+
+        Args:
+            db: Database instance
+            store: SnapshotStore (files) or RedisSnapshotStore
+        """
+        self.db = db
+        self.store = store
+
+    def get(self, name: str, **kwargs) -> Optional[pd.DataFrame]:
+        """
+        Get a dataset, from disk if its tables are unchanged
+
+        Args:
+            name: Key of SNAPSHOT_DATASETS
+            **kwargs: Passed to the Database method on a miss
+
+        Returns:
+            DataFrame, or None if loading failed
+        """
+        method_name, tables = SNAPSHOT_DATASETS[name]
+        loader = lambda: getattr(self.db, method_name)(**kwargs)
+        fingerprint = self.db.get_table_fingerprint(tables) if self.store.available else None
+        if fingerprint is None:
+            return loader()
+        # fetch_mode='arrow' mendapat kolom Arrow langsung di atas snapshot (tanpa salinan)
+        return self.store.get_or_load(name, fingerprint, loader,
+                                      arrow=kwargs.get('fetch_mode') == 'arrow')
@@ -0,0 +1,562 @@
+"""
+Synthetic Module
+Scaled survey datasets sampled from the distributions of uas_basdat.sql
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from database import Database, MENTAL_ATTRIBUTES, SUMMARY_TABLES
+from schema import SCHEMA_PATH
+from sqlite_backend import SQLiteBackend, stamp_load, translate_dump
+
+
+# Named dataset sizes (respondents)
+SCALES = {'10k': 10_000, '1m': 1_000_000, '10m': 10_000_000}
+
+DEFAULT_SEED = 42
+
+# Respondents sampled per chunk; the output depends on (seed, chunk_size)
+CHUNK_SIZE = 100_000
+
+# Rows per INSERT statement in the generated dump (mysqldump default style)
+INSERT_ROWS = 1000
+
+# Generated tables and their columns, in dump order
+GENERATED_COLUMNS = {
+    'kesehatan_mental': ('id_kesehatan', 'id_responden') + MENTAL_ATTRIBUTES,
+    'penggunaan_per_platform': ('id_penggunaan', 'id_responden', 'id_platform', 'jam_per_hari',
+                                'tujuan_penggunaan', 'frekuensi_buka_per_hari'),
+    'responden': ('id_responden', 'nama', 'usia', 'jenis_kelamin', 'status_hubungan',
+                  'pekerjaan', 'menggunakan_medsos'),
+}
+
+# AUTO_INCREMENT column of each generated table
+SERIAL_COLUMNS = {
+    'kesehatan_mental': 'id_kesehatan',
+    'penggunaan_per_platform': 'id_penggunaan',
+    'responden': 'id_responden',
+}
+
+GENDERS = ('Laki-laki', 'Perempuan')
+STATUSES = ('Belum Kawin', 'Kawin', 'Cerai Hidup', 'Cerai Mati')
+
+# Value ranges of the generated columns (jam in tenths of an hour)
+SCORE_RANGE = (1, 5)
+HOURS_TENTHS_RANGE = (1, 240)
+FREQUENCY_RANGE = (1, 127)
+
+_INSERT_RE = re.compile(r"^INSERT INTO `(\w+)` \(([^)]*)\) VALUES\n.*?\);$", re.S | re.M)
+_SERIAL_RE = re.compile(r"(MODIFY `(\w+)` int\(11\) NOT NULL AUTO_INCREMENT)(?:, AUTO_INCREMENT=\d+)?;")
+
+
+# ================================================================
+# MODEL
+# ================================================================
+
+class SurveyModel:
+    """
+    Distributions learned from the survey tables
+
+    Demographics are resampled as whole rows (so the gender/status/job mix
+    and the age per job stay joint) with +-1 year of age jitter. The number
+    of platforms is drawn per medsos answer, the platforms by popularity,
+    and each usage row bootstraps a (jam, tujuan, frekuensi) row of the same
+    platform with multiplicative jitter. Mental scores are drawn from a
+    multivariate normal conditioned on the respondent's total hours per
+    day, then rounded and clipped to 1-5.
+    """
+
+    def __init__(self, respondents: pd.DataFrame, usage: pd.DataFrame, mental: pd.DataFrame):
+        """
+        Fit the model
+
+        Args:
+            respondents: responden rows
+            usage: penggunaan_per_platform rows
+            mental: kesehatan_mental rows
+        """
+        respondents = respondents.reset_index(drop=True)
+        usage = usage.assign(jam_tenths=(usage['jam_per_hari'].astype(float) * 10).round().astype(np.int64))
+
+        # Demographic rows and the age range per job
+        self.demographics = respondents[['usia', 'jenis_kelamin', 'status_hubungan', 'pekerjaan',
+                                         'menggunakan_medsos']].astype(
+            {'usia': np.int64, 'jenis_kelamin': str, 'status_hubungan': str, 'pekerjaan': str,
+             'menggunakan_medsos': str})
+        ages = self.demographics.groupby('pekerjaan')['usia']
+        self.age_bounds = {job: (int(low), int(high)) for job, low, high
+                           in zip(ages.min().index, ages.min(), ages.max())}
+
+        # Names: first token per gender, last token drawn independently
+        named = respondents.dropna(subset=['nama'])
+        names = named['nama'].astype(str).str.split(' ', n=1)
+        self.first_names = {gender: np.array(sorted({parts[0] for parts in group}))
+                            for gender, group in names.groupby(named['jenis_kelamin'].astype(str))}
+        self.last_names = np.array(sorted({parts[1] for parts in names if len(parts) > 1}) or [''])
+        self.missing_name_rate = float(respondents['nama'].isna().mean())
+
+        # Platforms per respondent, per medsos answer
+        counts = usage.groupby('id_responden').size()
+        platform_counts = respondents['id_responden'].map(counts).fillna(0).astype(np.int64)
+        self.platform_counts = {}
+        for answer, group in platform_counts.groupby(self.demographics['menggunakan_medsos']):
+            distribution = group.value_counts(normalize=True).sort_index()
+            self.platform_counts[answer] = (distribution.index.to_numpy(np.int64),
+                                            distribution.to_numpy(float))
+
+        # Platform popularity and the usage rows of each platform
+        usage = usage.sort_values(['id_platform', 'id_penggunaan'], kind='stable')
+        self.platforms = np.sort(usage['id_platform'].unique()).astype(np.int64)
+        popularity = usage['id_platform'].value_counts().reindex(self.platforms).to_numpy(float)
+        self.log_popularity = np.log(popularity / popularity.sum())
+        self.usage_rows = {
+            'jam_tenths': usage['jam_tenths'].to_numpy(np.int64),
+            'tujuan_penggunaan': usage['tujuan_penggunaan'].astype(str).to_numpy(),
+            'frekuensi_buka_per_hari': usage['frekuensi_buka_per_hari'].to_numpy(np.int64),
+        }
+        sizes = usage.groupby('id_platform').size().reindex(self.platforms).to_numpy(np.int64)
+        self.platform_offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        self.platform_sizes = sizes
+
+        # Mental scores conditioned on total hours per day
+        self.mental_rate = float(respondents['id_responden'].isin(mental['id_responden']).mean())
+        total_hours = (usage.groupby('id_responden')['jam_tenths'].sum() / 10.0)
+        scores = mental.set_index('id_responden')[list(MENTAL_ATTRIBUTES)].astype(float)
+        hours = total_hours.reindex(scores.index).fillna(0.0).to_numpy()
+        joint = np.column_stack([hours, scores.to_numpy()])
+        mean = joint.mean(axis=0)
+        covariance = np.cov(joint, rowvar=False)
+        hours_variance = covariance[0, 0] if covariance[0, 0] > 0 else 1.0
+        self.hours_mean = mean[0]
+        self.score_mean = mean[1:]
+        self.score_slope = covariance[1:, 0] / hours_variance
+        residual = covariance[1:, 1:] - np.outer(covariance[1:, 0], covariance[0, 1:]) / hours_variance
+        eigenvalues, eigenvectors = np.linalg.eigh(residual)
+        self.score_factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+    @classmethod
+    def from_dump(cls, path: str = SCHEMA_PATH) -> 'SurveyModel':
+        """
+        Fit the model on the data of a dump (loaded into an in-memory SQLite)
+
+        Args:
+            path: MySQL dump in the uas_basdat.sql format
+
+        Returns:
+            SurveyModel
+        """
+        backend = SQLiteBackend(dump_path=path)
+        db = Database(backend=backend, pool_size=1, compact_dtypes=False, use_summary_tables=False)
+        try:
+            respondents = db.execute_query("SELECT * FROM responden ORDER BY id_responden")
+            usage = db.execute_query("SELECT * FROM penggunaan_per_platform ORDER BY id_penggunaan")
+            mental = db.execute_query("SELECT * FROM kesehatan_mental ORDER BY id_kesehatan")
+        finally:
+            db.disconnect()
+            backend.close()
+        return cls(respondents, usage, mental)
+
+    def sample(self, n: int, rng: np.random.Generator, first_id: int = 1,
+               first_usage_id: int = 1, first_mental_id: int = 1) -> Dict[str, pd.DataFrame]:
+        """
+        Sample n respondents with their usage and mental rows
+
+        Args:
+            n: Number of respondents
+            rng: Random generator
+            first_id: id_responden of the first respondent
+            first_usage_id: id_penggunaan of the first usage row
+            first_mental_id: id_kesehatan of the first mental row
+
+        Returns:
+            Dictionary of table -> DataFrame with the GENERATED_COLUMNS
+        """
+        ids = np.arange(first_id, first_id + n, dtype=np.int64)
+
+        # Demographics
+        demographics = self.demographics.iloc[rng.integers(0, len(self.demographics), n)]
+        demographics = demographics.reset_index(drop=True)
+        low = demographics['pekerjaan'].map(lambda job: self.age_bounds[job][0]).to_numpy()
+        high = demographics['pekerjaan'].map(lambda job: self.age_bounds[job][1]).to_numpy()
+        ages = np.clip(demographics['usia'].to_numpy() + rng.integers(-1, 2, n), low, high)
+        genders = demographics['jenis_kelamin'].to_numpy()
+        first = np.empty(n, dtype=object)
+        for gender, pool in self.first_names.items():
+            mask = genders == gender
+            first[mask] = pool[rng.integers(0, len(pool), int(mask.sum()))]
+        last = self.last_names[rng.integers(0, len(self.last_names), n)]
+        names = pd.Series(first + ' ' + last.astype(object), dtype=object)
+        if self.missing_name_rate:
+            names[rng.random(n) < self.missing_name_rate] = None
+        respondents = pd.DataFrame({
+            'id_responden': ids,
+            'nama': names,
+            'usia': ages,
+            'jenis_kelamin': demographics['jenis_kelamin'].to_numpy(),
+            'status_hubungan': demographics['status_hubungan'].to_numpy(),
+            'pekerjaan': demographics['pekerjaan'].to_numpy(),
+            'menggunakan_medsos': demographics['menggunakan_medsos'].to_numpy(),
+        })
+
+        # Platforms: k per respondent without replacement, by popularity (Gumbel top-k)
+        counts = np.zeros(n, dtype=np.int64)
+        for answer, (values, probabilities) in self.platform_counts.items():
+            mask = respondents['menggunakan_medsos'].to_numpy() == answer
+            counts[mask] = rng.choice(values, size=int(mask.sum()), p=probabilities)
+        counts = np.minimum(counts, len(self.platforms))
+        keys = self.log_popularity + rng.gumbel(size=(n, len(self.platforms)))
+        ranks = np.argsort(np.argsort(-keys, axis=1), axis=1)
+        owner, column = np.nonzero(ranks < counts[:, None])
+        platform = self.platforms[column]
+
+        # Usage rows bootstrapped per platform with jitter
+        source = self.platform_offsets[column] + (rng.random(len(column)) * self.platform_sizes[column]).astype(np.int64)
+        jitter = rng.lognormal(0.0, 0.15, (2, len(source)))
+        hours = np.clip(np.rint(self.usage_rows['jam_tenths'][source] * jitter[0]), *HOURS_TENTHS_RANGE)
+        frequency = np.clip(np.rint(self.usage_rows['frekuensi_buka_per_hari'][source] * jitter[1]),
+                            *FREQUENCY_RANGE)
+        usage = pd.DataFrame({
+            'id_penggunaan': np.arange(first_usage_id, first_usage_id + len(source), dtype=np.int64),
+            'id_responden': ids[owner],
+            'id_platform': platform,
+            'jam_per_hari': hours.astype(np.int64) / 10.0,
+            'tujuan_penggunaan': self.usage_rows['tujuan_penggunaan'][source],
+            'frekuensi_buka_per_hari': frequency.astype(np.int64),
+        })
+
+        # Mental scores given total hours
+        has_mental = rng.random(n) < self.mental_rate
+        total_hours = np.bincount(owner, weights=hours, minlength=n) / 10.0
+        noise = rng.standard_normal((int(has_mental.sum()), len(MENTAL_ATTRIBUTES)))
+        scores = (self.score_mean + np.outer(total_hours[has_mental] - self.hours_mean, self.score_slope)
+                  + noise @ self.score_factor.T)
+        scores = np.clip(np.rint(scores), *SCORE_RANGE).astype(np.int64)
+        mental = pd.DataFrame(scores, columns=list(MENTAL_ATTRIBUTES))
+        mental.insert(0, 'id_responden', ids[has_mental])
+        mental.insert(0, 'id_kesehatan', np.arange(first_mental_id, first_mental_id + len(mental),
+                                                  dtype=np.int64))
+        return {'kesehatan_mental': mental, 'penggunaan_per_platform': usage, 'responden': respondents}
+
+
+def generate(model: SurveyModel, n: int, seed: int = DEFAULT_SEED,
+             chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, pd.DataFrame]]:
+    """
+    Sample n respondents chunk by chunk
+
+    Every chunk has its own generator spawned from the seed, so the same
+    (seed, chunk_size) always yields the same rows.
+
+    Args:
+        model: Fitted SurveyModel
+        n: Number of respondents
+        seed: Random seed
+        chunk_size: Respondents per chunk
+
+    Yields:
+        Dictionary of table -> DataFrame per chunk, ids continuing from 1
+    """
+    chunks = max(1, -(-n // chunk_size))
+    seeds = np.random.SeedSequence(seed).spawn(chunks)
+    next_ids = {table: 1 for table in GENERATED_COLUMNS}
+    for index, chunk_seed in enumerate(seeds):
+        size = min(chunk_size, n - index * chunk_size)
+        chunk = model.sample(size, np.random.default_rng(chunk_seed), next_ids['responden'],
+                             next_ids['penggunaan_per_platform'], next_ids['kesehatan_mental'])
+        for table, df in chunk.items():
+            next_ids[table] += len(df)
+        yield chunk
+
+
+# ================================================================
+# SUMMARY TABLES
+# ================================================================
+
+class _Summaries:
+    """Running ringkasan_* values (hours kept in integer tenths)"""
+
+    def __init__(self):
+        self.respondents = {key: np.zeros(2 + len(MENTAL_ATTRIBUTES), dtype=np.int64)
+                            for key in ((g, s) for g in GENDERS for s in STATUSES)}
+        self.usage: Dict[tuple, np.ndarray] = {}
+        self.usage_mental = {gender: np.zeros(4, dtype=np.int64) for gender in GENDERS}
+
+    def add(self, chunk: Dict[str, pd.DataFrame]):
+        respondents = chunk['responden'].set_index('id_responden')
+        usage = chunk['penggunaan_per_platform']
+        usage = usage.assign(jenis_kelamin=respondents['jenis_kelamin'].reindex(usage['id_responden']).to_numpy(),
+                             jam_tenths=np.rint(usage['jam_per_hari'] * 10).astype(np.int64))
+        mental = chunk['kesehatan_mental'].set_index('id_responden')[list(MENTAL_ATTRIBUTES)]
+
+        joined = respondents[['jenis_kelamin', 'status_hubungan']].join(mental, how='left')
+        joined['jumlah_mental'] = joined[MENTAL_ATTRIBUTES[0]].notna().astype(np.int64)
+        grouped = joined.fillna(0).groupby(['jenis_kelamin', 'status_hubungan'])
+        sums = grouped[['jumlah_mental'] + list(MENTAL_ATTRIBUTES)].sum()
+        for key, size in grouped.size().items():
+            self.respondents[key] += np.concatenate([[size], sums.loc[key].to_numpy(np.int64)])
+
+        grouped = usage.groupby(['jenis_kelamin', 'id_platform', 'tujuan_penggunaan'])
+        sums = grouped[['jam_tenths', 'frekuensi_buka_per_hari']].sum()
+        for key, size in grouped.size().items():
+            totals = self.usage.setdefault(key, np.zeros(3, dtype=np.int64))
+            totals += np.concatenate([[size], sums.loc[key].to_numpy(np.int64)])
+
+        with_mental = usage.join(mental[['depresi', 'kecemasan']], on='id_responden', how='inner')
+        grouped = with_mental.groupby('jenis_kelamin')
+        sums = grouped[['jam_tenths', 'depresi', 'kecemasan']].sum()
+        for gender, size in grouped.size().items():
+            self.usage_mental[gender] += np.concatenate([[size], sums.loc[gender].to_numpy(np.int64)])
+
+    def rows(self) -> Dict[str, List[tuple]]:
+        """Rows per summary table, in primary key order, with hours as decimals"""
+        def hours(tenths):
+            return Decimal(tenths).scaleb(-1)
+
+        return {
+            'ringkasan_penggunaan': [key + (int(v[0]), hours(int(v[1])), int(v[2]))
+                                     for key, v in sorted(self.usage.items())],
+            'ringkasan_penggunaan_mental': [(gender, int(v[0]), hours(int(v[1])), int(v[2]), int(v[3]))
+                                            for gender, v in sorted(self.usage_mental.items())],
+            'ringkasan_responden': [key + tuple(int(x) for x in v)
+                                    for key, v in sorted(self.respondents.items())],
+        }
+
+
+# ================================================================
+# WRITERS
+# ================================================================
+
+def _sql_literal(value) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("\\", "\\\\").replace("'", "''") + "'"
+    return str(value)
+
+
+def _value_lines(df: pd.DataFrame, columns) -> List[str]:
+    """One '(v1, v2, ...)' line per row"""
+    formatted = []
+    for column in columns:
+        values = df[column]
+        if column == 'jam_per_hari':
+            formatted.append(np.char.mod('%.1f', values.to_numpy(float)).tolist())
+        elif values.dtype == object:
+            formatted.append(["NULL" if v is None else
+                              "'" + v.replace("\\", "\\\\").replace("'", "''") + "'" for v in values])
+        else:
+            formatted.append(values.astype(str).tolist())
+    return ["(" + ", ".join(row) + ")" for row in zip(*formatted)]
+
+
+def _insert_statements(table: str, header: str, lines: List[str]) -> Iterator[str]:
+    for start in range(0, len(lines), INSERT_ROWS):
+        yield (f"INSERT INTO `{table}` ({header}) VALUES\n"
+               + ",\n".join(lines[start:start + INSERT_ROWS]) + ";\n")
+
+
+def write_sql(path: str, n: int, seed: int = DEFAULT_SEED, model: Optional[SurveyModel] = None,
+              template: str = SCHEMA_PATH, chunk_size: int = CHUNK_SIZE) -> Dict[str, int]:
+    """
+    Write a full dump in the uas_basdat.sql format with generated data
+
+    The schema, procedures, triggers and master_platform come from the
+    template; the data of the generated tables and the ringkasan_* tables
+    is replaced and the AUTO_INCREMENT counters are moved past the new ids.
+    The dump imports into MySQL as usual and loads into
+    SQLiteBackend(dump_path=path).
+
+    Args:
+        path: Output .sql file
+        n: Number of respondents
+        seed: Random seed
+        model: Fitted model (None = fit on the template)
+        template: Dump providing the schema and the source data
+        chunk_size: Respondents sampled per chunk
+
+    Returns:
+        Dictionary of table -> generated row count
+    """
+    model = model or SurveyModel.from_dump(template)
+    with open(template, encoding='utf-8') as f:
+        dump = f.read()
+    headers = {table: header for table, header in _INSERT_RE.findall(dump)}
+
+    summaries = _Summaries()
+    rows = {table: 0 for table in GENERATED_COLUMNS}
+    with tempfile.TemporaryDirectory() as scratch:
+        parts = {table: open(os.path.join(scratch, f"{table}.sql"), 'w', encoding='utf-8')
+                 for table in GENERATED_COLUMNS}
+        try:
+            for chunk in generate(model, n, seed, chunk_size):
+                summaries.add(chunk)
+                for table, columns in GENERATED_COLUMNS.items():
+                    rows[table] += len(chunk[table])
+                    lines = _value_lines(chunk[table], columns)
+                    parts[table].writelines(_insert_statements(table, headers[table], lines))
+        finally:
+            for part in parts.values():
+                part.close()
+
+        summary_rows = summaries.rows()
+        next_ids = {SERIAL_COLUMNS[table]: count + 1 for table, count in rows.items()}
+        dump = _SERIAL_RE.sub(
+            lambda m: (f"{m.group(1)}, AUTO_INCREMENT={next_ids[m.group(2)]};"
+                       if m.group(2) in next_ids else m.group(0)), dump)
+
+        with open(path, 'w', encoding='utf-8') as out:
+            position = 0
+            for match in _INSERT_RE.finditer(dump):
+                table = match.group(1)
+                if table not in GENERATED_COLUMNS and table not in SUMMARY_TABLES:
+                    continue
+                out.write(dump[position:match.start()])
+                if table in GENERATED_COLUMNS:
+                    with open(os.path.join(scratch, f"{table}.sql"), encoding='utf-8') as part:
+                        shutil.copyfileobj(part, out)
+                else:
+                    lines = ["(" + ", ".join(_sql_literal(v) for v in row) + ")"
+                             for row in summary_rows[table]]
+                    out.write("".join(_insert_statements(table, match.group(2), lines)))
+                # Generated statements end with ";\n"; skip the template's newline
+                position = match.end() + 1
+            out.write(dump[position:])
+    return rows
+
+
+def write_csv(directory: str, n: int, seed: int = DEFAULT_SEED, model: Optional[SurveyModel] = None,
+              chunk_size: int = CHUNK_SIZE) -> Dict[str, str]:
+    """
+    Write one CSV per generated table (NULL as \\N, for LOAD DATA INFILE)
+
+    Load them into an empty schema with foreign_key_checks off, then run
+    CALL rebuild_ringkasan() to fill the summary tables.
+
+    Args:
+        directory: Output directory (created if missing)
+        n: Number of respondents
+        seed: Random seed
+        model: Fitted model (None = fit on uas_basdat.sql)
+        chunk_size: Respondents sampled per chunk
+
+    Returns:
+        Dictionary of table -> CSV path
+    """
+    model = model or SurveyModel.from_dump()
+    os.makedirs(directory, exist_ok=True)
+    paths = {table: os.path.join(directory, f"{table}.csv") for table in GENERATED_COLUMNS}
+    for index, chunk in enumerate(generate(model, n, seed, chunk_size)):
+        for table, columns in GENERATED_COLUMNS.items():
+            chunk[table].to_csv(paths[table], columns=list(columns), index=False,
+                                header=index == 0, mode='w' if index == 0 else 'a',
+                                na_rep='\\N', float_format='%.1f')
+    return paths
+
+
+def write_sqlite(path: str, n: int, seed: int = DEFAULT_SEED, model: Optional[SurveyModel] = None,
+                 template: str = SCHEMA_PATH, chunk_size: int = CHUNK_SIZE) -> Dict[str, int]:
+    """
+    Build a SQLite database file for SQLiteBackend(path=path)
+
+    Tables come from the template; the generated rows are bulk inserted
+    before the secondary indexes and triggers are created, the summary
+    tables are filled from the generated rows and the statistics analyzed.
+
+    Args:
+        path: Output .sqlite file (replaced if it exists)
+        n: Number of respondents
+        seed: Random seed
+        model: Fitted model (None = fit on the template)
+        template: Dump providing the schema and master_platform
+        chunk_size: Respondents sampled per chunk
+
+    Returns:
+        Dictionary of table -> generated row count
+    """
+    model = model or SurveyModel.from_dump(template)
+    with open(template, encoding='utf-8') as f:
+        dump = f.read()
+    statements, _ = translate_dump(dump)
+    headers = {table: header for table, header in _INSERT_RE.findall(dump)}
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    skipped_inserts = tuple(f"INSERT INTO `{table}`" for table in (*GENERATED_COLUMNS, *SUMMARY_TABLES))
+    deferred = [s for s in statements if s.startswith(('CREATE INDEX', 'CREATE TRIGGER'))]
+    upfront = [s for s in statements if s not in deferred and not s.startswith(skipped_inserts)]
+
+    raw = sqlite3.connect(path, isolation_level=None)
+    summaries = _Summaries()
+    rows = {table: 0 for table in GENERATED_COLUMNS}
+    try:
+        raw.execute("PRAGMA journal_mode = WAL")
+        raw.execute("PRAGMA synchronous = OFF")
+        raw.execute("BEGIN")
+        for statement in upfront:
+            raw.execute(statement)
+        for chunk in generate(model, n, seed, chunk_size):
+            summaries.add(chunk)
+            for table, columns in GENERATED_COLUMNS.items():
+                df = chunk[table]
+                rows[table] += len(df)
+                placeholders = ", ".join("?" * len(columns))
+                raw.executemany(f"INSERT INTO `{table}` ({', '.join(columns)}) VALUES ({placeholders})",
+                                zip(*(df[column].tolist() for column in columns)))
+        for statement in deferred:
+            if statement.startswith('CREATE INDEX'):
+                raw.execute(statement)
+        raw.execute("COMMIT")
+
+        # Summary rows computed while generating (exact decimal hour sums)
+        raw.execute("BEGIN")
+        for table, summary in summaries.rows().items():
+            placeholders = ", ".join("?" * len(summary[0]))
+            raw.executemany(f"INSERT INTO `{table}` ({headers[table]}) VALUES ({placeholders})",
+                            [tuple(float(v) if isinstance(v, Decimal) else v for v in row)
+                             for row in summary])
+        for statement in deferred:
+            if statement.startswith('CREATE TRIGGER'):
+                raw.execute(statement)
+        raw.execute("COMMIT")
+        raw.execute("ANALYZE")
+        stamp_load(raw)
+    finally:
+        raw.close()
+    return rows
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate a scaled synthetic survey dataset")
+    parser.add_argument('output', help="Output .sql / .sqlite file or CSV directory")
+    parser.add_argument('--scale', default='10k',
+                        help=f"{', '.join(SCALES)} or a number of respondents")
+    parser.add_argument('--format', choices=('sql', 'csv', 'sqlite'), default='sql')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--template', default=SCHEMA_PATH, help="Dump to learn the distributions from")
+    args = parser.parse_args(argv)
+
+    n = SCALES[args.scale.lower()] if args.scale.lower() in SCALES else int(args.scale)
+    model = SurveyModel.from_dump(args.template)
+    if args.format == 'csv':
+        result = write_csv(args.output, n, args.seed, model, args.chunk_size)
+    elif args.format == 'sqlite':
+        result = write_sqlite(args.output, n, args.seed, model, args.template, args.chunk_size)
+    else:
+        result = write_sql(args.output, n, args.seed, model, args.template, args.chunk_size)
+    for table, value in result.items():
+        print(f"{table}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Shared fixtures: every test runs against the embedded SQLite backend
+(sqlite_backend.SQLiteBackend), so no MySQL server is needed
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Database  # noqa: E402
+from sqlite_backend import SQLiteBackend  # noqa: E402
+from synthetic import write_sql  # noqa: E402
+
+
+@pytest.fixture
+def backend():
+    """In-memory database loaded from the shipped uas_basdat.sql"""
+    backend = SQLiteBackend()
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def db(backend):
+    """Database on the embedded backend"""
+    db = Database(backend=backend)
+    yield db
+    db.disconnect()
+
+
+@pytest.fixture(scope='session')
+def synthetic_dump(tmp_path_factory):
+    """A generated dump with a different number of respondents than uas_basdat.sql"""
+    path = str(tmp_path_factory.mktemp('dumps') / 'synthetic.sql')
+    write_sql(path, 250, seed=7)
+    return path
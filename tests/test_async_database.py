@@ -0,0 +1,58 @@
+"""AsyncDatabase runs the Database methods through the async pool"""
+
+import asyncio
+
+import pandas as pd
+
+from async_database import AsyncDatabase
+
+
+def _run(backend, scenario):
+    async def main():
+        adb = AsyncDatabase(backend=backend, pool_size=3)
+        try:
+            return await scenario(adb)
+        finally:
+            await adb.disconnect()
+    return asyncio.run(main())
+
+
+def test_results_match_database(backend, db):
+    async def scenario(adb):
+        return await asyncio.gather(adb.get_demographic_data(), adb.get_summary_statistics(),
+                                    adb.get_respondent_detail(7))
+
+    demographic, summary, detail = _run(backend, scenario)
+    for got, expected in zip(demographic, db.get_demographic_data()):
+        pd.testing.assert_frame_equal(got, expected)
+    assert summary == db.get_summary_statistics()
+    pd.testing.assert_series_equal(detail[0], db.get_respondent_detail(7)[0])
+
+
+def test_batch_statements_run_on_separate_connections(backend):
+    async def scenario(adb):
+        results = await adb.execute_batch({'a': "SELECT 1 AS x", 'b': "SELECT 2 AS x"})
+        return results, adb.get_pool_stats()
+
+    results, stats = _run(backend, scenario)
+    assert [int(df['x'].iloc[0]) for df in results.values()] == [1, 2]
+    assert stats['created'] == 2
+
+
+def test_failed_batch_voids_every_result(backend):
+    async def scenario(adb):
+        return await adb.execute_batch({'a': "SELECT 1 AS x", 'b': "SELECT nope FROM x"})
+
+    assert _run(backend, scenario) == {'a': None, 'b': None}
+
+
+def test_closing_stream_early_returns_connection(backend):
+    async def scenario(adb):
+        chunks = adb.iter_master_dataframe(10)
+        first = await chunks.__anext__()
+        await chunks.aclose()
+        return first, adb.get_pool_stats()
+
+    first, stats = _run(backend, scenario)
+    assert len(first) == 10
+    assert stats['in_use'] == 0
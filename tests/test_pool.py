@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from pool import AsyncConnectionPool, ConnectionPool
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_checkin_closes_connections_idle_too_long():
+    pool = ConnectionPool(FakeConnection, pool_size=3, max_idle_time=60.0)
+    a, b, c = pool.checkout(), pool.checkout(), pool.checkout()
+    pool.checkin(a)
+    pool.checkin(b)
+    # The oldest connection is never popped again by the LIFO checkout
+    a.last_used = time.monotonic() - 120
+    pool.checkin(c)
+
+    assert a.raw.closed
+    assert not b.raw.closed and not c.raw.closed
+    assert pool.stats()['idle'] == 2
+    assert pool.stats()['recycled'] == 1
+
+
+def test_checkout_closes_connections_past_lifetime():
+    pool = ConnectionPool(FakeConnection, pool_size=2, max_lifetime=60.0)
+    old, new = pool.checkout(), pool.checkout()
+    pool.checkin(old)
+    pool.checkin(new)
+    old.created_at = time.monotonic() - 120
+
+    conn = pool.checkout()
+    assert conn is new
+    assert old.raw.closed
+    assert pool.stats()['idle'] == 0
+
+
+def test_async_pool_sweeps_on_checkin():
+    async def factory():
+        return FakeConnection()
+
+    async def scenario():
+        pool = AsyncConnectionPool(factory, pool_size=2, max_idle_time=60.0)
+        a, b = await pool.checkout(), await pool.checkout()
+        await pool.checkin(a)
+        a.last_used = time.monotonic() - 120
+        await pool.checkin(b)
+        return a, pool.stats()
+
+    a, stats = asyncio.run(scenario())
+    assert a.raw.closed
+    assert stats['idle'] == 1
+    assert stats['recycled'] == 1
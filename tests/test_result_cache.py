@@ -0,0 +1,65 @@
+"""Result cache invalidation, expiry and bypass of whole-table loads"""
+
+import time
+
+import pandas as pd
+
+from database import Database
+from result_cache import ResultCache
+
+COUNT_QUERY = "SELECT COUNT(*) AS jumlah FROM master_platform"
+
+
+def _platform_count(db):
+    return int(db.execute_query(COUNT_QUERY)['jumlah'].iloc[0])
+
+
+def test_write_seen_by_probe_bumps_generation(backend):
+    db = Database(backend=backend, result_cache_bytes=1 << 20)
+    db.get_table_versions(['master_platform'])
+    before = _platform_count(db)
+    assert _platform_count(db) == before
+    generation = db.result_cache.generation
+
+    # Write outside this Database, so only the version probe can notice it
+    conn = backend.connect()
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO master_platform (nama_platform) VALUES ('Mastodon')")
+    conn.commit()
+    conn.close()
+    assert _platform_count(db) == before
+
+    db.get_table_versions(['master_platform'])
+    assert db.result_cache.generation > generation
+    assert _platform_count(db) == before + 1
+
+
+def test_result_fetched_before_clear_is_not_stored():
+    cache = ResultCache(1 << 20)
+    key = ResultCache.key(COUNT_QUERY)
+    generation = cache.generation
+    cache.clear()
+    assert not cache.put(key, pd.DataFrame({'jumlah': [9]}), generation=generation)
+    assert cache.get(key) is None
+    assert cache.stats()['stale'] == 1
+
+
+def test_put_purges_expired_entries():
+    cache = ResultCache(1 << 20, ttl=0.01)
+    cache.put(ResultCache.key("SELECT 1"), pd.DataFrame({'a': range(100)}))
+    time.sleep(0.02)
+    cache.put(ResultCache.key("SELECT 2"), pd.DataFrame({'a': [1]}), ttl=60)
+    stats = cache.stats()
+    assert stats['entries'] == 1
+    assert stats['expirations'] == 1
+
+
+def test_whole_table_loads_bypass_cache(backend):
+    db = Database(backend=backend, result_cache_bytes=64 << 20)
+    assert db.get_master_dataframe() is not None
+    assert db.get_all_usage_data() is not None
+    assert len(db.result_cache) == 0
+
+    filters = Database.respondent_filter(genders=['Perempuan'])
+    assert db.get_master_dataframe(filters=filters) is not None
+    assert len(db.result_cache) == 1
@@ -0,0 +1,106 @@
+"""Load-lock handoff of the snapshot stores (file flock and Redis SET NX PX)"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from snapshot import RedisSnapshotStore, SnapshotStore, fcntl
+
+
+class StandInRedis:
+    """The get/set/delete subset of redis-py used by RedisSnapshotStore, with PX expiry"""
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def _alive(self, key):
+        value = self.data.get(key)
+        if value is not None and value[1] is not None and value[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def get(self, key):
+        with self.lock:
+            value = self._alive(key)
+            return value[0] if value else None
+
+    def set(self, key, value, nx=False, px=None):
+        with self.lock:
+            if nx and self._alive(key) is not None:
+                return None
+            if isinstance(value, str):
+                value = value.encode('utf-8')
+            self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+            return True
+
+    def delete(self, key):
+        with self.lock:
+            self.data.pop(key, None)
+
+    def ping(self):
+        return True
+
+
+@pytest.fixture(params=['file', 'redis'])
+def store(request, tmp_path):
+    if request.param == 'file':
+        if fcntl is None:
+            pytest.skip("file locks need fcntl")
+        return SnapshotStore(str(tmp_path), lock_timeout=5.0)
+    return RedisSnapshotStore(client=StandInRedis(), lock_timeout=5.0)
+
+
+def test_one_loader_runs_while_others_wait(store):
+    frame = pd.DataFrame({'id_responden': range(50)})
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.3)
+        return frame
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.get_or_load('master', 'abc', loader)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    for result in results:
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), frame, check_dtype=False)
+
+
+def test_lock_is_handed_over_after_release(store):
+    store.lock_timeout = 0.2
+    with store.lock('master') as first:
+        assert first
+        with store.lock('master') as second:
+            assert not second
+    with store.lock('master') as third:
+        assert third
+
+
+def test_redis_lock_expires_and_is_not_released_by_old_holder():
+    client = StandInRedis()
+    store = RedisSnapshotStore(client=client, lock_timeout=0.2)
+    key = 'uas_basdat:snapshot:master:lock'
+
+    first = store.lock('master')
+    assert first.__enter__()
+    time.sleep(0.25)
+    # The first holder's lock expired, so another replica takes it over
+    second = store.lock('master')
+    assert second.__enter__()
+    token = client.get(key)
+
+    first.__exit__(None, None, None)
+    assert client.get(key) == token
+    second.__exit__(None, None, None)
+    assert client.get(key) is None
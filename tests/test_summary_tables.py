@@ -0,0 +1,59 @@
+"""The trigger-maintained ringkasan_* tables stay equal to the base-table aggregates"""
+
+import pandas as pd
+import pytest
+
+from database import Database, SUMMARY_TABLES
+
+WRITES = {
+    'update_responden': "UPDATE responden SET jenis_kelamin = 'Perempuan', status_hubungan = 'Cerai Hidup' "
+                        "WHERE id_responden = 3",
+    'update_mental': "UPDATE kesehatan_mental SET depresi = 5, kecemasan = 1 WHERE id_responden = 4",
+    'update_usage': "UPDATE penggunaan_per_platform SET jam_per_hari = jam_per_hari + 3 WHERE id_responden = 5",
+    'delete_usage': "DELETE FROM penggunaan_per_platform WHERE id_responden = 6",
+    # ON DELETE CASCADE ke penggunaan_per_platform dan kesehatan_mental
+    'cascade_responden': "DELETE FROM responden WHERE id_responden = 7",
+    'cascade_platform': "DELETE FROM master_platform WHERE id_platform = 2",
+}
+
+
+def _execute(backend, statement):
+    conn = backend.connect()
+    cursor = conn.cursor()
+    cursor.execute(statement)
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def _summary_rows(db):
+    rows = {}
+    for table in SUMMARY_TABLES:
+        df = db.execute_query(f"SELECT * FROM {table}")
+        rows[table] = df.sort_values(list(df.columns)).reset_index(drop=True)
+    return rows
+
+
+def _assert_same_aggregates(backend):
+    summary = Database(backend=backend, use_summary_tables=True)
+    base = Database(backend=backend, use_summary_tables=False)
+    assert summary.summary_tables_available()
+    for method in ('get_gender_comparison_data', 'get_status_comparison_data'):
+        for got, expected in zip(getattr(summary, method)(), getattr(base, method)()):
+            pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+    assert summary.get_summary_statistics() == pytest.approx(base.get_summary_statistics())
+
+
+@pytest.mark.parametrize('write', list(WRITES))
+def test_aggregates_match_after_write(backend, write):
+    _execute(backend, WRITES[write])
+    _assert_same_aggregates(backend)
+
+
+def test_triggers_match_rebuild_after_every_write(backend, db):
+    for statement in WRITES.values():
+        _execute(backend, statement)
+    maintained = _summary_rows(db)
+    assert db.rebuild_summary_tables()
+    for table, rebuilt in _summary_rows(db).items():
+        pd.testing.assert_frame_equal(maintained[table], rebuilt, check_dtype=False)
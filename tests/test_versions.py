@@ -0,0 +1,42 @@
+"""Table version tokens and fingerprints (change detection of the caches)"""
+
+from database import Database
+from snapshot import SnapshotCache, SnapshotStore
+from sqlite_backend import SQLiteBackend
+
+TABLES = ('responden', 'penggunaan_per_platform', 'master_platform', 'kesehatan_mental')
+
+
+def test_version_changes_on_write(db):
+    before = db.get_table_versions(TABLES)
+    assert db.bulk_insert([('master_platform', ['nama_platform'], [('Mastodon',)])])
+    after = db.get_table_versions(TABLES)
+    assert after['master_platform'] != before['master_platform']
+    assert after['responden'] == before['responden']
+
+
+def test_reload_never_reuses_fingerprint():
+    first = Database(backend=SQLiteBackend())
+    second = Database(backend=SQLiteBackend())
+    assert first.get_table_fingerprint(TABLES) != second.get_table_fingerprint(TABLES)
+
+
+def test_reopened_file_keeps_fingerprint(tmp_path):
+    path = str(tmp_path / 'survey.sqlite')
+    first = Database(backend=SQLiteBackend(path=path))
+    fingerprint = first.get_table_fingerprint(TABLES)
+    first.disconnect()
+    first.backend.close()
+    assert Database(backend=SQLiteBackend(path=path)).get_table_fingerprint(TABLES) == fingerprint
+
+
+def test_second_dump_misses_snapshot(tmp_path, synthetic_dump):
+    store = SnapshotStore(str(tmp_path / 'snapshots'))
+    default_db = Database(backend=SQLiteBackend())
+    synthetic_db = Database(backend=SQLiteBackend(dump_path=synthetic_dump))
+
+    default_master = SnapshotCache(default_db, store).get('master')
+    synthetic_master = SnapshotCache(synthetic_db, store).get('master')
+
+    assert synthetic_master['id_responden'].nunique() == synthetic_db.get_respondent_count()
+    assert synthetic_master['id_responden'].nunique() != default_master['id_responden'].nunique()
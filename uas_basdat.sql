@@ -21,6 +21,55 @@ SET time_zone = "+00:00";
 -- Database: `uas_basdat`
 --
 
+DELIMITER $$
+--
+-- Procedures
+--
+CREATE DEFINER=`root`@`localhost` PROCEDURE `rebuild_ringkasan` ()   BEGIN
+  -- Hitung ulang semua tabel ringkasan dari tabel sumber (pemulihan jika tidak sinkron)
+  START TRANSACTION;
+  DELETE FROM `ringkasan_responden`;
+  INSERT INTO `ringkasan_responden` (`jenis_kelamin`, `status_hubungan`, `jumlah_responden`, `jumlah_mental`,
+      `sum_gangguan_fokus`, `sum_gelisah`, `sum_kecemasan`, `sum_kesulitan_konsentrasi`, `sum_perbandingan_diri`, `sum_sentimen_posting`, `sum_mencari_validasi`, `sum_depresi`, `sum_fluktuasi_minat`, `sum_sulit_tidur`)
+    SELECT `r`.`jenis_kelamin`, `r`.`status_hubungan`, COUNT(*), COUNT(`km`.`id_kesehatan`),
+      COALESCE(SUM(`km`.`gangguan_fokus`), 0),
+      COALESCE(SUM(`km`.`gelisah`), 0),
+      COALESCE(SUM(`km`.`kecemasan`), 0),
+      COALESCE(SUM(`km`.`kesulitan_konsentrasi`), 0),
+      COALESCE(SUM(`km`.`perbandingan_diri`), 0),
+      COALESCE(SUM(`km`.`sentimen_posting`), 0),
+      COALESCE(SUM(`km`.`mencari_validasi`), 0),
+      COALESCE(SUM(`km`.`depresi`), 0),
+      COALESCE(SUM(`km`.`fluktuasi_minat`), 0),
+      COALESCE(SUM(`km`.`sulit_tidur`), 0)
+    FROM `responden` `r`
+    LEFT JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `r`.`id_responden`
+    GROUP BY `r`.`jenis_kelamin`, `r`.`status_hubungan`;
+  INSERT IGNORE INTO `ringkasan_responden` (`jenis_kelamin`, `status_hubungan`) VALUES
+      ('Laki-laki', 'Belum Kawin'), ('Laki-laki', 'Kawin'), ('Laki-laki', 'Cerai Hidup'), ('Laki-laki', 'Cerai Mati'), ('Perempuan', 'Belum Kawin'), ('Perempuan', 'Kawin'), ('Perempuan', 'Cerai Hidup'), ('Perempuan', 'Cerai Mati');
+  DELETE FROM `ringkasan_penggunaan`;
+  INSERT INTO `ringkasan_penggunaan` (`jenis_kelamin`, `id_platform`, `tujuan_penggunaan`, `jumlah_penggunaan`,
+      `sum_jam_per_hari`, `sum_frekuensi`)
+    SELECT `r`.`jenis_kelamin`, `p`.`id_platform`, `p`.`tujuan_penggunaan`, COUNT(*),
+      SUM(`p`.`jam_per_hari`), SUM(`p`.`frekuensi_buka_per_hari`)
+    FROM `penggunaan_per_platform` `p`
+    JOIN `responden` `r` ON `r`.`id_responden` = `p`.`id_responden`
+    GROUP BY `r`.`jenis_kelamin`, `p`.`id_platform`, `p`.`tujuan_penggunaan`;
+  DELETE FROM `ringkasan_penggunaan_mental`;
+  INSERT INTO `ringkasan_penggunaan_mental` (`jenis_kelamin`, `jumlah_penggunaan`, `sum_jam_per_hari`,
+      `sum_depresi`, `sum_kecemasan`)
+    SELECT `r`.`jenis_kelamin`, COUNT(*), SUM(`p`.`jam_per_hari`), SUM(`km`.`depresi`), SUM(`km`.`kecemasan`)
+    FROM `penggunaan_per_platform` `p`
+    JOIN `responden` `r` ON `r`.`id_responden` = `p`.`id_responden`
+    JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden`
+    GROUP BY `r`.`jenis_kelamin`;
+  INSERT IGNORE INTO `ringkasan_penggunaan_mental` (`jenis_kelamin`) VALUES
+      ('Laki-laki'), ('Perempuan');
+  COMMIT;
+END$$
+
+DELIMITER ;
+
 -- --------------------------------------------------------
 
 --
@@ -148,6 +197,99 @@ INSERT INTO `kesehatan_mental` (`id_kesehatan`, `id_responden`, `gangguan_fokus`
 (99, 99, 1, 1, 2, 1, 1, 5, 1, 1, 1, 1),
 (100, 100, 1, 1, 1, 1, 1, 5, 1, 1, 1, 1);
 
+--
+-- Triggers `kesehatan_mental`
+--
+DELIMITER $$
+CREATE TRIGGER `trg_kesehatan_mental_versi_ai` AFTER INSERT ON `kesehatan_mental` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1 WHERE `nama_tabel` = 'kesehatan_mental'
+$$
+CREATE TRIGGER `trg_kesehatan_mental_versi_au` AFTER UPDATE ON `kesehatan_mental` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'kesehatan_mental'
+$$
+CREATE TRIGGER `trg_kesehatan_mental_versi_ad` AFTER DELETE ON `kesehatan_mental` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'kesehatan_mental'
+$$
+CREATE TRIGGER `trg_kesehatan_mental_ringkasan_ai` AFTER INSERT ON `kesehatan_mental` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_responden` SET `jumlah_mental` = `jumlah_mental` + 1,
+    `sum_gangguan_fokus` = `sum_gangguan_fokus` + NEW.`gangguan_fokus`,
+    `sum_gelisah` = `sum_gelisah` + NEW.`gelisah`,
+    `sum_kecemasan` = `sum_kecemasan` + NEW.`kecemasan`,
+    `sum_kesulitan_konsentrasi` = `sum_kesulitan_konsentrasi` + NEW.`kesulitan_konsentrasi`,
+    `sum_perbandingan_diri` = `sum_perbandingan_diri` + NEW.`perbandingan_diri`,
+    `sum_sentimen_posting` = `sum_sentimen_posting` + NEW.`sentimen_posting`,
+    `sum_mencari_validasi` = `sum_mencari_validasi` + NEW.`mencari_validasi`,
+    `sum_depresi` = `sum_depresi` + NEW.`depresi`,
+    `sum_fluktuasi_minat` = `sum_fluktuasi_minat` + NEW.`fluktuasi_minat`,
+    `sum_sulit_tidur` = `sum_sulit_tidur` + NEW.`sulit_tidur`
+  WHERE (`jenis_kelamin`, `status_hubungan`) = (SELECT `jenis_kelamin`, `status_hubungan` FROM `responden` WHERE `id_responden` = NEW.`id_responden`);
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` + (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` + (SELECT COALESCE(SUM(`jam_per_hari`), 0) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_depresi` = `sum_depresi` + NEW.`depresi` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` + NEW.`kecemasan` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = NEW.`id_responden`);
+END
+$$
+CREATE TRIGGER `trg_kesehatan_mental_ringkasan_au` AFTER UPDATE ON `kesehatan_mental` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_responden` SET `jumlah_mental` = `jumlah_mental` - 1,
+    `sum_gangguan_fokus` = `sum_gangguan_fokus` - OLD.`gangguan_fokus`,
+    `sum_gelisah` = `sum_gelisah` - OLD.`gelisah`,
+    `sum_kecemasan` = `sum_kecemasan` - OLD.`kecemasan`,
+    `sum_kesulitan_konsentrasi` = `sum_kesulitan_konsentrasi` - OLD.`kesulitan_konsentrasi`,
+    `sum_perbandingan_diri` = `sum_perbandingan_diri` - OLD.`perbandingan_diri`,
+    `sum_sentimen_posting` = `sum_sentimen_posting` - OLD.`sentimen_posting`,
+    `sum_mencari_validasi` = `sum_mencari_validasi` - OLD.`mencari_validasi`,
+    `sum_depresi` = `sum_depresi` - OLD.`depresi`,
+    `sum_fluktuasi_minat` = `sum_fluktuasi_minat` - OLD.`fluktuasi_minat`,
+    `sum_sulit_tidur` = `sum_sulit_tidur` - OLD.`sulit_tidur`
+  WHERE (`jenis_kelamin`, `status_hubungan`) = (SELECT `jenis_kelamin`, `status_hubungan` FROM `responden` WHERE `id_responden` = OLD.`id_responden`);
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` - (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` - (SELECT COALESCE(SUM(`jam_per_hari`), 0) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_depresi` = `sum_depresi` - OLD.`depresi` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - OLD.`kecemasan` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = OLD.`id_responden`);
+  UPDATE `ringkasan_responden` SET `jumlah_mental` = `jumlah_mental` + 1,
+    `sum_gangguan_fokus` = `sum_gangguan_fokus` + NEW.`gangguan_fokus`,
+    `sum_gelisah` = `sum_gelisah` + NEW.`gelisah`,
+    `sum_kecemasan` = `sum_kecemasan` + NEW.`kecemasan`,
+    `sum_kesulitan_konsentrasi` = `sum_kesulitan_konsentrasi` + NEW.`kesulitan_konsentrasi`,
+    `sum_perbandingan_diri` = `sum_perbandingan_diri` + NEW.`perbandingan_diri`,
+    `sum_sentimen_posting` = `sum_sentimen_posting` + NEW.`sentimen_posting`,
+    `sum_mencari_validasi` = `sum_mencari_validasi` + NEW.`mencari_validasi`,
+    `sum_depresi` = `sum_depresi` + NEW.`depresi`,
+    `sum_fluktuasi_minat` = `sum_fluktuasi_minat` + NEW.`fluktuasi_minat`,
+    `sum_sulit_tidur` = `sum_sulit_tidur` + NEW.`sulit_tidur`
+  WHERE (`jenis_kelamin`, `status_hubungan`) = (SELECT `jenis_kelamin`, `status_hubungan` FROM `responden` WHERE `id_responden` = NEW.`id_responden`);
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` + (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` + (SELECT COALESCE(SUM(`jam_per_hari`), 0) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_depresi` = `sum_depresi` + NEW.`depresi` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` + NEW.`kecemasan` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = NEW.`id_responden`);
+END
+$$
+CREATE TRIGGER `trg_kesehatan_mental_ringkasan_ad` AFTER DELETE ON `kesehatan_mental` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_responden` SET `jumlah_mental` = `jumlah_mental` - 1,
+    `sum_gangguan_fokus` = `sum_gangguan_fokus` - OLD.`gangguan_fokus`,
+    `sum_gelisah` = `sum_gelisah` - OLD.`gelisah`,
+    `sum_kecemasan` = `sum_kecemasan` - OLD.`kecemasan`,
+    `sum_kesulitan_konsentrasi` = `sum_kesulitan_konsentrasi` - OLD.`kesulitan_konsentrasi`,
+    `sum_perbandingan_diri` = `sum_perbandingan_diri` - OLD.`perbandingan_diri`,
+    `sum_sentimen_posting` = `sum_sentimen_posting` - OLD.`sentimen_posting`,
+    `sum_mencari_validasi` = `sum_mencari_validasi` - OLD.`mencari_validasi`,
+    `sum_depresi` = `sum_depresi` - OLD.`depresi`,
+    `sum_fluktuasi_minat` = `sum_fluktuasi_minat` - OLD.`fluktuasi_minat`,
+    `sum_sulit_tidur` = `sum_sulit_tidur` - OLD.`sulit_tidur`
+  WHERE (`jenis_kelamin`, `status_hubungan`) = (SELECT `jenis_kelamin`, `status_hubungan` FROM `responden` WHERE `id_responden` = OLD.`id_responden`);
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` - (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` - (SELECT COALESCE(SUM(`jam_per_hari`), 0) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_depresi` = `sum_depresi` - OLD.`depresi` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - OLD.`kecemasan` * (SELECT COUNT(*) FROM `penggunaan_per_platform` WHERE `id_responden` = OLD.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = OLD.`id_responden`);
+END
+$$
+DELIMITER ;
+
 -- --------------------------------------------------------
 
 --
@@ -174,6 +316,27 @@ INSERT INTO `master_platform` (`id_platform`, `nama_platform`) VALUES
 (2, 'Twitter'),
 (4, 'YouTube');
 
+--
+-- Triggers `master_platform`
+--
+DELIMITER $$
+CREATE TRIGGER `trg_master_platform_versi_ai` AFTER INSERT ON `master_platform` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1 WHERE `nama_tabel` = 'master_platform'
+$$
+CREATE TRIGGER `trg_master_platform_versi_au` AFTER UPDATE ON `master_platform` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'master_platform'
+$$
+CREATE TRIGGER `trg_master_platform_versi_ad` AFTER DELETE ON `master_platform` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'master_platform'
+$$
+CREATE TRIGGER `trg_master_platform_ringkasan_bd` BEFORE DELETE ON `master_platform` FOR EACH ROW BEGIN
+  DELETE FROM `ringkasan_penggunaan` WHERE `id_platform` = OLD.`id_platform`;
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` - (SELECT COUNT(*) FROM `penggunaan_per_platform` `p` JOIN `responden` `r` ON `r`.`id_responden` = `p`.`id_responden` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_platform` = OLD.`id_platform` AND `r`.`jenis_kelamin` = `ringkasan_penggunaan_mental`.`jenis_kelamin`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` - (SELECT COALESCE(SUM(`p`.`jam_per_hari`), 0) FROM `penggunaan_per_platform` `p` JOIN `responden` `r` ON `r`.`id_responden` = `p`.`id_responden` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_platform` = OLD.`id_platform` AND `r`.`jenis_kelamin` = `ringkasan_penggunaan_mental`.`jenis_kelamin`),
+    `sum_depresi` = `sum_depresi` - (SELECT COALESCE(SUM(`km`.`depresi`), 0) FROM `penggunaan_per_platform` `p` JOIN `responden` `r` ON `r`.`id_responden` = `p`.`id_responden` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_platform` = OLD.`id_platform` AND `r`.`jenis_kelamin` = `ringkasan_penggunaan_mental`.`jenis_kelamin`),
+    `sum_kecemasan` = `sum_kecemasan` - (SELECT COALESCE(SUM(`km`.`kecemasan`), 0) FROM `penggunaan_per_platform` `p` JOIN `responden` `r` ON `r`.`id_responden` = `p`.`id_responden` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_platform` = OLD.`id_platform` AND `r`.`jenis_kelamin` = `ringkasan_penggunaan_mental`.`jenis_kelamin`);
+END
+$$
+DELIMITER ;
+
 -- --------------------------------------------------------
 
 --
@@ -443,6 +606,65 @@ INSERT INTO `penggunaan_per_platform` (`id_penggunaan`, `id_responden`, `id_plat
 (247, 90, 1, 1.0, 'Komunikasi', 5),
 (248, 90, 4, 0.5, 'Informasi', 2);
 
+--
+-- Triggers `penggunaan_per_platform`
+--
+DELIMITER $$
+CREATE TRIGGER `trg_penggunaan_versi_ai` AFTER INSERT ON `penggunaan_per_platform` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1 WHERE `nama_tabel` = 'penggunaan_per_platform'
+$$
+CREATE TRIGGER `trg_penggunaan_versi_au` AFTER UPDATE ON `penggunaan_per_platform` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'penggunaan_per_platform'
+$$
+CREATE TRIGGER `trg_penggunaan_versi_ad` AFTER DELETE ON `penggunaan_per_platform` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'penggunaan_per_platform'
+$$
+CREATE TRIGGER `trg_penggunaan_ringkasan_ai` AFTER INSERT ON `penggunaan_per_platform` FOR EACH ROW BEGIN
+  INSERT IGNORE INTO `ringkasan_penggunaan` (`jenis_kelamin`, `id_platform`, `tujuan_penggunaan`)
+  SELECT `jenis_kelamin`, NEW.`id_platform`, NEW.`tujuan_penggunaan` FROM `responden` WHERE `id_responden` = NEW.`id_responden`;
+  UPDATE `ringkasan_penggunaan` SET `jumlah_penggunaan` = `jumlah_penggunaan` + 1, `sum_jam_per_hari` = `sum_jam_per_hari` + NEW.`jam_per_hari`, `sum_frekuensi` = `sum_frekuensi` + NEW.`frekuensi_buka_per_hari`
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = NEW.`id_responden`)
+    AND `id_platform` = NEW.`id_platform` AND `tujuan_penggunaan` = NEW.`tujuan_penggunaan`;
+  UPDATE `ringkasan_penggunaan_mental` SET `jumlah_penggunaan` = `jumlah_penggunaan` + 1, `sum_jam_per_hari` = `sum_jam_per_hari` + NEW.`jam_per_hari`,
+    `sum_depresi` = `sum_depresi` + (SELECT `depresi` FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` + (SELECT `kecemasan` FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = NEW.`id_responden`)
+    AND EXISTS (SELECT 1 FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`);
+END
+$$
+CREATE TRIGGER `trg_penggunaan_ringkasan_au` AFTER UPDATE ON `penggunaan_per_platform` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_penggunaan` SET `jumlah_penggunaan` = `jumlah_penggunaan` - 1, `sum_jam_per_hari` = `sum_jam_per_hari` - OLD.`jam_per_hari`, `sum_frekuensi` = `sum_frekuensi` - OLD.`frekuensi_buka_per_hari`
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = OLD.`id_responden`)
+    AND `id_platform` = OLD.`id_platform` AND `tujuan_penggunaan` = OLD.`tujuan_penggunaan`;
+  UPDATE `ringkasan_penggunaan_mental` SET `jumlah_penggunaan` = `jumlah_penggunaan` - 1, `sum_jam_per_hari` = `sum_jam_per_hari` - OLD.`jam_per_hari`,
+    `sum_depresi` = `sum_depresi` - (SELECT `depresi` FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - (SELECT `kecemasan` FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = OLD.`id_responden`)
+    AND EXISTS (SELECT 1 FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`)
+    AND EXISTS (SELECT 1 FROM `master_platform` WHERE `id_platform` = OLD.`id_platform`);
+  INSERT IGNORE INTO `ringkasan_penggunaan` (`jenis_kelamin`, `id_platform`, `tujuan_penggunaan`)
+  SELECT `jenis_kelamin`, NEW.`id_platform`, NEW.`tujuan_penggunaan` FROM `responden` WHERE `id_responden` = NEW.`id_responden`;
+  UPDATE `ringkasan_penggunaan` SET `jumlah_penggunaan` = `jumlah_penggunaan` + 1, `sum_jam_per_hari` = `sum_jam_per_hari` + NEW.`jam_per_hari`, `sum_frekuensi` = `sum_frekuensi` + NEW.`frekuensi_buka_per_hari`
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = NEW.`id_responden`)
+    AND `id_platform` = NEW.`id_platform` AND `tujuan_penggunaan` = NEW.`tujuan_penggunaan`;
+  UPDATE `ringkasan_penggunaan_mental` SET `jumlah_penggunaan` = `jumlah_penggunaan` + 1, `sum_jam_per_hari` = `sum_jam_per_hari` + NEW.`jam_per_hari`,
+    `sum_depresi` = `sum_depresi` + (SELECT `depresi` FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` + (SELECT `kecemasan` FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = NEW.`id_responden`)
+    AND EXISTS (SELECT 1 FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`);
+END
+$$
+CREATE TRIGGER `trg_penggunaan_ringkasan_ad` AFTER DELETE ON `penggunaan_per_platform` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_penggunaan` SET `jumlah_penggunaan` = `jumlah_penggunaan` - 1, `sum_jam_per_hari` = `sum_jam_per_hari` - OLD.`jam_per_hari`, `sum_frekuensi` = `sum_frekuensi` - OLD.`frekuensi_buka_per_hari`
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = OLD.`id_responden`)
+    AND `id_platform` = OLD.`id_platform` AND `tujuan_penggunaan` = OLD.`tujuan_penggunaan`;
+  UPDATE `ringkasan_penggunaan_mental` SET `jumlah_penggunaan` = `jumlah_penggunaan` - 1, `sum_jam_per_hari` = `sum_jam_per_hari` - OLD.`jam_per_hari`,
+    `sum_depresi` = `sum_depresi` - (SELECT `depresi` FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - (SELECT `kecemasan` FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`)
+  WHERE `jenis_kelamin` = (SELECT `jenis_kelamin` FROM `responden` WHERE `id_responden` = OLD.`id_responden`)
+    AND EXISTS (SELECT 1 FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`)
+    AND EXISTS (SELECT 1 FROM `master_platform` WHERE `id_platform` = OLD.`id_platform`);
+END
+$$
+DELIMITER ;
+
 -- --------------------------------------------------------
 
 --
@@ -565,6 +787,241 @@ INSERT INTO `responden` (`id_responden`, `nama`, `usia`, `jenis_kelamin`, `statu
 (99, 'Vero Sinaga', 44, 'Laki-laki', 'Kawin', 'Pekerja', 'Tidak'),
 (100, 'Wulan Dari', 45, 'Perempuan', 'Kawin', 'Pekerja', 'Tidak');
 
+--
+-- Triggers `responden`
+--
+DELIMITER $$
+CREATE TRIGGER `trg_responden_versi_ai` AFTER INSERT ON `responden` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1 WHERE `nama_tabel` = 'responden'
+$$
+CREATE TRIGGER `trg_responden_versi_au` AFTER UPDATE ON `responden` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'responden'
+$$
+CREATE TRIGGER `trg_responden_versi_ad` AFTER DELETE ON `responden` FOR EACH ROW UPDATE `versi_data` SET `versi` = `versi` + 1, `versi_mutasi` = `versi_mutasi` + 1 WHERE `nama_tabel` = 'responden'
+$$
+CREATE TRIGGER `trg_responden_ringkasan_ai` AFTER INSERT ON `responden` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_responden` SET `jumlah_responden` = `jumlah_responden` + 1
+  WHERE `jenis_kelamin` = NEW.`jenis_kelamin` AND `status_hubungan` = NEW.`status_hubungan`;
+END
+$$
+CREATE TRIGGER `trg_responden_ringkasan_au` AFTER UPDATE ON `responden` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_responden` SET
+    `jumlah_responden` = `jumlah_responden` - 1,
+    `jumlah_mental` = `jumlah_mental` - (SELECT COUNT(*) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_gangguan_fokus` = `sum_gangguan_fokus` - (SELECT COALESCE(SUM(`gangguan_fokus`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_gelisah` = `sum_gelisah` - (SELECT COALESCE(SUM(`gelisah`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - (SELECT COALESCE(SUM(`kecemasan`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kesulitan_konsentrasi` = `sum_kesulitan_konsentrasi` - (SELECT COALESCE(SUM(`kesulitan_konsentrasi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_perbandingan_diri` = `sum_perbandingan_diri` - (SELECT COALESCE(SUM(`perbandingan_diri`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_sentimen_posting` = `sum_sentimen_posting` - (SELECT COALESCE(SUM(`sentimen_posting`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_mencari_validasi` = `sum_mencari_validasi` - (SELECT COALESCE(SUM(`mencari_validasi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_depresi` = `sum_depresi` - (SELECT COALESCE(SUM(`depresi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_fluktuasi_minat` = `sum_fluktuasi_minat` - (SELECT COALESCE(SUM(`fluktuasi_minat`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_sulit_tidur` = `sum_sulit_tidur` - (SELECT COALESCE(SUM(`sulit_tidur`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = OLD.`jenis_kelamin` AND `status_hubungan` = OLD.`status_hubungan`
+    AND (OLD.`jenis_kelamin` <> NEW.`jenis_kelamin` OR OLD.`status_hubungan` <> NEW.`status_hubungan`);
+  UPDATE `ringkasan_penggunaan` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` - (SELECT COUNT(*) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = NEW.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` - (SELECT COALESCE(SUM(`p`.`jam_per_hari`), 0) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = NEW.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`),
+    `sum_frekuensi` = `sum_frekuensi` - (SELECT COALESCE(SUM(`p`.`frekuensi_buka_per_hari`), 0) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = NEW.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`)
+  WHERE `jenis_kelamin` = OLD.`jenis_kelamin`
+    AND (OLD.`jenis_kelamin` <> NEW.`jenis_kelamin` OR OLD.`status_hubungan` <> NEW.`status_hubungan`);
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` - (SELECT COUNT(*) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` - (SELECT COALESCE(SUM(`p`.`jam_per_hari`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`),
+    `sum_depresi` = `sum_depresi` - (SELECT COALESCE(SUM(`km`.`depresi`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - (SELECT COALESCE(SUM(`km`.`kecemasan`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = OLD.`jenis_kelamin`
+    AND (OLD.`jenis_kelamin` <> NEW.`jenis_kelamin` OR OLD.`status_hubungan` <> NEW.`status_hubungan`);
+  INSERT IGNORE INTO `ringkasan_penggunaan` (`jenis_kelamin`, `id_platform`, `tujuan_penggunaan`)
+  SELECT DISTINCT NEW.`jenis_kelamin`, `id_platform`, `tujuan_penggunaan` FROM `penggunaan_per_platform`
+  WHERE `id_responden` = NEW.`id_responden`
+    AND (OLD.`jenis_kelamin` <> NEW.`jenis_kelamin` OR OLD.`status_hubungan` <> NEW.`status_hubungan`);
+  UPDATE `ringkasan_responden` SET
+    `jumlah_responden` = `jumlah_responden` + 1,
+    `jumlah_mental` = `jumlah_mental` + (SELECT COUNT(*) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_gangguan_fokus` = `sum_gangguan_fokus` + (SELECT COALESCE(SUM(`gangguan_fokus`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_gelisah` = `sum_gelisah` + (SELECT COALESCE(SUM(`gelisah`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` + (SELECT COALESCE(SUM(`kecemasan`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_kesulitan_konsentrasi` = `sum_kesulitan_konsentrasi` + (SELECT COALESCE(SUM(`kesulitan_konsentrasi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_perbandingan_diri` = `sum_perbandingan_diri` + (SELECT COALESCE(SUM(`perbandingan_diri`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_sentimen_posting` = `sum_sentimen_posting` + (SELECT COALESCE(SUM(`sentimen_posting`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_mencari_validasi` = `sum_mencari_validasi` + (SELECT COALESCE(SUM(`mencari_validasi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_depresi` = `sum_depresi` + (SELECT COALESCE(SUM(`depresi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_fluktuasi_minat` = `sum_fluktuasi_minat` + (SELECT COALESCE(SUM(`fluktuasi_minat`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`),
+    `sum_sulit_tidur` = `sum_sulit_tidur` + (SELECT COALESCE(SUM(`sulit_tidur`), 0) FROM `kesehatan_mental` WHERE `id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = NEW.`jenis_kelamin` AND `status_hubungan` = NEW.`status_hubungan`
+    AND (OLD.`jenis_kelamin` <> NEW.`jenis_kelamin` OR OLD.`status_hubungan` <> NEW.`status_hubungan`);
+  UPDATE `ringkasan_penggunaan` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` + (SELECT COUNT(*) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = NEW.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` + (SELECT COALESCE(SUM(`p`.`jam_per_hari`), 0) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = NEW.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`),
+    `sum_frekuensi` = `sum_frekuensi` + (SELECT COALESCE(SUM(`p`.`frekuensi_buka_per_hari`), 0) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = NEW.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`)
+  WHERE `jenis_kelamin` = NEW.`jenis_kelamin`
+    AND (OLD.`jenis_kelamin` <> NEW.`jenis_kelamin` OR OLD.`status_hubungan` <> NEW.`status_hubungan`);
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` + (SELECT COUNT(*) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` + (SELECT COALESCE(SUM(`p`.`jam_per_hari`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`),
+    `sum_depresi` = `sum_depresi` + (SELECT COALESCE(SUM(`km`.`depresi`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` + (SELECT COALESCE(SUM(`km`.`kecemasan`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = NEW.`id_responden`)
+  WHERE `jenis_kelamin` = NEW.`jenis_kelamin`
+    AND (OLD.`jenis_kelamin` <> NEW.`jenis_kelamin` OR OLD.`status_hubungan` <> NEW.`status_hubungan`);
+END
+$$
+CREATE TRIGGER `trg_responden_ringkasan_bd` BEFORE DELETE ON `responden` FOR EACH ROW BEGIN
+  UPDATE `ringkasan_responden` SET
+    `jumlah_responden` = `jumlah_responden` - 1,
+    `jumlah_mental` = `jumlah_mental` - (SELECT COUNT(*) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_gangguan_fokus` = `sum_gangguan_fokus` - (SELECT COALESCE(SUM(`gangguan_fokus`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_gelisah` = `sum_gelisah` - (SELECT COALESCE(SUM(`gelisah`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - (SELECT COALESCE(SUM(`kecemasan`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_kesulitan_konsentrasi` = `sum_kesulitan_konsentrasi` - (SELECT COALESCE(SUM(`kesulitan_konsentrasi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_perbandingan_diri` = `sum_perbandingan_diri` - (SELECT COALESCE(SUM(`perbandingan_diri`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_sentimen_posting` = `sum_sentimen_posting` - (SELECT COALESCE(SUM(`sentimen_posting`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_mencari_validasi` = `sum_mencari_validasi` - (SELECT COALESCE(SUM(`mencari_validasi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_depresi` = `sum_depresi` - (SELECT COALESCE(SUM(`depresi`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_fluktuasi_minat` = `sum_fluktuasi_minat` - (SELECT COALESCE(SUM(`fluktuasi_minat`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`),
+    `sum_sulit_tidur` = `sum_sulit_tidur` - (SELECT COALESCE(SUM(`sulit_tidur`), 0) FROM `kesehatan_mental` WHERE `id_responden` = OLD.`id_responden`)
+  WHERE `jenis_kelamin` = OLD.`jenis_kelamin` AND `status_hubungan` = OLD.`status_hubungan`;
+  UPDATE `ringkasan_penggunaan` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` - (SELECT COUNT(*) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = OLD.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` - (SELECT COALESCE(SUM(`p`.`jam_per_hari`), 0) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = OLD.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`),
+    `sum_frekuensi` = `sum_frekuensi` - (SELECT COALESCE(SUM(`p`.`frekuensi_buka_per_hari`), 0) FROM `penggunaan_per_platform` `p` WHERE `p`.`id_responden` = OLD.`id_responden` AND `p`.`id_platform` = `ringkasan_penggunaan`.`id_platform` AND `p`.`tujuan_penggunaan` = `ringkasan_penggunaan`.`tujuan_penggunaan`)
+  WHERE `jenis_kelamin` = OLD.`jenis_kelamin`;
+  UPDATE `ringkasan_penggunaan_mental` SET
+    `jumlah_penggunaan` = `jumlah_penggunaan` - (SELECT COUNT(*) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = OLD.`id_responden`),
+    `sum_jam_per_hari` = `sum_jam_per_hari` - (SELECT COALESCE(SUM(`p`.`jam_per_hari`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = OLD.`id_responden`),
+    `sum_depresi` = `sum_depresi` - (SELECT COALESCE(SUM(`km`.`depresi`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = OLD.`id_responden`),
+    `sum_kecemasan` = `sum_kecemasan` - (SELECT COALESCE(SUM(`km`.`kecemasan`), 0) FROM `penggunaan_per_platform` `p` JOIN `kesehatan_mental` `km` ON `km`.`id_responden` = `p`.`id_responden` WHERE `p`.`id_responden` = OLD.`id_responden`)
+  WHERE `jenis_kelamin` = OLD.`jenis_kelamin`;
+END
+$$
+DELIMITER ;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `ringkasan_penggunaan`
+--
+
+CREATE TABLE `ringkasan_penggunaan` (
+  `jenis_kelamin` enum('Laki-laki','Perempuan') NOT NULL,
+  `id_platform` int(11) NOT NULL,
+  `tujuan_penggunaan` enum('Hiburan','Komunikasi','Informasi','Pekerjaan','Lainnya') NOT NULL,
+  `jumlah_penggunaan` int(11) NOT NULL DEFAULT 0,
+  `sum_jam_per_hari` decimal(10,1) NOT NULL DEFAULT 0.0,
+  `sum_frekuensi` int(11) NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='Jumlah/total penggunaan per gender, platform, tujuan; dijaga trigger';
+
+--
+-- Dumping data for table `ringkasan_penggunaan`
+--
+
+INSERT INTO `ringkasan_penggunaan` (`jenis_kelamin`, `id_platform`, `tujuan_penggunaan`, `jumlah_penggunaan`, `sum_jam_per_hari`, `sum_frekuensi`) VALUES
+('Laki-laki', 1, 'Informasi', 1, 2.0, 12),
+('Laki-laki', 1, 'Komunikasi', 9, 11.0, 64),
+('Laki-laki', 2, 'Hiburan', 1, 4.5, 35),
+('Laki-laki', 2, 'Informasi', 12, 31.5, 227),
+('Laki-laki', 2, 'Pekerjaan', 1, 2.0, 12),
+('Laki-laki', 3, 'Komunikasi', 14, 28.0, 167),
+('Laki-laki', 3, 'Pekerjaan', 1, 2.0, 12),
+('Laki-laki', 4, 'Hiburan', 14, 44.5, 169),
+('Laki-laki', 4, 'Informasi', 24, 41.0, 176),
+('Laki-laki', 4, 'Pekerjaan', 1, 1.0, 5),
+('Laki-laki', 5, 'Hiburan', 5, 29.0, 175),
+('Laki-laki', 5, 'Komunikasi', 3, 18.0, 115),
+('Laki-laki', 6, 'Informasi', 20, 48.5, 292),
+('Laki-laki', 7, 'Komunikasi', 1, 5.0, 40),
+('Laki-laki', 9, 'Hiburan', 6, 21.5, 171),
+('Perempuan', 1, 'Komunikasi', 29, 53.0, 380),
+('Perempuan', 2, 'Informasi', 4, 9.5, 95),
+('Perempuan', 3, 'Hiburan', 10, 47.5, 411),
+('Perempuan', 3, 'Komunikasi', 28, 72.5, 584),
+('Perempuan', 4, 'Hiburan', 5, 9.0, 45),
+('Perempuan', 4, 'Informasi', 19, 23.0, 109),
+('Perempuan', 7, 'Komunikasi', 6, 18.5, 181),
+('Perempuan', 8, 'Hiburan', 12, 29.5, 193),
+('Perempuan', 8, 'Informasi', 2, 5.5, 33),
+('Perempuan', 9, 'Hiburan', 20, 69.5, 645);
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `ringkasan_penggunaan_mental`
+--
+
+CREATE TABLE `ringkasan_penggunaan_mental` (
+  `jenis_kelamin` enum('Laki-laki','Perempuan') NOT NULL,
+  `jumlah_penggunaan` int(11) NOT NULL DEFAULT 0 COMMENT 'Baris penggunaan milik responden yang punya data kesehatan mental',
+  `sum_jam_per_hari` decimal(10,1) NOT NULL DEFAULT 0.0,
+  `sum_depresi` int(11) NOT NULL DEFAULT 0 COMMENT 'Depresi responden, dihitung sekali per baris penggunaan',
+  `sum_kecemasan` int(11) NOT NULL DEFAULT 0 COMMENT 'Kecemasan responden, dihitung sekali per baris penggunaan'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='Total baris penggunaan x kesehatan mental per gender; dijaga trigger';
+
+--
+-- Dumping data for table `ringkasan_penggunaan_mental`
+--
+
+INSERT INTO `ringkasan_penggunaan_mental` (`jenis_kelamin`, `jumlah_penggunaan`, `sum_jam_per_hari`, `sum_depresi`, `sum_kecemasan`) VALUES
+('Laki-laki', 113, 289.5, 251, 312),
+('Perempuan', 135, 337.5, 399, 444);
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `ringkasan_responden`
+--
+
+CREATE TABLE `ringkasan_responden` (
+  `jenis_kelamin` enum('Laki-laki','Perempuan') NOT NULL,
+  `status_hubungan` enum('Belum Kawin','Kawin','Cerai Hidup','Cerai Mati') NOT NULL,
+  `jumlah_responden` int(11) NOT NULL DEFAULT 0,
+  `jumlah_mental` int(11) NOT NULL DEFAULT 0 COMMENT 'Responden yang punya data kesehatan mental',
+  `sum_gangguan_fokus` int(11) NOT NULL DEFAULT 0,
+  `sum_gelisah` int(11) NOT NULL DEFAULT 0,
+  `sum_kecemasan` int(11) NOT NULL DEFAULT 0,
+  `sum_kesulitan_konsentrasi` int(11) NOT NULL DEFAULT 0,
+  `sum_perbandingan_diri` int(11) NOT NULL DEFAULT 0,
+  `sum_sentimen_posting` int(11) NOT NULL DEFAULT 0,
+  `sum_mencari_validasi` int(11) NOT NULL DEFAULT 0,
+  `sum_depresi` int(11) NOT NULL DEFAULT 0,
+  `sum_fluktuasi_minat` int(11) NOT NULL DEFAULT 0,
+  `sum_sulit_tidur` int(11) NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='Jumlah responden dan total skor kesehatan mental per gender dan status; dijaga trigger';
+
+--
+-- Dumping data for table `ringkasan_responden`
+--
+
+INSERT INTO `ringkasan_responden` (`jenis_kelamin`, `status_hubungan`, `jumlah_responden`, `jumlah_mental`, `sum_gangguan_fokus`, `sum_gelisah`, `sum_kecemasan`, `sum_kesulitan_konsentrasi`, `sum_perbandingan_diri`, `sum_sentimen_posting`, `sum_mencari_validasi`, `sum_depresi`, `sum_fluktuasi_minat`, `sum_sulit_tidur`) VALUES
+('Laki-laki', 'Belum Kawin', 26, 26, 70, 66, 78, 71, 58, 82, 58, 63, 70, 74),
+('Laki-laki', 'Cerai Hidup', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+('Laki-laki', 'Cerai Mati', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+('Laki-laki', 'Kawin', 21, 21, 33, 33, 41, 33, 25, 83, 25, 33, 33, 35),
+('Perempuan', 'Belum Kawin', 26, 26, 92, 89, 98, 88, 98, 61, 94, 87, 87, 93),
+('Perempuan', 'Cerai Hidup', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+('Perempuan', 'Cerai Mati', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+('Perempuan', 'Kawin', 27, 27, 46, 46, 54, 46, 45, 111, 45, 46, 46, 51);
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `versi_data`
+--
+
+CREATE TABLE `versi_data` (
+  `nama_tabel` varchar(64) NOT NULL,
+  `versi` bigint(20) UNSIGNED NOT NULL DEFAULT 0 COMMENT 'Dinaikkan trigger setiap INSERT/UPDATE/DELETE',
+  `versi_mutasi` bigint(20) UNSIGNED NOT NULL DEFAULT 0 COMMENT 'Dinaikkan trigger setiap UPDATE/DELETE (bukan INSERT)'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Dumping data for table `versi_data`
+--
+
+INSERT INTO `versi_data` (`nama_tabel`, `versi`, `versi_mutasi`) VALUES
+('kesehatan_mental', 0, 0),
+('master_platform', 0, 0),
+('penggunaan_per_platform', 0, 0),
+('responden', 0, 0);
+
 --
 -- Indexes for dumped tables
 --
@@ -606,6 +1063,31 @@ ALTER TABLE `responden`
   ADD KEY `idx_pekerjaan` (`pekerjaan`),
   ADD KEY `idx_usia` (`usia`);
 
+--
+-- Indexes for table `ringkasan_penggunaan`
+--
+ALTER TABLE `ringkasan_penggunaan`
+  ADD PRIMARY KEY (`jenis_kelamin`,`id_platform`,`tujuan_penggunaan`),
+  ADD KEY `idx_ringkasan_platform` (`id_platform`);
+
+--
+-- Indexes for table `ringkasan_penggunaan_mental`
+--
+ALTER TABLE `ringkasan_penggunaan_mental`
+  ADD PRIMARY KEY (`jenis_kelamin`);
+
+--
+-- Indexes for table `ringkasan_responden`
+--
+ALTER TABLE `ringkasan_responden`
+  ADD PRIMARY KEY (`jenis_kelamin`,`status_hubungan`);
+
+--
+-- Indexes for table `versi_data`
+--
+ALTER TABLE `versi_data`
+  ADD PRIMARY KEY (`nama_tabel`);
+
 --
 -- AUTO_INCREMENT for dumped tables
 --